@@ -0,0 +1,42 @@
+"""
+Admin API Routes
+----------------
+Defines operational endpoints for administrators.
+
+Routes:
+- /db-pool: Live connection pool state and checkout measurements of this worker process
+- /cache-stats: Size and hit/miss/eviction counters of the in-process caches of this worker
+
+Each route requires the admin role.
+"""
+
+from fastapi import APIRouter, Depends
+from common.permissions import admin_required
+from database.database import pool_stats
+from common.cache import cache_stats
+
+router = APIRouter()
+
+@router.get("/db-pool", dependencies=[Depends(admin_required)])
+async def db_pool():
+    """
+    Reports the connection pools of this worker: sizes, checked-out and overflow connections,
+    checkout wait histogram with p50/p95/p99, timeouts and connection ages.
+    Each worker process has its own pools, so the numbers are per worker.
+    
+    Returns:
+        Dictionary with one entry per engine ("sync", and "async" in async mode).
+    """
+    return {name: stats.snapshot() for name, stats in pool_stats.items()}
+
+@router.get("/cache-stats", dependencies=[Depends(admin_required)])
+async def get_cache_stats():
+    """
+    Reports the in-process caches of this worker (project, task, tool and user lists, user summaries,
+    token versions): size, limits, hit ratio and hit/miss/eviction/expiration/invalidation/load counters.
+    Use it to tune [CACHE] max_entries and the TTLs; the numbers are per worker.
+
+    Returns:
+        Dictionary with one entry per cache.
+    """
+    return cache_stats()
@@ -7,24 +7,27 @@ Routes:
 - /register: Register a new user
 - /login: Authenticate a user and return a token
 - /change-role/{user_id}: Change a user's role
-- /get-users: List all users
+- /get-users: List all users (cursor pagination via ?cursor=&limit=)
 - /users/{user_id}: Delete a user
 
 Each route delegates business logic to the auth_service module.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
+from typing import List, Optional, Union
 from schemas import user_schemas as schemas
-from database.database import get_db
+from database.database import get_db, run_db
 from models.user_model import User
 from common.utils import get_current_user 
 from services import auth_service
+from common.pagination import MAX_PAGE_SIZE
+from common import resource_versions
 
 router = APIRouter()
 
 @router.post("/register", response_model=schemas.UserOut)
-def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
+async def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
     """
     Registers a new user.
     
@@ -34,10 +37,10 @@ def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
     Returns:
         UserOut schema of the created user.
     """
-    return auth_service.register_user(db, user)
+    return await auth_service.register_user(db, user)
 
 @router.post("/login")
-def login(user: schemas.UserLogin, db: Session = Depends(get_db)):
+async def login(user: schemas.UserLogin, db: Session = Depends(get_db)):
     """
     Authenticates a user and returns a token.
     
@@ -47,10 +50,10 @@ def login(user: schemas.UserLogin, db: Session = Depends(get_db)):
     Returns:
         Authentication token and user info.
     """
-    return auth_service.login_user(db, user)
+    return await auth_service.login_user(db, user)
 
 @router.put("/change-role/{user_id}")
-def change_role(user_id: int, role: str, db: Session = Depends(get_db)):
+async def change_role(user_id: int, role: str, db: Session = Depends(get_db)):
     """
     Changes the role of a user.
     
@@ -61,22 +64,35 @@ def change_role(user_id: int, role: str, db: Session = Depends(get_db)):
     Returns:
         Updated user info.
     """
-    return auth_service.change_user_role(db, user_id, role)
+    return await run_db(db, auth_service.change_user_role, user_id, role)
 
-@router.get("/get-users", response_model=list[schemas.UserOut])
-def get_users(db: Session = Depends(get_db)):
+@router.get("/get-users", response_model=Union[schemas.UserPage, List[schemas.UserOut]])
+async def get_users(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db)
+):
     """
-    Retrieves a list of all users.
+    Retrieves a list of all users. Answers If-None-Match with 304 while the user list is unchanged.
     
     Args:
+        request: Incoming request (for If-None-Match).
+        response: Response receiving the ETag.
+        cursor: (Optional) Cursor returned with the previous page.
+        limit: (Optional) Page size; enables cursor pagination.
         db: Database session.
     Returns:
-        List of UserOut schemas.
+        List of UserOut schemas, a UserPage when paginating, or 304 Not Modified.
     """
-    return auth_service.get_all_users(db)
+    return await resource_versions.conditional_get(
+        db, request, response, resource_versions.USERS,
+        lambda version: auth_service.get_all_users_cached(db, version, cursor, limit)
+    )
 
 @router.delete("/users/{user_id}")
-def delete_user(user_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def delete_user(user_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     """
     Deletes a user by ID.
     
@@ -87,4 +103,4 @@ def delete_user(user_id: int, db: Session = Depends(get_db), current_user: User
     Returns:
         Result of the deletion operation.
     """
-    return auth_service.delete_user(db, user_id, current_user)
+    return await run_db(db, auth_service.delete_user, user_id, current_user)
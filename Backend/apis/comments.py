@@ -12,18 +12,21 @@ Routes:
 Each route delegates business logic to the comment_service module.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from database.database import get_db
+from typing import List, Optional, Union
+from database.database import get_db, run_db
 from common.utils import get_current_user
-from schemas.comment_schemas import CommentCreate, CommentOut
+from schemas.comment_schemas import CommentCreate, CommentOut, CommentPage
 from models.user_model import User
 from services import comment_service
+from common.pagination import MAX_PAGE_SIZE
+from common.fast_json import JSONBytesResponse
 
 router = APIRouter()
 
 @router.post("/task/{task_id}", response_model=CommentOut)
-def create_comment(task_id: int, comment: CommentCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def create_comment(task_id: int, comment: CommentCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     """
     Creates a new comment for a specific task.
     
@@ -35,25 +38,34 @@ def create_comment(task_id: int, comment: CommentCreate, db: Session = Depends(g
     Returns:
         The created CommentOut schema.
     """
-    return comment_service.create_comment(task_id, comment, db, current_user)
+    return await run_db(db, lambda session: comment_service.create_comment(task_id, comment, session, current_user))
 
 
-@router.get("/task/{task_id}", response_model=list[CommentOut])
-def get_comments(task_id: int, db: Session = Depends(get_db)):
+@router.get("/task/{task_id}", response_model=Union[CommentPage, List[CommentOut]])
+async def get_comments(
+    task_id: int,
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db)
+):
     """
     Retrieves all comments for a specific task.
     
     Args:
         task_id: ID of the task.
+        cursor: (Optional) Cursor returned with the previous page.
+        limit: (Optional) Page size; enables cursor pagination.
         db: Database session.
     Returns:
-        List of CommentOut schemas.
+        List of CommentOut schemas, or a CommentPage when paginating.
     """
-    return comment_service.get_comments_by_task(task_id, db)
+    return JSONBytesResponse(
+        await run_db(db, lambda session: comment_service.get_comments_by_task_json(task_id, session, cursor, limit))
+    )
 
 
 @router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_comment(comment_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def delete_comment(comment_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     """
     Deletes a comment by its ID.
     
@@ -64,11 +76,11 @@ def delete_comment(comment_id: int, db: Session = Depends(get_db), current_user:
     Returns:
         None (204 No Content)
     """
-    comment_service.delete_comment(comment_id, db, current_user)
+    await run_db(db, lambda session: comment_service.delete_comment(comment_id, session, current_user))
 
 
 @router.put("/comments/{comment_id}", response_model=CommentOut)
-def update_comment(comment_id: int, updated: CommentCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def update_comment(comment_id: int, updated: CommentCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     """
     Updates an existing comment.
     
@@ -80,4 +92,4 @@ def update_comment(comment_id: int, updated: CommentCreate, db: Session = Depend
     Returns:
         The updated CommentOut schema.
     """
-    return comment_service.update_comment(comment_id, updated, db, current_user)
+    return await run_db(db, lambda session: comment_service.update_comment(comment_id, updated, session, current_user))
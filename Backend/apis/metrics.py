@@ -0,0 +1,26 @@
+"""
+Metrics API Route
+-----------------
+Exposes the request metrics of all worker processes for Prometheus.
+
+Routes:
+- /metrics: Metrics in the Prometheus text exposition format
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from common import request_metrics
+
+router = APIRouter()
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """
+    Returns per-route request counts, status classes, latency histograms and in-flight gauges,
+    summed over all uvicorn workers.
+    
+    Returns:
+        PlainTextResponse in the Prometheus text format (version 0.0.4).
+    """
+    body = request_metrics.render()
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4; charset=utf-8")
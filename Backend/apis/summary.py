@@ -5,7 +5,8 @@ Defines endpoints for retrieving user and project summaries, and tasks by status
 
 Routes:
 - /user-summary: Get summary for the current user
-- /project-summary: Get summary for all projects (manager only)
+- /user-summaries: Get summaries for all users in one request (admin only)
+- /project-summary: Get summary for all projects (manager only), filterable by date window and open work
 - /tasks/{status}: Get tasks filtered by status and optionally by user
 
 Each route delegates business logic to the summary_service module.
@@ -14,15 +15,18 @@ Each route delegates business logic to the summary_service module.
 # routers/summary_routes.py
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import date
 from common.utils import get_current_user
-from database.database import get_db
-from common.permissions import manager_required
+from database.database import get_db, run_db
+from common.permissions import manager_required, admin_required
 from services import summary_service
+from common.pagination import MAX_PAGE_SIZE
 
 router = APIRouter()
 
 @router.get("/user-summary")
-def user_summary(db: Session = Depends(get_db), user=Depends(get_current_user)):
+async def user_summary(db: Session = Depends(get_db), user=Depends(get_current_user)):
     """
     Retrieves a summary for the current user.
     
@@ -32,25 +36,60 @@ def user_summary(db: Session = Depends(get_db), user=Depends(get_current_user)):
     Returns:
         User summary data.
     """
-    return summary_service.get_user_summary(db, user)
+    return await run_db(db, summary_service.get_user_summary, user)
+
+@router.get("/user-summaries")
+async def user_summaries(
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    user=Depends(admin_required)
+):
+    """
+    Retrieves summaries for all users in one pass (admin access required).
+    
+    Args:
+        cursor: (Optional) Cursor returned with the previous page.
+        limit: (Optional) Page size; enables cursor pagination.
+        db: Database session.
+        user: The current admin user.
+    Returns:
+        List of per-user summary data.
+    """
+    return await run_db(db, summary_service.get_all_user_summaries, cursor, limit)
 
 @router.get("/project-summary")
-def project_summary(db: Session = Depends(get_db), user=Depends(manager_required)):
+async def project_summary(
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    open_only: bool = Query(False),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    user=Depends(manager_required)
+):
     """
     Retrieves a summary for all projects (manager access required).
     
     Args:
+        start: (Optional) Only projects still running on or after this date.
+        end: (Optional) Only projects starting on or before this date.
+        open_only: Only projects that still have pending tasks.
+        cursor: (Optional) Cursor returned with the previous page.
+        limit: (Optional) Page size; enables cursor pagination.
         db: Database session.
         user: The current manager user.
     Returns:
         Project summary data.
     """
-    return summary_service.get_project_summary(db)
+    return await run_db(db, summary_service.get_project_summary, start, end, open_only, cursor, limit)
 
 @router.get("/tasks/{status}")
-def tasks_by_status(
+async def tasks_by_status(
     status: str, 
     user_id: int = Query(None), 
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db), 
     user=Depends(get_current_user)
 ):
@@ -60,9 +99,11 @@ def tasks_by_status(
     Args:
         status: Status to filter tasks by.
         user_id: (Optional) User ID to filter tasks for a specific user.
+        cursor: (Optional) Cursor returned with the previous page.
+        limit: (Optional) Page size; enables cursor pagination.
         db: Database session.
         user: The current authenticated user.
     Returns:
-        List of tasks matching the criteria.
+        List of tasks matching the criteria, or a page with "items" and "next_cursor".
     """
-    return summary_service.get_tasks_by_status(db, user, status, user_id)
+    return await run_db(db, summary_service.get_tasks_by_status, user, status, user_id, cursor, limit)
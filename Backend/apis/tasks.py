@@ -5,28 +5,34 @@ Defines endpoints for creating, retrieving, updating, and deleting tasks and pro
 
 Routes:
 - /create-tasks: Create a new task (manager only)
-- /{project_id}/tasks: Get all tasks for a project
+- /create-tasks/bulk: Create many tasks in one request (manager only)
+- /{project_id}/tasks: Get all tasks for a project (cursor pagination via ?cursor=&limit=)
 - /update-task/{task_id}: Update a task
+- /update-tasks/bulk: Apply one patch (e.g. a status transition) to many tasks (manager only)
 - /delete-task/{task_id}: Delete a task (manager only)
 - /create-projects: Create a new project (manager only)
+- /dashboard: Get projects with their tasks or task counts embedded
 
 Each route delegates business logic to the task_service module.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
-from schemas.task_schemas import TaskCreate, TaskUpdate, TaskOut
-from schemas.project_schemas import ProjectCreate, ProjectOut
+from typing import List, Optional, Union
+from schemas.task_schemas import TaskCreate, TaskUpdate, TaskOut, TaskPage, TaskBulkResult, TaskBulkUpdate, TaskBulkUpdateResult
+from schemas.project_schemas import ProjectCreate, ProjectOut, ProjectPage, ProjectDashboardOut, ProjectDashboardPage
 from schemas.attachment_schemas import AttachmentOut
-from database.database import get_db
+from database.database import get_db, run_db
 from services import task_service
 from common.permissions import manager_required
+from common.pagination import MAX_PAGE_SIZE
+from common import resource_versions
+from common.fast_json import JSONBytesResponse
 
 router = APIRouter()
 
 @router.post("/create-tasks", dependencies=[Depends(manager_required)], response_model=TaskOut)
-def create_task(task: TaskCreate, db: Session = Depends(get_db)):
+async def create_task(task: TaskCreate, db: Session = Depends(get_db)):
     """
     Creates a new task for a project (manager only).
     
@@ -36,26 +42,53 @@ def create_task(task: TaskCreate, db: Session = Depends(get_db)):
     Returns:
         The created TaskOut schema or error message.
     """
-    result, error = task_service.create_task(db, task)
+    result, error = await run_db(db, task_service.create_task, task)
     if error:
         raise HTTPException(status_code=400 if "Due date" in error else 404, detail=error)
     return result
 
-@router.get("/{project_id}/tasks", response_model=List[TaskOut])
-def get_tasks(project_id: int, db: Session = Depends(get_db)):
+@router.post("/create-tasks/bulk", dependencies=[Depends(manager_required)], response_model=TaskBulkResult)
+async def create_tasks_bulk(tasks: List[TaskCreate], atomic: bool = Query(False), db: Session = Depends(get_db)):
+    """
+    Creates many tasks in one transaction (manager only).
+    Invalid items are reported by their index; the valid ones are created unless atomic is set.
+
+    Args:
+        tasks: List of TaskCreate schemas (at most MAX_BULK_TASKS).
+        atomic: Create nothing if any item is invalid.
+        db: Database session.
+    Returns:
+        TaskBulkResult with the created tasks and the rejected items.
+    """
+    if len(tasks) > task_service.MAX_BULK_TASKS:
+        raise HTTPException(status_code=413, detail=f"At most {task_service.MAX_BULK_TASKS} tasks per request")
+    created, errors = await run_db(db, task_service.create_tasks_bulk, tasks, atomic)
+    if atomic and errors:
+        raise HTTPException(status_code=400, detail=errors)
+    return {"created": created, "errors": errors}
+
+@router.get("/{project_id}/tasks", response_model=Union[TaskPage, List[TaskOut]])
+async def get_tasks(
+    project_id: int,
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db)
+):
     """
     Retrieves all tasks for a specific project.
     
     Args:
         project_id: ID of the project.
+        cursor: (Optional) Cursor returned with the previous page.
+        limit: (Optional) Page size; enables cursor pagination.
         db: Database session.
     Returns:
-        List of TaskOut schemas.
+        List of TaskOut schemas, or a TaskPage when paginating.
     """
-    return task_service.get_tasks_by_project(db, project_id)
+    return JSONBytesResponse(await task_service.get_tasks_by_project_cached(db, project_id, cursor, limit))
 
 @router.put("/update-task/{task_id}", response_model=TaskOut)
-def update_task(task_id: int, task: TaskUpdate, db: Session = Depends(get_db)):
+async def update_task(task_id: int, task: TaskUpdate, db: Session = Depends(get_db)):
     """
     Updates an existing task.
     
@@ -66,13 +99,31 @@ def update_task(task_id: int, task: TaskUpdate, db: Session = Depends(get_db)):
     Returns:
         The updated TaskOut schema or error message.
     """
-    updated, error = task_service.update_task(db, task_id, task)
+    updated, error = await run_db(db, task_service.update_task, task_id, task)
     if error:
         raise HTTPException(status_code=404, detail=error)
     return updated
 
+@router.put("/update-tasks/bulk", dependencies=[Depends(manager_required)], response_model=TaskBulkUpdateResult)
+async def update_tasks_bulk(request: TaskBulkUpdate, db: Session = Depends(get_db)):
+    """
+    Applies one patch to every task selected by ids and/or filter (manager only).
+
+    Args:
+        request: TaskBulkUpdate schema with the selection and the patch.
+        db: Database session.
+    Returns:
+        TaskBulkUpdateResult with the number and IDs of the updated tasks.
+    """
+    if request.ids is not None and len(request.ids) > task_service.MAX_BULK_TASKS:
+        raise HTTPException(status_code=413, detail=f"At most {task_service.MAX_BULK_TASKS} task ids per request")
+    ids, error = await run_db(db, task_service.update_tasks_bulk, request)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+    return {"updated": len(ids), "ids": ids}
+
 @router.delete("/delete-task/{task_id}", dependencies=[Depends(manager_required)])
-def delete_task(task_id: int, db: Session = Depends(get_db)):
+async def delete_task(task_id: int, db: Session = Depends(get_db)):
     """
     Deletes a task by its ID (manager only).
     
@@ -82,13 +133,13 @@ def delete_task(task_id: int, db: Session = Depends(get_db)):
     Returns:
         Success message or error message.
     """
-    deleted, error = task_service.delete_task(db, task_id)
+    deleted, error = await run_db(db, task_service.delete_task, task_id)
     if error:
         raise HTTPException(status_code=404, detail=error)
     return {"message": "Task deleted successfully"}
 
 @router.post("/create-projects", dependencies=[Depends(manager_required)], response_model=ProjectOut)
-def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
+async def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
     """
     Creates a new project (manager only).
     
@@ -98,22 +149,57 @@ def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
     Returns:
         The created ProjectOut schema.
     """
-    return task_service.create_project(db, project)
+    return await run_db(db, task_service.create_project, project)
 
-@router.get("/get-projects", response_model=List[ProjectOut])
-def get_projects(db: Session = Depends(get_db)):
+@router.get("/get-projects", response_model=Union[ProjectPage, List[ProjectOut]])
+async def get_projects(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db)
+):
     """
-    Retrieves all projects.
+    Retrieves all projects. Answers If-None-Match with 304 while the project list is unchanged.
     
     Args:
+        request: Incoming request (for If-None-Match).
+        response: Response receiving the ETag.
+        cursor: (Optional) Cursor returned with the previous page.
+        limit: (Optional) Page size; enables cursor pagination.
         db: Database session.
     Returns:
-        List of ProjectOut schemas.
+        List of ProjectOut schemas, a ProjectPage when paginating, or 304 Not Modified.
     """
-    return task_service.get_all_projects(db)
+    return await resource_versions.conditional_get(
+        db, request, response, resource_versions.PROJECTS,
+        lambda version: task_service.get_all_projects_cached(db, version, cursor, limit)
+    )
+
+@router.get("/dashboard", response_model=Union[ProjectDashboardPage, List[ProjectDashboardOut]])
+async def get_dashboard(
+    include: str = Query("tasks"),
+    assigned_to: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db)
+):
+    """
+    Retrieves projects with their tasks ("include=tasks") or per-status task counts ("include=counts") embedded.
+    
+    Args:
+        include: "tasks" or "counts".
+        assigned_to: (Optional) Only projects and tasks assigned to this user.
+        cursor: (Optional) Cursor returned with the previous page.
+        limit: (Optional) Page size; enables cursor pagination over projects.
+        db: Database session.
+    Returns:
+        List of ProjectDashboardOut schemas, or a ProjectDashboardPage when paginating.
+    """
+    return await run_db(db, task_service.get_project_dashboard, include, assigned_to, cursor, limit)
 
 @router.delete("/delete-project/{project_id}", dependencies=[Depends(manager_required)])
-def delete_project(project_id: int, db: Session = Depends(get_db)):
+async def delete_project(project_id: int, db: Session = Depends(get_db)):
     """
     Deletes a project by its ID (manager only).
     
@@ -123,7 +209,7 @@ def delete_project(project_id: int, db: Session = Depends(get_db)):
     Returns:
         Success message or error message.
     """
-    deleted, error = task_service.delete_project(db, project_id)
+    deleted, error = await run_db(db, task_service.delete_project, project_id)
     if error:
         raise HTTPException(status_code=404, detail=error)
     return {"message": "Project has been deleted successfully"}
@@ -144,11 +230,14 @@ async def upload_attachment(
     Returns:
         The result of the upload operation.
     """
-    return await task_service.upload_attachment(db,task_id, file)
+    result, error = await task_service.upload_attachment(db, task_id, file)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+    return result
 
 
 @router.get("/tasks/{task_id}/attachments/", response_model=List[AttachmentOut])
-def get_attachments(task_id:int, db: Session = Depends(get_db)):
+async def get_attachments(task_id:int, db: Session = Depends(get_db)):
     """
     Retrieves all attachments for a task.
     
@@ -158,18 +247,20 @@ def get_attachments(task_id:int, db: Session = Depends(get_db)):
     Returns:
         List of AttachmentOut schemas.
     """
-    return task_service.get_attachments_by_task(task_id, db)
+    return await run_db(db, lambda session: task_service.get_attachments_by_task(task_id, session))
 
 
 @router.get("/attachments/download/{attachment_id}")
-def download_attachment(attachment_id: int, db: Session = Depends(get_db)):
+async def download_attachment(attachment_id: int, request: Request, db: Session = Depends(get_db)):
     """
     Downloads an attachment by its ID.
+    Supports Range requests (206) and conditional requests (ETag / Last-Modified, 304).
     
     Args:
         attachment_id: ID of the attachment.
+        request: The incoming request (for Range and conditional headers).
         db: Database session.
     Returns:
         The attachment file or error message.
     """
-    return task_service.download_attachment(attachment_id, db)
\ No newline at end of file
+    return await run_db(db, lambda session: task_service.download_attachment(attachment_id, session, request.headers))
\ No newline at end of file
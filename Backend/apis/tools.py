@@ -11,20 +11,21 @@ Routes:
 Each route delegates business logic to the tool_service module.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 from typing import List
 from schemas.tool_schemas import ToolCreate, ToolOut
 from schemas.task_schemas import TaskOut
-from database.database import get_db
+from database.database import get_db, run_db
 from common.utils import get_current_user
 from models.user_model import User
 from services import tool_service
+from common import resource_versions
 
 router = APIRouter()
 
 @router.post("/{project_id}/tools", response_model=ToolOut)
-def create_tool(
+async def create_tool(
     project_id: int,
     tool: ToolCreate,
     db: Session = Depends(get_db),
@@ -41,28 +42,35 @@ def create_tool(
     Returns:
         The created ToolOut schema.
     """
-    return tool_service.create_tool_for_project(db, project_id, tool, current_user)
+    return await run_db(db, tool_service.create_tool_for_project, project_id, tool, current_user)
 
 
 @router.get("/{project_id}/tools", response_model=List[ToolOut])
-def get_tools(
+async def get_tools(
     project_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
-    Retrieves all tools for a specific project.
+    Retrieves all tools for a specific project. Answers If-None-Match with 304 while the project's tools are unchanged.
     
     Args:
         project_id: ID of the project.
+        request: Incoming request (for If-None-Match).
+        response: Response receiving the ETag.
         db: Database session.
     Returns:
-        List of ToolOut schemas.
+        List of ToolOut schemas, or 304 Not Modified.
     """
-    return tool_service.get_tools_by_project(db, project_id)
+    return await resource_versions.conditional_get(
+        db, request, response, resource_versions.tools_resource(project_id),
+        lambda version: tool_service.get_tools_by_project_cached(db, project_id, version)
+    )
 
 
 @router.delete("/tools/{tool_id}")
-def delete_tool(
+async def delete_tool(
     tool_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -77,12 +85,12 @@ def delete_tool(
     Returns:
         Result of the deletion operation.
     """
-    tool_service.delete_tool_by_id(db, tool_id, current_user)
+    await run_db(db, tool_service.delete_tool_by_id, tool_id, current_user)
     return {"detail": "Tool deleted successfully"}
 
 
 @router.get("/{project_id}/tools/{tool_id}/tasks", response_model=List[TaskOut])
-def get_tasks_by_tool(
+async def get_tasks_by_tool(
     project_id: int,
     tool_id: int,
     db: Session = Depends(get_db)
@@ -97,4 +105,4 @@ def get_tasks_by_tool(
     Returns:
         List of TaskOut schemas related to the tool.
     """
-    return tool_service.get_tasks_by_tool(db, project_id, tool_id)
+    return await run_db(db, tool_service.get_tasks_by_tool, project_id, tool_id)
@@ -0,0 +1,125 @@
+"""
+Benchmark Command Line
+----------------------
+Entry point for generating benchmark data and running load tests.
+
+Usage (from the Backend folder):
+    python -m bench seed --tasks 100000 [--seed 42] [--manifest bench_manifest.json]
+    python -m bench load [--base-url http://127.0.0.1:8000 | --spawn] [--concurrency 8] [--duration 60]
+                         [--manifest bench_manifest.json] [--report bench_report.json]
+    python -m bench compare baseline.json candidate.json
+    python -m bench serialize [--rows 1000 10000 100000] [--repeat 3] [--report bench_serialization.json]
+
+seed fills the database configured in config.ini (use a dedicated benchmark database);
+load replays the frontend page loads and writes a JSON report; compare prints the changes between two reports;
+serialize times the ORM/Pydantic and the column-tuple encoding of task lists on a temporary SQLite database.
+"""
+
+import argparse
+import json
+import sys
+from datetime import date
+
+
+def _parse_mix(value: str) -> dict:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m bench", description="Benchmark data generation and load testing.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = commands.add_parser("seed", help="Fill the configured database with a synthetic dataset")
+    seed_parser.add_argument("--tasks", type=int, default=10000, help="Number of tasks (other tables scale with it)")
+    seed_parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    seed_parser.add_argument("--comments-per-task", type=float, default=2.0, help="Average comments per task")
+    seed_parser.add_argument("--attachment-ratio", type=float, default=0.1, help="Share of tasks with an attachment")
+    seed_parser.add_argument("--batch-size", type=int, default=5000, help="Rows per INSERT and transaction")
+    seed_parser.add_argument("--anchor", type=date.fromisoformat, default=None, help="Reference date YYYY-MM-DD (default today)")
+    seed_parser.add_argument("--manifest", default="bench_manifest.json", help="Where to write the manifest")
+
+    load_parser = commands.add_parser("load", help="Replay frontend page loads and write a report")
+    load_parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="Backend address")
+    load_parser.add_argument("--spawn", action="store_true", help="Start the app with uvicorn on the --base-url port")
+    load_parser.add_argument("--workers", type=int, default=1, help="uvicorn workers with --spawn")
+    load_parser.add_argument("--manifest", default="bench_manifest.json", help="Manifest written by seed")
+    load_parser.add_argument("--concurrency", type=int, default=8, help="Virtual users")
+    load_parser.add_argument("--duration", type=float, default=60, help="Measured seconds")
+    load_parser.add_argument("--warmup", type=float, default=5, help="Seconds before measuring")
+    load_parser.add_argument("--mix", type=_parse_mix, default=None, help="Scenario weights, e.g. dashboard=5,task_details=3,manager_dashboard=2")
+    load_parser.add_argument("--seed", type=int, default=1, help="Seed of the scenario choices")
+    load_parser.add_argument("--report", default="bench_report.json", help="Where to write the JSON report")
+
+    compare_parser = commands.add_parser("compare", help="Compare two load reports")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+
+    serialize_parser = commands.add_parser("serialize", help="Time list serialization paths at several sizes")
+    serialize_parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000], help="Task counts")
+    serialize_parser.add_argument("--repeat", type=int, default=3, help="Runs per path and size (best counts)")
+    serialize_parser.add_argument("--report", default=None, help="Also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    if args.command == "seed":
+        from bench.generator import Scale, generate, write_manifest
+        scale = Scale.from_tasks(args.tasks, args.comments_per_task, args.attachment_ratio)
+        try:
+            manifest = generate(scale, args.seed, args.batch_size, args.anchor)
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            return 1
+        write_manifest(manifest, args.manifest)
+        print(f"Manifest written to {args.manifest}")
+
+    elif args.command == "load":
+        from urllib.parse import urlsplit
+        from bench.load_driver import run_load, spawn_app, SCENARIOS
+        if args.mix and not set(args.mix) <= set(SCENARIOS):
+            print(f"Unknown scenarios: {', '.join(set(args.mix) - set(SCENARIOS))}", file=sys.stderr)
+            return 1
+        with open(args.manifest) as manifest_file:
+            manifest = json.load(manifest_file)
+        server = spawn_app(urlsplit(args.base_url).port or 8000, args.workers) if args.spawn else None
+        try:
+            report = run_load(args.base_url, manifest, args.concurrency, args.duration, args.warmup, args.mix, args.seed)
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+        with open(args.report, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+        print(f"{'ENDPOINT':<45}{'REQ':>8}{'ERR':>6}{'RPS':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        for label, stats in [*report["endpoints"].items(), ("TOTAL", report["totals"])]:
+            print(f"{label:<45}{stats['requests']:>8}{stats['errors']:>6}{stats['throughput_rps']:>9}"
+                  f"{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}")
+        print(f"Report written to {args.report}")
+
+    elif args.command == "compare":
+        from bench.load_driver import compare_reports
+        with open(args.baseline) as baseline_file, open(args.candidate) as candidate_file:
+            rows = compare_reports(json.load(baseline_file), json.load(candidate_file))
+        print(f"{'ENDPOINT':<45}{'METRIC':<16}{'BASELINE':>11}{'CANDIDATE':>11}{'CHANGE':>9}")
+        for label, metric, old, new, change in rows:
+            print(f"{label:<45}{metric:<16}{old:>11}{new:>11}{'' if change is None else f'{change:+.1f}%':>9}")
+
+    elif args.command == "serialize":
+        from bench.serialization import run_serialization
+        report = run_serialization(args.rows, args.repeat)
+        print(f"Encoder: {report['encoder']}, best of {report['repeat']}")
+        print(f"{'ROWS':>8}{'ORM+PYDANTIC ms':>17}{'COLUMNS ms':>12}{'SPEEDUP':>9}{'COLUMNS rows/s':>16}{'SAME BODY':>11}")
+        for size, result in report["sizes"].items():
+            print(f"{size:>8}{result['orm_pydantic']['ms']:>17}{result['columns_fast']['ms']:>12}"
+                  f"{result['speedup']:>8}x{result['columns_fast']['rows_per_s']:>16}{str(result['same_body']):>11}")
+        if args.report:
+            with open(args.report, "w") as report_file:
+                json.dump(report, report_file, indent=2)
+            print(f"Report written to {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
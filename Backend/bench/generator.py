@@ -0,0 +1,280 @@
+"""
+Synthetic Data Generator
+------------------------
+Fills the configured database with a reproducible benchmark dataset.
+
+Features:
+- Seeded: the same --seed and --tasks produce the same rows (dates are relative to --anchor, today by default)
+- Scales from 1k to 1M tasks; users, projects, tools, comments and attachments are derived from the task count
+- Multi-row INSERTs in batches (ids come back through RETURNING), one transaction per batch,
+  so memory stays bounded by the batch size
+- Attachments reference a small set of payloads in the blob store (content addressing stores each once)
+- Writes a manifest (credentials and sampled ids) that the load driver replays against
+
+Functions:
+- Scale.from_tasks: Derives the row counts of every table from the number of tasks
+- generate: Creates the dataset and returns the manifest
+- write_manifest: Saves the manifest for the load driver
+"""
+
+import json
+import random
+import time
+from dataclasses import dataclass, asdict
+from datetime import date, datetime, timedelta
+from typing import Optional
+from sqlalchemy import insert, select, text
+from database.database import Base, engine, SessionLocal
+from migrations import runner as migrations
+from models.user_model import User
+from models.project_model import Project
+from models.tool_model import Tool
+from models.task_model import Task
+from models.comment_model import Comment
+from models.attachment_model import Attachment
+from storage.blob_store import get_blob_store
+from common import hashing
+
+# Password of every generated user (hashed once, the hash is shared).
+PASSWORD = "Bench123*"
+STATUSES = ("pending", "in_progress", "completed")
+STATUS_WEIGHTS = (0.35, 0.25, 0.40)
+PAYLOAD_SIZES = (4 * 1024, 16 * 1024, 64 * 1024, 256 * 1024)
+CONTENT_TYPES = (("message/rfc822", ".eml"), ("application/pdf", ".pdf"), ("image/png", ".png"), ("text/plain", ".txt"))
+WORDS = (
+    "update", "review", "deploy", "design", "client", "report", "invoice", "backend", "frontend",
+    "meeting", "budget", "release", "testing", "migration", "schema", "audit", "draft", "final",
+)
+# Number of ids of each kind kept in the manifest for the load driver.
+SAMPLE_SIZE = 200
+
+
+@dataclass
+class Scale:
+    """
+    Row counts of a generated dataset.
+
+    Attributes:
+        tasks (int): Tasks to create.
+        users (int): Users (about 1 per 100 tasks, at least 20; 10% managers).
+        projects (int): Projects (about 1 per 200 tasks, at least 5).
+        tools_per_project (int): Tools created for every project.
+        comments_per_task (float): Average comments per task.
+        attachment_ratio (float): Share of tasks with one attachment.
+    """
+    tasks: int
+    users: int
+    projects: int
+    tools_per_project: int = 3
+    comments_per_task: float = 2.0
+    attachment_ratio: float = 0.1
+
+    @classmethod
+    def from_tasks(cls, tasks: int, comments_per_task: float = 2.0, attachment_ratio: float = 0.1) -> "Scale":
+        return cls(
+            tasks=tasks,
+            users=max(20, tasks // 100),
+            projects=max(5, tasks // 200),
+            comments_per_task=comments_per_task,
+            attachment_ratio=attachment_ratio,
+        )
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _insert_returning_ids(db, model, rows: list) -> list:
+    return db.scalars(insert(model).returning(model.id, sort_by_parameter_order=True), rows).all()
+
+
+def _create_payloads(rng: random.Random) -> list:
+    """
+    Stores one payload per size in the blob store.
+
+    Returns:
+        list: (sha256, size) of each payload.
+    """
+    store = get_blob_store()
+    return [store.put(rng.randbytes(size)) for size in PAYLOAD_SIZES]
+
+
+def _log(label: str, count: int, started: float):
+    elapsed = time.perf_counter() - started
+    print(f"{label:<12}{count:>10} rows in {elapsed:7.1f}s ({count / max(elapsed, 1e-9):,.0f} rows/s)")
+
+
+def generate(scale: Scale, seed: int = 42, batch_size: int = 5000, anchor: Optional[date] = None) -> dict:
+    """
+    Creates the benchmark dataset in the configured database.
+
+    Args:
+        scale (Scale): Row counts.
+        seed (int): Random seed; equal seeds give equal datasets.
+        batch_size (int): Rows per INSERT statement and transaction.
+        anchor (date, optional): Reference date for all generated dates (default: today).
+
+    Variables:
+        user_ids, member_ids, manager_ids: Ids of the created users.
+        projects: (id, start_date, due_date) of the created projects.
+        tools: Project id -> tool ids.
+        sample_tasks: Reservoir sample of (project_id, task_id) pairs for the manifest.
+    Returns:
+        dict: Manifest with the password, sampled users/projects/tasks and the scale.
+    Raises:
+        ValueError: If a dataset with this seed was already generated in the database.
+    """
+    rng = random.Random(seed)
+    anchor = anchor or date.today()
+    Base.metadata.create_all(bind=engine)
+    migrations.upgrade(engine)
+    db = SessionLocal()
+    try:
+        if db.scalar(select(User.id).where(User.email == f"bench-{seed}-0@example.com")) is not None:
+            raise ValueError(f"A dataset with seed {seed} already exists; use an empty database or another seed")
+        started = time.perf_counter()
+        try:
+            password_hash = hashing.hash_password(PASSWORD)
+        finally:
+            hashing.shutdown()
+        user_rows = [
+            {
+                "username": f"bench-{seed}-{index}",
+                "email": f"bench-{seed}-{index}@example.com",
+                "hashed_password": password_hash,
+                "role": "manager" if index % 10 == 0 else "member",
+            }
+            for index in range(scale.users)
+        ]
+        user_ids = []
+        for offset in range(0, len(user_rows), batch_size):
+            user_ids += _insert_returning_ids(db, User, user_rows[offset:offset + batch_size])
+            db.commit()
+        emails = {user_id: row["email"] for user_id, row in zip(user_ids, user_rows)}
+        member_ids = [user_id for user_id, row in zip(user_ids, user_rows) if row["role"] == "member"]
+        manager_ids = [user_id for user_id, row in zip(user_ids, user_rows) if row["role"] == "manager"]
+        _log("users", len(user_ids), started)
+
+        started = time.perf_counter()
+        projects = []
+        for offset in range(0, scale.projects, batch_size):
+            rows = []
+            for index in range(offset, min(offset + batch_size, scale.projects)):
+                start_date = anchor - timedelta(days=rng.randint(0, 365))
+                rows.append({
+                    "title": f"{_sentence(rng, 2).title()} {index}",
+                    "description": _sentence(rng, 12),
+                    "start_date": start_date,
+                    "due_date": start_date + timedelta(days=rng.randint(30, 400)),
+                })
+            ids = _insert_returning_ids(db, Project, rows)
+            db.commit()
+            projects += [(project_id, row["start_date"], row["due_date"]) for project_id, row in zip(ids, rows)]
+        _log("projects", len(projects), started)
+
+        started = time.perf_counter()
+        tools = {}
+        tool_rows = [
+            {"name": f"{rng.choice(WORDS)}-tool-{number}", "project_id": project_id}
+            for project_id, _, _ in projects
+            for number in range(scale.tools_per_project)
+        ]
+        for offset in range(0, len(tool_rows), batch_size):
+            batch = tool_rows[offset:offset + batch_size]
+            for tool_id, row in zip(_insert_returning_ids(db, Tool, batch), batch):
+                tools.setdefault(row["project_id"], []).append(tool_id)
+            db.commit()
+        _log("tools", len(tool_rows), started)
+
+        payloads = _create_payloads(rng)
+        started = time.perf_counter()
+        sample_tasks = []
+        comments = attachments = created = 0
+        while created < scale.tasks:
+            rows = []
+            for _ in range(min(batch_size, scale.tasks - created)):
+                project_id, project_start, project_due = rng.choice(projects)
+                span = max((project_due - project_start).days, 1)
+                start_date = project_start + timedelta(days=rng.randint(0, span - 1))
+                rows.append({
+                    "title": _sentence(rng, 3).capitalize(),
+                    "description": _sentence(rng, 20),
+                    "status": rng.choices(STATUSES, STATUS_WEIGHTS)[0],
+                    "start_date": start_date,
+                    "due_date": start_date + timedelta(days=rng.randint(1, 60)),
+                    "assigned_to": rng.choice(user_ids),
+                    "project_id": project_id,
+                    "tool_id": rng.choice(tools[project_id]) if project_id in tools and rng.random() < 0.7 else None,
+                    "due_date_edited": False,
+                })
+            task_ids = _insert_returning_ids(db, Task, rows)
+
+            comment_rows = []
+            attachment_rows = []
+            for task_id, row in zip(task_ids, rows):
+                created += 1
+                # reservoir sampling keeps a uniform sample without holding every id
+                if len(sample_tasks) < SAMPLE_SIZE:
+                    sample_tasks.append((row["project_id"], task_id))
+                elif rng.random() < SAMPLE_SIZE / created:
+                    sample_tasks[rng.randrange(SAMPLE_SIZE)] = (row["project_id"], task_id)
+                for _ in range(int(rng.expovariate(1 / scale.comments_per_task)) if scale.comments_per_task else 0):
+                    comment_rows.append({
+                        "content": _sentence(rng, rng.randint(3, 30)),
+                        "created_at": datetime.combine(row["start_date"], datetime.min.time()) + timedelta(minutes=rng.randint(0, 60 * 24 * 30)),
+                        "user_id": rng.choice(user_ids),
+                        "task_id": task_id,
+                    })
+                if rng.random() < scale.attachment_ratio:
+                    sha256, size = rng.choice(payloads)
+                    content_type, extension = rng.choice(CONTENT_TYPES)
+                    attachment_rows.append({
+                        "task_id": task_id,
+                        "filename": f"{rng.choice(WORDS)}-{task_id}{extension}",
+                        "sha256": sha256,
+                        "size_bytes": size,
+                        "content_type": content_type,
+                    })
+            if comment_rows:
+                db.execute(insert(Comment), comment_rows)
+            if attachment_rows:
+                db.execute(insert(Attachment), attachment_rows)
+            db.commit()
+            comments += len(comment_rows)
+            attachments += len(attachment_rows)
+            print(f"  {created}/{scale.tasks} tasks", end="\r", flush=True)
+        print()
+        _log("tasks", created, started)
+        print(f"{'comments':<12}{comments:>10} rows")
+        print(f"{'attachments':<12}{attachments:>10} rows")
+    finally:
+        db.close()
+
+    if engine.dialect.name == "postgresql":
+        # fresh statistics, so the benchmark sees the plans production would use
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("ANALYZE"))
+
+    return {
+        "seed": seed,
+        "anchor": anchor.isoformat(),
+        "scale": asdict(scale),
+        "password": PASSWORD,
+        "members": [emails[user_id] for user_id in rng.sample(member_ids, min(SAMPLE_SIZE, len(member_ids)))],
+        "managers": [emails[user_id] for user_id in rng.sample(manager_ids, min(SAMPLE_SIZE, len(manager_ids)))],
+        "projects": [project_id for project_id, _, _ in rng.sample(projects, min(SAMPLE_SIZE, len(projects)))],
+        "tasks": sample_tasks,
+        "rows": {"comments": comments, "attachments": attachments},
+    }
+
+
+def write_manifest(manifest: dict, path: str):
+    """
+    Saves a manifest returned by generate() as JSON.
+
+    Args:
+        manifest (dict): The manifest.
+        path (str): Output file.
+    """
+    with open(path, "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
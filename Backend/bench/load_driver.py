@@ -0,0 +1,313 @@
+"""
+Load Driver
+-----------
+Replays the frontend's page loads against a running backend and reports per-endpoint latency.
+
+Features:
+- Scenarios mirror the requests the React pages send:
+  dashboard (Dashboard + Stats pages of a member), task_details (TaskDetails page) and
+  manager_dashboard (ManagerDashboard + Stats pages of a manager)
+- Closed-loop virtual users (one thread and one keep-alive connection each), logged in once
+  with the accounts of a generator manifest; scenarios are picked by a seeded weighted mix
+- Warm-up period excluded from the results
+- Optionally starts the app itself (uvicorn on a local port) and stops it afterwards
+- JSON report: throughput, error count and latency percentiles per endpoint template and per scenario
+
+Functions:
+- run_load: Runs the virtual users and returns the report
+- spawn_app: Starts a local uvicorn process and waits until it answers
+- compare_reports: Lists the differences between two reports
+"""
+
+import base64
+import http.client
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import urlsplit, urlencode
+
+# Share of the iterations each scenario gets by default.
+DEFAULT_MIX = {"dashboard": 0.5, "task_details": 0.35, "manager_dashboard": 0.15}
+
+
+def _dashboard(user, rng, manifest):
+    return [
+        ("GET /project/get-projects", "/project/get-projects"),
+        ("GET /project/dashboard", "/project/dashboard?" + urlencode({"include": "counts", "assigned_to": user["user_id"]})),
+        ("GET /summary/user-summary", "/summary/user-summary"),
+        ("GET /summary/tasks/{status}", "/summary/tasks/assigned_tasks"),
+    ]
+
+
+def _task_details(user, rng, manifest):
+    project_id, task_id = rng.choice(manifest["tasks"])
+    return [
+        ("GET /project/{project_id}/tasks", f"/project/{project_id}/tasks"),
+        ("GET /comment/task/{task_id}", f"/comment/task/{task_id}"),
+        ("GET /auth/get-users", "/auth/get-users"),
+        ("GET /project/tasks/{task_id}/attachments/", f"/project/tasks/{task_id}/attachments/"),
+        ("GET /tool/{project_id}/tools", f"/tool/{project_id}/tools"),
+    ]
+
+
+def _manager_dashboard(user, rng, manifest):
+    return [
+        ("GET /project/get-projects", "/project/get-projects"),
+        ("GET /project/dashboard", "/project/dashboard?include=counts"),
+        ("GET /summary/user-summary", "/summary/user-summary"),
+    ]
+
+
+# scenario -> (account kind in the manifest, steps builder)
+SCENARIOS = {
+    "dashboard": ("members", _dashboard),
+    "task_details": ("members", _task_details),
+    "manager_dashboard": ("managers", _manager_dashboard),
+}
+
+
+def _percentile(ordered: list, q: float) -> float:
+    if not ordered:
+        return 0.0
+    # nearest rank
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def _summarize(latencies: list, errors: int, seconds: float) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "throughput_rps": round(len(ordered) / seconds, 2) if seconds else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+        "p50_ms": round(_percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(_percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(_percentile(ordered, 0.99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+    }
+
+
+class _VirtualUser(threading.Thread):
+    """
+    One closed-loop client: logs in, then runs scenarios back to back until stopped.
+    """
+
+    def __init__(self, index: int, base_url: str, manifest: dict, mix: dict, seed: int, clock: dict):
+        super().__init__(name=f"vu-{index}", daemon=True)
+        self.rng = random.Random(seed * 1000 + index)
+        self.manifest = manifest
+        self.mix = mix
+        self.clock = clock
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.connection = None
+        self.accounts = {}
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.scenario_latencies = defaultdict(list)
+        self.scenario_errors = defaultdict(int)
+        self.failure = None
+
+    def _request(self, method: str, path: str, body: Optional[dict] = None, token: Optional[str] = None):
+        headers = {"Accept": "application/json"}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        for attempt in (1, 2):
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection(self.host, self.port, timeout=60)
+            try:
+                self.connection.request(method, path, payload, headers)
+                response = self.connection.getresponse()
+                return response.status, response.read()
+            except (http.client.HTTPException, OSError):
+                # server closed the keep-alive connection; reconnect once
+                self.connection.close()
+                self.connection = None
+                if attempt == 2:
+                    raise
+
+    def _login(self, kind: str) -> dict:
+        account = self.accounts.get(kind)
+        if account is None:
+            email = self.rng.choice(self.manifest[kind])
+            status, body = self._request("POST", "/auth/login", {"email": email, "password": self.manifest["password"]})
+            if status != 200:
+                raise RuntimeError(f"Login of {email} failed with status {status}")
+            token = json.loads(body)["access_token"]
+            claims = json.loads(base64.urlsafe_b64decode(token.split(".")[1] + "=="))
+            account = self.accounts[kind] = {"token": token, "user_id": claims["user_id"]}
+        return account
+
+    def run(self):
+        names = list(self.mix)
+        weights = [self.mix[name] for name in names]
+        try:
+            while not self.clock["stop"]:
+                name = self.rng.choices(names, weights)[0]
+                kind, build_steps = SCENARIOS[name]
+                account = self._login(kind)
+                scenario_start = time.perf_counter()
+                failed = False
+                for label, path in build_steps(account, self.rng, self.manifest):
+                    start = time.perf_counter()
+                    status, _ = self._request("GET", path, token=account["token"])
+                    elapsed = time.perf_counter() - start
+                    if not self.clock["measuring"]:
+                        continue
+                    self.latencies[label].append(elapsed)
+                    if status >= 400:
+                        self.errors[label] += 1
+                        failed = True
+                if self.clock["measuring"]:
+                    self.scenario_latencies[name].append(time.perf_counter() - scenario_start)
+                    if failed:
+                        self.scenario_errors[name] += 1
+        except Exception as error:
+            self.failure = error
+        finally:
+            if self.connection is not None:
+                self.connection.close()
+
+
+def run_load(base_url: str, manifest: dict, concurrency: int = 8, duration: float = 60, warmup: float = 5,
+             mix: Optional[dict] = None, seed: int = 1) -> dict:
+    """
+    Runs the virtual users against a backend and collects the results.
+
+    Args:
+        base_url (str): Backend address, e.g. http://127.0.0.1:8000.
+        manifest (dict): Manifest written by the generator (accounts and sampled ids).
+        concurrency (int): Number of virtual users.
+        duration (float): Measured seconds.
+        warmup (float): Seconds run before measuring starts.
+        mix (dict, optional): Scenario name -> weight (default DEFAULT_MIX).
+        seed (int): Seed of the scenario and id choices.
+
+    Variables:
+        clock: Shared flags telling the users whether to measure and when to stop.
+    Returns:
+        dict: Report with run metadata, totals, per-endpoint and per-scenario statistics.
+    Raises:
+        RuntimeError: If every virtual user failed (e.g. the backend is not reachable).
+    """
+    mix = mix or DEFAULT_MIX
+    clock = {"measuring": False, "stop": False}
+    users = [_VirtualUser(index, base_url, manifest, mix, seed, clock) for index in range(concurrency)]
+    for user in users:
+        user.start()
+    time.sleep(warmup)
+    clock["measuring"] = True
+    started_at = datetime.now(timezone.utc)
+    measure_start = time.perf_counter()
+    time.sleep(duration)
+    clock["measuring"] = False
+    measured = time.perf_counter() - measure_start
+    clock["stop"] = True
+    for user in users:
+        user.join()
+    failures = [user.failure for user in users if user.failure is not None]
+    if len(failures) == len(users):
+        raise RuntimeError(f"All virtual users failed: {failures[0]}")
+
+    latencies, errors = defaultdict(list), defaultdict(int)
+    scenario_latencies, scenario_errors = defaultdict(list), defaultdict(int)
+    for user in users:
+        for label, values in user.latencies.items():
+            latencies[label] += values
+            errors[label] += user.errors[label]
+        for name, values in user.scenario_latencies.items():
+            scenario_latencies[name] += values
+            scenario_errors[name] += user.scenario_errors[name]
+
+    return {
+        "meta": {
+            "started_at": started_at.isoformat(),
+            "base_url": base_url,
+            "concurrency": concurrency,
+            "duration_s": round(measured, 3),
+            "warmup_s": warmup,
+            "seed": seed,
+            "mix": mix,
+            "dataset": {"seed": manifest.get("seed"), "scale": manifest.get("scale")},
+            "failed_users": [str(failure) for failure in failures],
+            "python": platform.python_version(),
+            "host": platform.node(),
+        },
+        "totals": _summarize([value for values in latencies.values() for value in values], sum(errors.values()), measured),
+        "endpoints": {label: _summarize(values, errors[label], measured) for label, values in sorted(latencies.items())},
+        "scenarios": {name: _summarize(values, scenario_errors[name], measured) for name, values in sorted(scenario_latencies.items())},
+    }
+
+
+def spawn_app(port: int, workers: int = 1, timeout: float = 60) -> subprocess.Popen:
+    """
+    Starts the backend with uvicorn on 127.0.0.1 and waits until it serves requests.
+    Must be called from the Backend folder (uvicorn loads main:app from there).
+
+    Args:
+        port (int): Local port.
+        workers (int): uvicorn worker processes.
+        timeout (float): Seconds to wait for the app.
+    Returns:
+        subprocess.Popen: The server process (terminate it when done).
+    Raises:
+        RuntimeError: If the app does not answer in time or exits early.
+    """
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        stdout=subprocess.DEVNULL,
+        cwd=os.getcwd(),
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {process.returncode}")
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            connection.request("GET", "/openapi.json")
+            if connection.getresponse().status == 200:
+                connection.close()
+                return process
+        except OSError:
+            time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError(f"App did not answer on port {port} within {timeout}s")
+
+
+def compare_reports(baseline: dict, candidate: dict) -> list:
+    """
+    Compares two reports endpoint by endpoint.
+
+    Args:
+        baseline (dict): Report of the reference run.
+        candidate (dict): Report of the new run.
+    Returns:
+        list: (endpoint, metric, baseline value, candidate value, change in percent) for
+              throughput_rps, p50_ms, p95_ms and p99_ms; change is None when the baseline is 0.
+    """
+    rows = []
+    sections = [("TOTAL", baseline["totals"], candidate["totals"])]
+    sections += [
+        (label, stats, candidate["endpoints"][label])
+        for label, stats in baseline["endpoints"].items()
+        if label in candidate["endpoints"]
+    ]
+    for label, old, new in sections:
+        for metric in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms"):
+            change = (new[metric] - old[metric]) / old[metric] * 100 if old[metric] else None
+            rows.append((label, metric, old[metric], new[metric], change))
+    return rows
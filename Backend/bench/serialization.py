@@ -0,0 +1,149 @@
+"""
+Serialization Benchmark
+-----------------------
+Measures how long a task list response takes to build, from query to JSON bytes,
+with the ORM/Pydantic path and with the column-tuple fast path.
+
+Features:
+- Self-contained: fills a temporary SQLite database, so it runs without the configured Postgres;
+  it imports the models and schemas only, never the app's engines in database/database.py
+- orm_pydantic: loads Task objects, validates them into TaskOut and encodes them the way
+  FastAPI does for a response_model (validate, dump to JSON-compatible data, json.dumps)
+- columns_fast: the query of task_service.get_tasks_by_project (TaskOut columns as row tuples)
+  encoded with common.fast_json.encode_rows (orjson, or json when it is missing)
+- Both bodies are compared after decoding, so a speed-up never hides a changed response shape
+- Best of --repeat runs per size, reported in milliseconds and rows per second
+
+Functions:
+- run_serialization: Runs both paths for each size and returns the results
+"""
+
+import json
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import List
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from database.base import Base
+from models.user_model import User
+from models.project_model import Project
+from models.task_model import Task
+# the remaining models are needed by create_all and by the Task relationships
+from models.tool_model import Tool
+from models.comment_model import Comment
+from models.attachment_model import Attachment
+from schemas.task_schemas import TaskOut
+from common import fast_json
+
+# The columns task_service.get_tasks_by_project selects (services import the app's engine).
+TASK_COLUMNS = fast_json.columns_for(TaskOut, Task)
+
+BATCH_SIZE = 10000
+
+
+def _populate(engine, sizes: list) -> dict:
+    """
+    Creates one project per size holding that many tasks.
+
+    Returns:
+        dict: Size -> project id.
+    """
+    Base.metadata.create_all(bind=engine)
+    start = date(2030, 1, 1)
+    projects = {}
+    with Session(engine) as db:
+        user_id = db.scalar(insert(User).returning(User.id), [
+            {"username": "bench", "email": "bench@example.com", "hashed_password": "-", "role": "member"}
+        ])
+        for size in sizes:
+            projects[size] = db.scalar(insert(Project).returning(Project.id), [
+                {"title": f"Bench {size}", "description": "Serialization benchmark", "start_date": start, "due_date": start + timedelta(days=365)}
+            ])
+            for offset in range(0, size, BATCH_SIZE):
+                db.execute(insert(Task), [
+                    {
+                        "title": f"Task {index}",
+                        "description": "Benchmark task with a description of typical length for the dashboard",
+                        "status": ("pending", "in_progress", "completed")[index % 3],
+                        "start_date": start + timedelta(days=index % 300),
+                        "due_date": start + timedelta(days=index % 300 + 30),
+                        "assigned_to": user_id,
+                        "project_id": projects[size],
+                        "tool_id": None,
+                        "due_date_edited": bool(index % 7 == 0),
+                        "due_date_change_reason": "Moved" if index % 7 == 0 else None,
+                    }
+                    for index in range(offset, min(offset + BATCH_SIZE, size))
+                ])
+        db.commit()
+    return projects
+
+
+def _orm_pydantic(db: Session, project_id: int) -> bytes:
+    adapter = TypeAdapter(List[TaskOut])
+    tasks = db.query(Task).filter(Task.project_id == project_id).all()
+    content = adapter.dump_python(adapter.validate_python(tasks, from_attributes=True), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def _columns_fast(db: Session, project_id: int) -> bytes:
+    rows = db.query(*TASK_COLUMNS).filter(Task.project_id == project_id).all()
+    return fast_json.encode_rows(rows, TaskOut.model_fields)
+
+
+PATHS = {"orm_pydantic": _orm_pydantic, "columns_fast": _columns_fast}
+
+
+def _best_of(engine, path, project_id: int, repeat: int):
+    best, body = None, None
+    for _ in range(repeat):
+        # a fresh session per run, so no run is served from the identity map
+        with Session(engine) as db:
+            started = time.perf_counter()
+            body = path(db, project_id)
+            elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, body
+
+
+def run_serialization(sizes: list, repeat: int = 3) -> dict:
+    """
+    Builds the task list of each size with both paths and times them.
+
+    Args:
+        sizes (list): Row counts, e.g. [1000, 10000, 100000].
+        repeat (int): Runs per path and size; the fastest counts.
+
+    Variables:
+        projects: Size -> id of the project holding that many tasks.
+    Returns:
+        dict: Encoder in use and, per size, the time, rows/s and body size of each path,
+              the speed-up of columns_fast and whether both bodies are equal.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'serialization.db')}")
+        try:
+            projects = _populate(engine, sizes)
+            results = {}
+            for size in sizes:
+                timings, bodies = {}, {}
+                for name, path in PATHS.items():
+                    timings[name], bodies[name] = _best_of(engine, path, projects[size], repeat)
+                results[size] = {
+                    **{
+                        name: {
+                            "ms": round(seconds * 1000, 2),
+                            "rows_per_s": round(size / seconds),
+                            "bytes": len(bodies[name]),
+                        }
+                        for name, seconds in timings.items()
+                    },
+                    "speedup": round(timings["orm_pydantic"] / timings["columns_fast"], 2),
+                    "same_body": json.loads(bodies["orm_pydantic"]) == json.loads(bodies["columns_fast"]),
+                }
+        finally:
+            engine.dispose()
+    return {"encoder": "orjson" if fast_json.orjson is not None else "json", "repeat": repeat, "sizes": results}
@@ -0,0 +1,244 @@
+"""
+In-Process Cache
+----------------
+Provides a small thread-safe key/value cache with per-entry expiry and a bounded size.
+
+Features:
+- Entries expire after a fixed time-to-live (TTL)
+- Bounded size with least-recently-used (LRU) eviction
+- Explicit invalidation of single keys, of a group of keys (tuple keys sharing their first
+  element) or of the whole cache
+- Stampede protection: concurrent misses on one key share a single load (get_or_load)
+- Generation counter: a load that started before an invalidation does not store its result,
+  so a write can never be overwritten by data read before it (get_or_load and get_or_load_sync)
+- Hit, miss, eviction and load counters per cache, reported by cache_stats()
+- Safe to share between the threadpool workers serving sync routes
+
+Class:
+- TTLCache: LRU cache with expiry, invalidation, load coalescing and statistics
+
+Functions:
+- cache_stats: Statistics of every named cache of this process
+
+Usage:
+Services create a module-level TTLCache, read through await get_or_load() (or get_or_load_sync()
+in synchronous service code; plain get()/set() have no generation check), and call
+invalidate()/invalidate_group()/clear() from the write paths after they committed the change.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# Named caches of this process, for cache_stats().
+_registry = {}
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed number of seconds.
+
+    Attributes:
+        name (str): Name under which the statistics are reported (unnamed caches are not reported).
+        ttl (float): Lifetime of an entry in seconds.
+        max_size (int): Maximum number of entries; the least recently used one is evicted beyond it.
+
+    Methods:
+        get(key): Returns the cached value or None if missing/expired.
+        set(key, value): Stores a value.
+        get_or_load(key, load): Awaitable; returns the cached value or awaits load() once for all concurrent callers.
+        get_or_load_sync(key, load): Returns the cached value or calls load(), storing it only if no
+                                     invalidation happened meanwhile.
+        invalidate(key): Removes a single entry.
+        invalidate_group(group): Removes every tuple key whose first element is group.
+        clear(): Removes all entries.
+        stats(): Counters and current size.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1024, name: Optional[str] = None):
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        # key -> (generation, future) of the load in progress (only touched on the event loop)
+        self._loading = {}
+        self._counters = dict.fromkeys(
+            ("hits", "misses", "evictions", "expirations", "invalidations", "loads", "load_errors", "coalesced"), 0
+        )
+        if name is not None:
+            _registry[name] = self
+
+    def _lookup(self, key):
+        """
+        Returns (found, value) and counts the hit or miss. Must be called with the lock held.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return True, value
+            del self._entries[key]
+            self._counters["expirations"] += 1
+        self._counters["misses"] += 1
+        return False, None
+
+    def _store(self, key, value):
+        """
+        Stores an entry and evicts the least recently used ones beyond max_size. Must be called with the lock held.
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def get(self, key):
+        with self._lock:
+            return self._lookup(key)[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._store(key, value)
+
+    def get_or_load_sync(self, key, load):
+        """
+        Synchronous get_or_load for service code running in the threadpool or in run_sync.
+        Concurrent misses are not coalesced; each caller runs its own load.
+
+        Args:
+            key: Cache key.
+            load: Callable returning the value.
+
+        Variables:
+            generation: Generation before the load; the result is only stored if no
+                        invalidation happened in between.
+        Returns:
+            The cached or loaded value.
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+            generation = self._generation
+        if found:
+            return value
+        try:
+            value = load()
+        except BaseException:
+            with self._lock:
+                self._counters["load_errors"] += 1
+            raise
+        with self._lock:
+            self._counters["loads"] += 1
+            if self._generation == generation:
+                self._store(key, value)
+        return value
+
+    async def get_or_load(self, key, load):
+        """
+        Returns the cached value of key, loading it on a miss.
+        Concurrent misses on the same key (within this event loop) wait for the first caller's
+        load instead of starting their own.
+
+        Args:
+            key: Cache key.
+            load: Callable returning an awaitable of the value (e.g. lambda: run_db(db, fn, ...)).
+
+        Variables:
+            generation: Generation at the start of the load; the result is only stored if no
+                        invalidation happened in between.
+        Returns:
+            The cached or loaded value.
+        """
+        while True:
+            with self._lock:
+                found, value = self._lookup(key)
+                generation = self._generation
+            if found:
+                return value
+            in_flight = self._loading.get(key)
+            if in_flight is None or in_flight[0] != generation:
+                break
+            self._counters["coalesced"] += 1
+            try:
+                return await asyncio.shield(in_flight[1])
+            except asyncio.CancelledError:
+                if not in_flight[1].cancelled():
+                    raise
+                # the request running the load was cancelled; load again
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = (generation, future)
+        try:
+            value = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            self._counters["load_errors"] += 1
+            future.set_exception(error)
+            # mark the exception retrieved when nobody waited for it
+            future.exception()
+            raise
+        finally:
+            if self._loading.get(key, (None, None))[1] is future:
+                del self._loading[key]
+        with self._lock:
+            self._counters["loads"] += 1
+            if self._generation == generation:
+                self._store(key, value)
+        future.set_result(value)
+        return value
+
+    def _invalidated(self):
+        self._generation += 1
+        self._counters["invalidations"] += 1
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._invalidated()
+
+    def invalidate_group(self, group):
+        with self._lock:
+            for key in [key for key in self._entries if isinstance(key, tuple) and key and key[0] == group]:
+                del self._entries[key]
+            self._invalidated()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._invalidated()
+
+    def stats(self) -> dict:
+        """
+        Returns the counters of this cache.
+
+        Returns:
+            dict: size, max_size, ttl, hit_ratio and the hit/miss/eviction/expiration/invalidation/load counters.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            size = len(self._entries)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "size": size,
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hit_ratio": round(counters["hits"] / lookups, 4) if lookups else None,
+            **counters,
+        }
+
+
+def cache_stats() -> dict:
+    """
+    Returns the statistics of every named cache of this process.
+
+    Returns:
+        dict: Cache name -> TTLCache.stats().
+    """
+    return {name: cache.stats() for name, cache in sorted(_registry.items())}
@@ -0,0 +1,216 @@
+"""
+Password Hashing Pool
+---------------------
+Runs bcrypt hashing and verification in a dedicated, size-limited process pool.
+
+Features:
+- bcrypt work happens in separate processes, so a burst of logins does not
+  compete with the threadpool that serves every other synchronous route
+- Bounded queue: when all workers are busy and the queue is full, callers get 503 immediately
+- Per-call timeout
+- Configurable bcrypt cost; hashes with a different cost are reported for rehashing on login
+- Awaitable variants for async routes, which wait for the worker without holding a thread
+
+Functions:
+- hash_password: Hashes a plain password
+- verify_password: Verifies a password and returns a replacement hash when the cost changed
+- hash_password_async, verify_password_async: Awaitable versions of the two functions above
+- shutdown: Stops the worker processes
+
+Settings (HASHING section of config.ini):
+- bcrypt_rounds, workers, queue_size, timeout
+"""
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Tuple
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from configuration.config import BCRYPT_ROUNDS, HASH_WORKERS, HASH_QUEUE_SIZE, HASH_TIMEOUT
+
+# min/max pin the cost so hashes made with another cost "need update" on verification.
+password_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+    bcrypt__max_rounds=BCRYPT_ROUNDS,
+)
+
+_pool = None
+_pool_lock = threading.Lock()
+# One slot per running or queued call; released when the call finishes in the worker.
+_slots = threading.BoundedSemaphore(HASH_WORKERS + HASH_QUEUE_SIZE)
+
+
+def _hash(password: str) -> str:
+    return password_context.hash(password)
+
+
+def _verify_and_update(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    return password_context.verify_and_update(password, hashed)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """
+    Returns the worker pool, starting it on first use.
+
+    Returns:
+        ProcessPoolExecutor: Pool of HASH_WORKERS spawned processes.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=HASH_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _reset_pool():
+    """
+    Discards a broken pool (e.g. a worker was killed) so the next call starts a new one.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _submit(fn, *args):
+    """
+    Submits a hashing function to the pool, taking one of the bounded queue slots.
+
+    Args:
+        fn: Module-level function to run in a worker process.
+        *args: Arguments for fn.
+
+    Variables:
+        future: Pending result of the call in the pool.
+    Returns:
+        concurrent.futures.Future: The pending call.
+    Raises:
+        HTTPException: 503 if the queue is full.
+    """
+    if not _slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent sign-ins, please retry",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        future = _get_pool().submit(fn, *args)
+    except BaseException:
+        _slots.release()
+        raise
+    future.add_done_callback(lambda _: _slots.release())
+    return future
+
+
+def _run(fn, *args):
+    """
+    Runs a hashing function in the pool and waits for its result.
+
+    Args:
+        fn: Module-level function to run in a worker process.
+        *args: Arguments for fn.
+    Returns:
+        The result of fn.
+    Raises:
+        HTTPException: 503 if the queue is full, the call timed out or the pool broke.
+    """
+    future = _submit(fn, *args)
+    try:
+        return future.result(timeout=HASH_TIMEOUT)
+    except TimeoutError:
+        future.cancel()
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Password check timed out, please retry")
+    except BrokenProcessPool:
+        _reset_pool()
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Password check failed, please retry")
+
+
+async def _run_async(fn, *args):
+    """
+    Awaitable version of _run: the event loop keeps serving other requests while the worker runs.
+
+    Args:
+        fn: Module-level function to run in a worker process.
+        *args: Arguments for fn.
+    Returns:
+        The result of fn.
+    Raises:
+        HTTPException: 503 if the queue is full, the call timed out or the pool broke.
+    """
+    future = _submit(fn, *args)
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), HASH_TIMEOUT)
+    except asyncio.TimeoutError:
+        future.cancel()
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Password check timed out, please retry")
+    except BrokenProcessPool:
+        _reset_pool()
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Password check failed, please retry")
+
+
+def hash_password(password: str) -> str:
+    """
+    Hashes a plain password with the configured bcrypt cost.
+
+    Args:
+        password (str): The plain password to hash.
+    Returns:
+        str: The hashed password.
+    """
+    return _run(_hash, password)
+
+
+def verify_password(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verifies a password against a stored hash.
+
+    Args:
+        password (str): User input password.
+        hashed (str): Stored hashed password.
+    Returns:
+        Tuple of (True if match else False, new hash if the stored one uses another bcrypt cost else None).
+    """
+    return _run(_verify_and_update, password, hashed)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Awaitable version of hash_password.
+
+    Args:
+        password (str): The plain password to hash.
+    Returns:
+        str: The hashed password.
+    """
+    return await _run_async(_hash, password)
+
+
+async def verify_password_async(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """
+    Awaitable version of verify_password.
+
+    Args:
+        password (str): User input password.
+        hashed (str): Stored hashed password.
+    Returns:
+        Tuple of (True if match else False, new hash if the stored one uses another bcrypt cost else None).
+    """
+    return await _run_async(_verify_and_update, password, hashed)
+
+
+def shutdown():
+    """
+    Stops the worker processes. Called on application shutdown.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
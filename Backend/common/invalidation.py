@@ -0,0 +1,281 @@
+"""
+Cache Invalidation Bus
+----------------------
+Broadcasts "entity changed" events from the write paths to every worker, so that the
+in-process caches of all workers (and hosts) evict the affected entries.
+
+Features:
+- publish(entity, key) evicts in this worker at once and broadcasts the event to the others
+- Backends ([CACHE] invalidation):
+  - postgres: Postgres LISTEN/NOTIFY on one dedicated connection per worker, outside the pool.
+    A background thread listens and sends, so publish() never waits on the database.
+    The connection is opened with the engine's driver (psycopg2 or psycopg 3); with any other
+    driver a warning is logged and the worker falls back to the memory backend
+  - memory: Events only reach the caches of this process (tests, single-worker deployments)
+  - auto (default): postgres when the database is Postgres, memory otherwise
+- Events carry the sender's id; a worker ignores its own events (it applied them already)
+- Missed events: after the connection was lost, every subscribed cache is flushed once
+  the listener is back, since events sent in between never arrived
+- Bounded send queue: publish() never blocks (the wake-up pipe is non-blocking). When more than
+  MAX_QUEUED_EVENTS wait during an outage, they are replaced by one event flushing every cache
+  of the other workers, which covers everything that was dropped
+- Handlers run on the listener thread; the TTLCache operations they call are thread-safe
+
+Functions:
+- subscribe: Registers the eviction handler of an entity
+- publish: Evicts locally and broadcasts an event
+- start / stop: Start and stop the backend of this worker (app startup and shutdown)
+
+Entities and keys:
+- PROJECT_LISTS, USER_LISTS: key None
+- TASK_LISTS, TOOL_LISTS: project id (None for every project)
+- USER_SUMMARY, TOKEN_VERSION: user id (None for every user)
+A handler called with key None drops all entries of its entity; the entity ALL flushes every cache.
+"""
+
+import json
+import os
+import select
+import socket
+import threading
+import uuid
+from collections import deque
+from typing import Optional
+from common.logger import logger
+from configuration.config import CACHE_INVALIDATION, CACHE_INVALIDATION_CHANNEL
+
+PROJECT_LISTS = "project_lists"
+TASK_LISTS = "task_lists"
+TOOL_LISTS = "tool_lists"
+USER_LISTS = "user_lists"
+USER_SUMMARY = "user_summary"
+TOKEN_VERSION = "token_version"
+# Sent instead of a dropped backlog: receivers flush every subscribed cache.
+ALL = "*"
+
+# Seconds between liveness checks of an idle listener connection, and between reconnect attempts.
+KEEPALIVE_INTERVAL = 30
+RECONNECT_DELAY = 5
+# Events kept for sending while the connection is down; beyond that they collapse into one ALL event.
+MAX_QUEUED_EVENTS = 1000
+
+# Drivers whose connections the listener can wait on and read notifications from.
+LISTEN_DRIVERS = ("psycopg2", "psycopg")
+
+# Identifies this process in the events it sends.
+ORIGIN = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# entity -> handlers called with the key
+_handlers = {}
+_bus = None
+
+
+def subscribe(entity: str, handler):
+    """
+    Registers a handler evicting the cached entries of an entity.
+
+    Args:
+        entity (str): Entity name (one of the constants of this module).
+        handler: Callable taking the key of the changed entity (None for all of them).
+    """
+    _handlers.setdefault(entity, []).append(handler)
+
+
+def _apply(entity: str, key):
+    for handler in _handlers.get(entity, ()):
+        try:
+            handler(key)
+        except Exception:
+            logger.exception(f"Cache invalidation handler of {entity} failed")
+
+
+def _apply_all():
+    for entity in list(_handlers):
+        _apply(entity, None)
+
+
+def publish(entity: str, key=None):
+    """
+    Evicts the entries of a changed entity in this worker and broadcasts the event to the others.
+    Write paths call it after committing, so no worker can reload the old data afterwards.
+
+    Args:
+        entity (str): Entity name.
+        key: Id of the changed entity (e.g. project id), or None for all of them.
+    """
+    _apply(entity, key)
+    if _bus is not None:
+        _bus.send(json.dumps({"o": ORIGIN, "e": entity, "k": key}))
+
+
+def _receive(payload: str):
+    try:
+        event = json.loads(payload)
+    except ValueError:
+        logger.warning(f"Ignoring malformed cache invalidation event: {payload[:200]}")
+        return
+    if event.get("o") == ORIGIN:
+        return
+    if event["e"] == ALL:
+        _apply_all()
+    else:
+        _apply(event["e"], event.get("k"))
+
+
+class PostgresBus:
+    """
+    LISTEN/NOTIFY transport: one thread owns a dedicated connection, listens on the channel and
+    sends the queued events.
+
+    Attributes:
+        engine: Engine whose dialect opens the connection (created outside its pool); its driver
+                is one of LISTEN_DRIVERS.
+        channel (str): Notification channel.
+
+    Methods:
+        send(payload): Queues an event for broadcasting; never blocks.
+        start(): Starts the listener thread.
+        stop(): Stops it and closes the connection.
+    """
+
+    def __init__(self, engine, channel: str):
+        self.engine = engine
+        self.channel = channel
+        self._outgoing = deque()
+        self._outgoing_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        os.set_blocking(self._wakeup_write, False)
+        self._thread = threading.Thread(target=self._run, name="cache-invalidation", daemon=True)
+
+    def send(self, payload: str):
+        with self._outgoing_lock:
+            if len(self._outgoing) >= MAX_QUEUED_EVENTS:
+                # the receivers flush everything, so the queued events are not needed anymore
+                self._outgoing.clear()
+                self._outgoing.append(json.dumps({"o": ORIGIN, "e": ALL, "k": None}))
+            self._outgoing.append(payload)
+        self._wake()
+
+    def _wake(self):
+        try:
+            os.write(self._wakeup_write, b"\0")
+        except BlockingIOError:
+            # the pipe is full, so the listener has a wake-up pending already
+            pass
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopping.set()
+        self._wake()
+        self._thread.join(timeout=5)
+
+    def _connect(self):
+        dialect = self.engine.dialect
+        args, params = dialect.create_connect_args(self.engine.url)
+        connection = dialect.connect(*args, **params)
+        connection.autocommit = True
+        if dialect.driver == "psycopg":
+            # psycopg 3 hands notifications to its handlers whenever it reads a query result
+            connection.add_notify_handler(lambda notify: _receive(notify.payload))
+        with connection.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+        return connection
+
+    def _serve(self, connection):
+        """
+        Listens and sends until stopped or until the connection fails.
+        """
+        psycopg2 = self.engine.dialect.driver == "psycopg2"
+        socket_fd = connection.fileno()
+        while not self._stopping.is_set():
+            readable, _, _ = select.select([socket_fd, self._wakeup_read], [], [], KEEPALIVE_INTERVAL)
+            if self._wakeup_read in readable:
+                os.read(self._wakeup_read, 4096)
+            with connection.cursor() as cursor:
+                while True:
+                    with self._outgoing_lock:
+                        if not self._outgoing:
+                            break
+                        payload = self._outgoing[0]
+                    cursor.execute("SELECT pg_notify(%s, %s)", (self.channel, payload))
+                    # removed only once sent, so events queued during an outage go out after reconnecting
+                    with self._outgoing_lock:
+                        if self._outgoing and self._outgoing[0] is payload:
+                            self._outgoing.popleft()
+                if not readable or (not psycopg2 and socket_fd in readable):
+                    # idle: a round trip detects a dead connection; psycopg 3 also reads the
+                    # pending notifications with its reply
+                    cursor.execute("SELECT 1")
+            if psycopg2:
+                connection.poll()
+                while connection.notifies:
+                    _receive(connection.notifies.pop(0).payload)
+
+    def _run(self):
+        connected_before = False
+        while not self._stopping.is_set():
+            connection = None
+            try:
+                connection = self._connect()
+                if connected_before:
+                    logger.warning("Cache invalidation listener reconnected; flushing the caches of this worker")
+                    _apply_all()
+                connected_before = True
+                self._serve(connection)
+            except Exception as error:
+                logger.warning(f"Cache invalidation listener lost its connection: {error}")
+                connected_before = True
+                self._stopping.wait(RECONNECT_DELAY)
+            finally:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+
+
+def _backend_name(engine) -> str:
+    if CACHE_INVALIDATION != "auto":
+        return CACHE_INVALIDATION
+    return "postgres" if engine.dialect.name == "postgresql" else "memory"
+
+
+def start(engine, channel: Optional[str] = None):
+    """
+    Starts the invalidation backend of this worker; call once at app startup.
+    A Postgres engine whose driver cannot listen (not in LISTEN_DRIVERS) falls back to the
+    memory backend with a warning.
+
+    Args:
+        engine: Synchronous engine of the app.
+        channel (str, optional): Notification channel (default [CACHE] invalidation_channel).
+    Raises:
+        ValueError: If [CACHE] invalidation names an unknown backend.
+    """
+    global _bus
+    backend = _backend_name(engine)
+    if backend == "memory":
+        return
+    if backend != "postgres":
+        raise ValueError(f"Unknown cache invalidation backend: {backend}")
+    if engine.dialect.driver not in LISTEN_DRIVERS:
+        logger.warning(
+            f"Cache invalidation cannot listen with the {engine.dialect.driver} driver; "
+            "falling back to the memory backend (other workers are not notified)"
+        )
+        return
+    _bus = PostgresBus(engine, channel or CACHE_INVALIDATION_CHANNEL)
+    _bus.start()
+
+
+def stop():
+    """
+    Stops the invalidation backend of this worker (app shutdown).
+    """
+    global _bus
+    if _bus is not None:
+        _bus.stop()
+        _bus = None
@@ -0,0 +1,191 @@
+"""
+Access Log Report
+-----------------
+Offline latency and throughput report over a directory of application logs.
+
+Features:
+- Reads the current log and every rotated one (app.log, app.log.YYYY-MM-DD, app.log.YYYY-MM-DD.gz)
+  line by line; gzipped files are decompressed while streaming
+- Understands JSON access records ([LOGGING] format = json) and the text
+  "Completed METHOD path with status N in X.Xms" lines, including the older "in X.XXs" form
+- Per-route p50/p95/p99 from fixed-bucket histograms, requests per minute (average and peak)
+  and the slowest endpoints
+- Bounded memory: per route only a histogram is kept, per minute only a counter; text lines
+  are grouped by their path with numeric segments replaced by {id}
+
+Functions:
+- iter_log_files: Lists the log files of a directory, oldest first
+- parse_line: Extracts (timestamp minute, method, route, status, seconds) from a log line
+- build_report: Aggregates all log files of a directory
+- main: Command line entry point
+
+Usage (from the Backend folder):
+    python -m common.log_report [logs_dir] [--top 10]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+from common.metrics import Histogram, LATENCY_BUCKETS
+
+LOG_NAME = "app.log"
+
+TEXT_LINE = re.compile(
+    r"^\[(?P<minute>\d{4}-\d{2}-\d{2} \d{2}:\d{2}):\d{2}[,.]\d+\] - \w+ - "
+    r"Completed (?P<method>[A-Z]+) (?P<path>\S+) with status (?P<status>\d{3}) "
+    r"in (?P<value>[\d.]+)(?P<unit>ms|s)\b"
+)
+NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def iter_log_files(logs_dir: str) -> list:
+    """
+    Lists the log files of a directory in the order they were written.
+
+    Args:
+        logs_dir (str): Directory holding app.log and its rotated files.
+    Returns:
+        list: Paths, rotated files by date first and the current app.log last.
+    """
+    rotated = sorted(
+        name for name in os.listdir(logs_dir)
+        if name.startswith(LOG_NAME + ".")
+    )
+    names = rotated + ([LOG_NAME] if os.path.exists(os.path.join(logs_dir, LOG_NAME)) else [])
+    return [os.path.join(logs_dir, name) for name in names]
+
+
+def _open_log(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+
+def parse_line(line: str):
+    """
+    Extracts the access data from one log line.
+
+    Args:
+        line (str): A JSON or text log line.
+    Returns:
+        Tuple of (minute "YYYY-MM-DD HH:MM", method, route, status, seconds), or None for other lines.
+    """
+    if line.startswith("{"):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return None
+        if "duration_us" not in entry:
+            return None
+        minute = entry["ts"][:16].replace("T", " ")
+        return minute, entry["method"], entry["route"], entry["status"], entry["duration_us"] / 1_000_000
+
+    match = TEXT_LINE.match(line)
+    if match is None:
+        return None
+    seconds = float(match["value"]) / (1000 if match["unit"] == "ms" else 1)
+    route = NUMERIC_SEGMENT.sub("/{id}", match["path"].split("?", 1)[0])
+    return match["minute"], match["method"], route, int(match["status"]), seconds
+
+
+def build_report(logs_dir: str, top: int = 10) -> dict:
+    """
+    Aggregates the access records of every log file in a directory.
+
+    Args:
+        logs_dir (str): Directory holding the logs.
+        top (int): Number of slowest endpoints to list.
+
+    Variables:
+        routes: (method, route) -> Histogram of durations.
+        errors: (method, route) -> responses with status >= 500.
+        per_minute: minute -> request count.
+    Returns:
+        dict: Totals, throughput, per-route percentiles and the slowest endpoints (by p95).
+    """
+    routes = {}
+    errors = defaultdict(int)
+    per_minute = defaultdict(int)
+    for path in iter_log_files(logs_dir):
+        with _open_log(path) as log_file:
+            for line in log_file:
+                parsed = parse_line(line)
+                if parsed is None:
+                    continue
+                minute, method, route, status, seconds = parsed
+                histogram = routes.get((method, route))
+                if histogram is None:
+                    histogram = routes[(method, route)] = Histogram(LATENCY_BUCKETS)
+                histogram.observe(seconds)
+                if status >= 500:
+                    errors[(method, route)] += 1
+                per_minute[minute] += 1
+
+    stats = []
+    for (method, route), histogram in routes.items():
+        snapshot = histogram.snapshot()
+        stats.append({
+            "method": method,
+            "route": route,
+            "count": snapshot["count"],
+            "errors": errors[(method, route)],
+            "mean": snapshot["sum"] / snapshot["count"],
+            "p50": histogram.quantile(0.5),
+            "p95": histogram.quantile(0.95),
+            "p99": histogram.quantile(0.99),
+            "max": snapshot["max"],
+        })
+    stats.sort(key=lambda row: row["count"], reverse=True)
+    total = sum(per_minute.values())
+    return {
+        "requests": total,
+        "minutes": len(per_minute),
+        "per_minute_avg": total / len(per_minute) if per_minute else 0.0,
+        "per_minute_peak": max(per_minute.items(), key=lambda item: item[1], default=(None, 0)),
+        "routes": stats,
+        "slowest": sorted(stats, key=lambda row: row["p95"], reverse=True)[:top],
+    }
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}"
+
+
+def _print_table(rows: list):
+    print(f"{'METHOD':<8}{'ROUTE':<48}{'COUNT':>8}{'5xx':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for row in rows:
+        print(
+            f"{row['method']:<8}{row['route'][:47]:<48}{row['count']:>8}{row['errors']:>6}"
+            f"{_ms(row['p50']):>10}{_ms(row['p95']):>10}{_ms(row['p99']):>10}{_ms(row['max']):>10}"
+        )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m common.log_report", description="Latency and throughput report from the access logs.")
+    parser.add_argument("logs_dir", nargs="?", default="logs", help="Directory holding app.log and its rotated files")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest endpoints to list")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.logs_dir):
+        print(f"No such directory: {args.logs_dir}", file=sys.stderr)
+        return 1
+    report = build_report(args.logs_dir, args.top)
+    peak_minute, peak_count = report["per_minute_peak"]
+    print(f"Requests: {report['requests']} over {report['minutes']} active minutes")
+    print(f"Throughput: {report['per_minute_avg']:.1f} req/min average, {peak_count} req/min peak ({peak_minute})")
+    print("Percentiles are interpolated within fixed histogram buckets.")
+    print()
+    print("Per route:")
+    _print_table(report["routes"])
+    print()
+    print(f"Slowest {len(report['slowest'])} endpoints (by p95):")
+    _print_table(report["slowest"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
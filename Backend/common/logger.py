@@ -4,27 +4,89 @@ Logger Configuration
 Sets up application-wide logging with console and file handlers, including log rotation.
 
 Features:
-- Logs to both console and file (rotated daily, keeps 30 days)
-- Custom log format with timestamp, level, and message
+- Logs to both console and file (rotated daily, keeps 30 days; rotated files are gzipped
+  when [LOGGING] compress is on)
+- Custom log format with timestamp, level, and message, or JSON lines ([LOGGING] format = json)
+  where access records carry request_id, method, route, path, status, duration_us, db_queries, db_time_us and user_id
+- Every record is tagged with the request id of the request that logged it
+- Non-blocking: the logger only puts records on a queue (QueueHandler); a background
+  thread (QueueListener) formats them and does the console and file I/O
 - Ensures log directory exists
 - Avoids duplicate handlers
 
+Classes:
+- RequestIdFilter: Adds the current request id to records (runs in the logging thread)
+- JsonFormatter: Formats records as one JSON object per line
+
+Functions:
+- stop_listener: Flushes the queue and stops the background thread (registered with atexit)
+
 Usage:
 Import the logger object and use logger.info(), logger.error(), etc. throughout the app.
 """
 
 # common/logger.py
 
+import atexit
+import gzip
+import json
 import logging
 import os
-from logging.handlers import TimedRotatingFileHandler
+import queue
+import shutil
+from datetime import datetime, timezone
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
+from common import request_context
+from configuration.config import LOG_FORMAT, LOG_COMPRESS
+
+
+class RequestIdFilter(logging.Filter):
+    """
+    Copies the id of the current request onto each record ("-" outside requests).
+    Attached to the QueueHandler, so it runs in the thread that logs, where the request context is visible.
+    """
+    def filter(self, record):
+        context = request_context.current()
+        record.request_id = context.request_id if context is not None else "-"
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats a record as a single JSON object: ts, level, msg, request_id, plus the
+    fields of the "access" dict that LoggingMiddleware passes for request records.
+    """
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "msg": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        entry.update(getattr(record, "access", {}))
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str):
+    with open(source, "rb") as plain, gzip.open(dest, "wb") as compressed:
+        shutil.copyfileobj(plain, compressed)
+    os.remove(source)
 
 # Create logger
 logger = logging.getLogger("fastapi_app")
 logger.setLevel(logging.INFO)
 
 # Log format
-formatter = logging.Formatter("[%(asctime)s] - %(levelname)s - %(message)s")
+if LOG_FORMAT == "json":
+    formatter = JsonFormatter()
+else:
+    formatter = logging.Formatter("[%(asctime)s] - %(levelname)s - %(message)s")
 
 # Console logging
 console_handler = logging.StreamHandler()
@@ -44,8 +106,29 @@ file_handler = TimedRotatingFileHandler(
 )
 file_handler.setFormatter(formatter)
 file_handler.suffix = "%Y-%m-%d"  # adds date suffix to rotated logs
+if LOG_COMPRESS:
+    # runs in the listener thread, like every other handler call
+    file_handler.namer = _gzip_namer
+    file_handler.rotator = _gzip_rotator
+
+# Records go through an unbounded queue; only the listener thread touches the handlers
+log_queue = queue.SimpleQueue()
+listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
 
 # Avoid duplicate handlers
 if not logger.hasHandlers():
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+    logger.addHandler(queue_handler)
+    listener.start()
+
+
+def stop_listener():
+    """
+    Writes out the queued records and stops the listener thread. Safe to call more than once.
+    """
+    if listener._thread is not None:
+        listener.stop()
+
+
+atexit.register(stop_listener)
@@ -1,12 +1,20 @@
 """
 Logging Middleware
 ------------------
-Provides a FastAPI middleware class for logging incoming requests and responses.
+Provides a pure ASGI middleware for logging HTTP requests and responses.
 
 Features:
-- Logs request method and path
-- Logs response status and duration
+- Logs method, path, response status and duration (in milliseconds) once per request
+- Starts the request context (common.request_context): keeps an incoming X-Request-ID or
+  creates one, and returns it in the X-Request-ID response header
+- With [LOGGING] format = json the access record also carries the route template, duration in
+  microseconds, DB query count and time, user id and request id as separate fields
+- Reports the request's statement count and DB time in X-DB-Queries / Server-Timing headers
+  ([DATABASE] timing_headers) and warns about statements repeated in one request (database/query_stats.py)
 - Logs exceptions during request handling
+- Samples successful requests on high-traffic routes ([LOGGING] sample_routes / sample_rate);
+  failed requests are always logged
+- No per-request task or body wrapping (unlike BaseHTTPMiddleware)
 
 Class:
 - LoggingMiddleware: Middleware for logging HTTP requests and responses
@@ -14,33 +22,82 @@ Class:
 
 # common/logging_middleware.py
 
+import random
 import time
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from common import request_context
 from common.logger import logger
+from common.metrics_middleware import route_template
+from configuration.config import LOG_SAMPLE_ROUTES, LOG_SAMPLE_RATE, DB_TIMING_HEADERS
+from database import query_stats
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+REQUEST_ID_HEADER = b"x-request-id"
+# Incoming ids longer than this are replaced, so clients cannot bloat the logs.
+MAX_REQUEST_ID_LENGTH = 128
+
+
+def _incoming_request_id(scope):
+    for name, value in scope["headers"]:
+        if name == REQUEST_ID_HEADER:
+            request_id = value.decode("latin-1").strip()
+            if 0 < len(request_id) <= MAX_REQUEST_ID_LENGTH and request_id.isprintable():
+                return request_id
+            return None
+    return None
+
+
+class LoggingMiddleware:
     """
-    Middleware to log incoming HTTP requests and responses.
+    ASGI middleware to log HTTP requests and responses.
     
-    Methods:
-        dispatch(request, call_next): Logs request details, handles exceptions, and logs response status and duration.
+    Attributes:
+        app: The wrapped ASGI application.
     """
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+    def __init__(self, app):
+        self.app = app
 
-        logger.info(f"Incoming request: {request.method} {request.url.path}")
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+        context, token = request_context.begin(_incoming_request_id(scope))
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = [*message.get("headers", []), (REQUEST_ID_HEADER, context.request_id.encode("latin-1"))]
+                if DB_TIMING_HEADERS:
+                    headers += query_stats.response_headers(context)
+                message["headers"] = headers
+            await send(message)
 
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            logger.exception(f"Exception during request: {e}")
+            logger.exception(f"Exception during request {scope['method']} {scope['path']}: {e}")
             raise
-
-        duration = time.time() - start_time
-        logger.info(
-            f"Completed {request.method} {request.url.path} "
-            f"with status {response.status_code} in {duration:.2f}s"
-        )
-
-        return response
+        else:
+            route = route_template(scope)
+            query_stats.warn_repeated(context, scope["method"], route)
+            if status_code < 400 and route in LOG_SAMPLE_ROUTES and random.random() >= LOG_SAMPLE_RATE:
+                return
+            duration_us = int((time.perf_counter() - start_time) * 1_000_000)
+            logger.info(
+                f"Completed {scope['method']} {scope['path']} "
+                f"with status {status_code} in {duration_us / 1000:.1f}ms",
+                extra={"access": {
+                    "method": scope["method"],
+                    "route": route,
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_us": duration_us,
+                    "db_queries": context.db_queries,
+                    "db_time_us": int(context.db_time * 1_000_000),
+                    "user_id": context.user_id,
+                }},
+            )
+        finally:
+            request_context.end(token)
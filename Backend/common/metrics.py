@@ -0,0 +1,95 @@
+"""
+Metrics Primitives
+------------------
+Small thread-safe building blocks for in-process measurements.
+
+Features:
+- Fixed-bucket histograms: constant memory, cheap to update from any thread
+- Quantile estimates (p50/p95/p99) interpolated inside the matching bucket
+
+Classes:
+- Histogram: Counts observations into cumulative upper-bound buckets
+
+Usage:
+Create a module-level Histogram with buckets suited to the measured value
+(e.g. LATENCY_BUCKETS for durations in seconds), call observe() on the hot
+path and snapshot() when reporting.
+"""
+
+import bisect
+import threading
+
+# Upper bounds in seconds, from 1 ms to 30 s.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """
+    Histogram with fixed upper-bound buckets plus an overflow (+Inf) bucket.
+
+    Attributes:
+        buckets (tuple): Sorted bucket upper bounds.
+
+    Methods:
+        observe(value): Records one observation.
+        quantile(q): Estimates the q-quantile (0 < q < 1).
+        snapshot(): Returns cumulative bucket counts, count, sum and max.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            if value > self._max:
+                self._max = value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates a quantile by linear interpolation inside the bucket that contains it.
+
+        Args:
+            q (float): Quantile between 0 and 1 (e.g. 0.95).
+        Returns:
+            float: Estimated value, 0.0 without observations. Values in the +Inf bucket report the observed max.
+        """
+        with self._lock:
+            counts, total, maximum = list(self._counts), self._count, self._max
+        if total == 0:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if count and seen + count >= rank:
+                if index == len(self.buckets):
+                    return maximum
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = min(self.buckets[index], maximum)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return maximum
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current state of the histogram.
+
+        Returns:
+            dict: "buckets" (cumulative count per upper bound, "+Inf" last), "count", "sum" and "max".
+        """
+        with self._lock:
+            counts, total, total_sum, maximum = list(self._counts), self._count, self._sum, self._max
+        cumulative = {}
+        running = 0
+        for bound, count in zip(list(self.buckets) + ["+Inf"], counts):
+            running += count
+            cumulative[str(bound)] = running
+        return {"buckets": cumulative, "count": total, "sum": total_sum, "max": maximum}
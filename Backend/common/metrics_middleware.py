@@ -0,0 +1,76 @@
+"""
+Metrics Middleware
+------------------
+Pure ASGI middleware that feeds common.request_metrics.
+
+Features:
+- Labels requests with the matched route template (e.g. /project/{project_id}/tasks),
+  so metric cardinality stays bounded; unmatched paths are counted as "unmatched"
+- Measures the full request including streamed response bodies
+- Counts unhandled exceptions as 500
+- No per-request task or body wrapping (unlike BaseHTTPMiddleware)
+
+Functions:
+- route_template: Returns the route template that matched a request
+
+Class:
+- MetricsMiddleware: Records count, status class and latency of every HTTP request
+"""
+
+import time
+from common import request_metrics
+
+# Paths whose requests are not measured (the scrape endpoint itself).
+EXCLUDED_PATHS = {"/metrics"}
+
+
+def route_template(scope) -> str:
+    """
+    Returns the template of the route that served a request (the router stores it in the shared scope).
+
+    Args:
+        scope: ASGI scope after the application has handled the request.
+    Returns:
+        str: Full route template including the router prefix, or "unmatched".
+    """
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    # Newer FastAPI versions keep included routers un-copied: the route only knows its path
+    # inside the router, the prefixed path lives in the effective route context.
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    return getattr(context, "path", None) or route.path
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route request metrics.
+
+    Attributes:
+        app: The wrapped ASGI application.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        request_metrics.request_started(method)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_metrics.request_finished(method)
+            request_metrics.observe(method, route_template(scope), status_code, time.perf_counter() - start)
@@ -0,0 +1,144 @@
+"""
+Cursor Pagination Helpers
+-------------------------
+Provides keyset (cursor) pagination for list queries.
+
+Features:
+- Opaque, URL-safe cursors that encode the last seen key of a page
+- Stable ordering on an indexed column (the primary key by default), or on several columns
+  compared as a row value, e.g. (created_at, id) for chronological lists
+- Page size is capped so a single request never loads an unbounded result set
+
+Functions:
+- encode_cursor: Turns the last seen key into an opaque cursor string
+- decode_cursor: Turns a cursor string back into the last seen key
+- paginate: Applies keyset pagination to a SQLAlchemy query
+
+Usage:
+Services call paginate() when the client passes a cursor or a limit and
+return its result (a dict with "items" and "next_cursor") instead of a plain list.
+"""
+
+import base64
+import json
+from datetime import datetime
+from fastapi import HTTPException
+from sqlalchemy import DateTime, tuple_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(last_key) -> str:
+    """
+    Encodes the key of the last row of a page into an opaque cursor.
+
+    Args:
+        last_key: Value of the ordering column for the last row returned.
+    Returns:
+        str: URL-safe cursor string.
+    """
+    raw = json.dumps({"k": last_key}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """
+    Decodes a cursor produced by encode_cursor.
+
+    Args:
+        cursor (str): Cursor string received from the client.
+    Returns:
+        The key of the last row of the previous page.
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))["k"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _cursor_key(row, columns):
+    values = [getattr(row, column.key) for column in columns]
+    values = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return values[0] if len(values) == 1 else values
+
+
+def _cursor_value(column, value):
+    """
+    Converts one cursor value to the Python type of its column.
+    Raises ValueError when the value cannot belong to the column.
+    """
+    # a row value compared with NULL is NULL, which would silently return an empty page
+    if value is None:
+        raise ValueError("null key")
+    if isinstance(column.type, DateTime):
+        if not isinstance(value, str):
+            raise ValueError("datetime key must be a string")
+        return datetime.fromisoformat(value)
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        python_type = None
+    # bool is an int subclass, but never a valid key of an integer column
+    if python_type is int and (isinstance(value, bool) or not isinstance(value, int)):
+        raise ValueError("integer key expected")
+    if python_type is str and not isinstance(value, str):
+        raise ValueError("string key expected")
+    if python_type not in (int, str) and isinstance(value, (dict, list)):
+        raise ValueError("scalar key expected")
+    return value
+
+
+def _bind_key(columns, key) -> list:
+    """
+    Turns a decoded cursor key back into one value per ordering column.
+    Raises HTTPException (400) when it does not fit the columns.
+    """
+    values = [key] if len(columns) == 1 else key
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    try:
+        return [_cursor_value(column, value) for column, value in zip(columns, values)]
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate(query, key_column, cursor: str = None, limit: int = None) -> dict:
+    """
+    Applies keyset pagination to a query ordered by a single unique, indexed column,
+    or by a tuple of columns whose last member is unique (e.g. (Comment.created_at, Comment.id)).
+    Key columns must not hold NULLs: a cursor with a null key is rejected.
+
+    Args:
+        query: SQLAlchemy query to paginate (must not be ordered already); it may select
+               entities or plain columns, as long as the key columns are among them.
+        key_column: Unique column used for ordering and as the cursor key (e.g. Task.id),
+                    or a tuple of columns compared as a row value.
+        cursor (str, optional): Cursor returned with the previous page.
+        limit (int, optional): Maximum number of rows to return, capped at MAX_PAGE_SIZE.
+
+    Variables:
+        columns: The ordering columns.
+        rows: Rows fetched for this page, plus one extra row to detect a next page.
+        next_cursor: Cursor pointing past the last row, or None on the last page.
+    Returns:
+        dict: {"items": list of rows, "next_cursor": str or None}
+    """
+    columns = tuple(key_column) if isinstance(key_column, (tuple, list)) else (key_column,)
+    limit = min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+    if cursor:
+        values = _bind_key(columns, decode_cursor(cursor))
+        if len(columns) == 1:
+            query = query.filter(columns[0] > values[0])
+        else:
+            query = query.filter(tuple_(*columns) > tuple_(*values))
+    rows = query.order_by(*columns).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(_cursor_key(rows[-1], columns))
+    return {"items": rows, "next_cursor": next_cursor}
@@ -14,7 +14,7 @@ from fastapi import Depends, HTTPException, status
 from common.utils import get_current_user
 from models.user_model import User
 
-def admin_required(current_user: User = Depends(get_current_user)):
+async def admin_required(current_user: User = Depends(get_current_user)):
   """
   Dependency that ensures the current user has an admin role.
 
@@ -31,7 +31,7 @@ def admin_required(current_user: User = Depends(get_current_user)):
     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
   return current_user
 
-def manager_required(current_user: User = Depends(get_current_user)):
+async def manager_required(current_user: User = Depends(get_current_user)):
   """
   Dependency that ensures the current user has either admin or manager role.
 
@@ -0,0 +1,74 @@
+"""
+Request Context
+---------------
+Holds per-request data that code deep in the call stack can read or update
+without passing it around (request id, authenticated user, database statements and time).
+
+Features:
+- Backed by a ContextVar: each request (asyncio task) sees its own context, and the
+  threadpool and AsyncSession.run_sync calls of a request share it
+- The context object is mutable, so updates made in worker threads are visible to the middleware
+
+Class:
+- RequestContext: Data collected for one request
+
+Functions:
+- begin: Starts the context of a request
+- end: Restores the previous context
+- current: Returns the active context, or None outside requests
+- set_user: Records the authenticated user of the current request
+"""
+
+import uuid
+from contextvars import ContextVar
+from typing import Optional
+
+
+class RequestContext:
+    """
+    Data collected for one request.
+
+    Attributes:
+        request_id (str): Id from the X-Request-ID header, or a new random id.
+        user_id (int): Authenticated user, if any.
+        db_queries (int): SQL statements executed for the request.
+        db_time (float): Seconds spent executing them.
+        statements (dict): Statement fingerprint -> executions, for repeated query detection.
+    """
+
+    def __init__(self, request_id: Optional[str] = None):
+        self.request_id = request_id or uuid.uuid4().hex
+        self.user_id = None
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.statements = {}
+
+
+_current: ContextVar = ContextVar("request_context", default=None)
+
+
+def begin(request_id: Optional[str] = None):
+    """
+    Starts the context of a request.
+
+    Args:
+        request_id (str, optional): Incoming request id to keep.
+    Returns:
+        Tuple of (RequestContext, token to pass to end()).
+    """
+    context = RequestContext(request_id)
+    return context, _current.set(context)
+
+
+def end(token):
+    _current.reset(token)
+
+
+def current() -> Optional[RequestContext]:
+    return _current.get()
+
+
+def set_user(user_id: int):
+    context = _current.get()
+    if context is not None:
+        context.user_id = user_id
@@ -0,0 +1,322 @@
+"""
+Request Metrics Registry
+------------------------
+Collects per-route HTTP metrics in each worker process and renders them in the
+Prometheus text exposition format, aggregated over all uvicorn workers.
+
+Features:
+- Request counts by method, route template and status class (2xx, 4xx, ...)
+- Latency histograms by method and route template
+- In-flight request gauges by method
+- Lock-free updates: the counters are only touched from the event loop thread of
+  the worker, so plain dictionary increments are safe
+- Cross-worker aggregation: every worker writes its snapshot to <dir>/<pid>-<random>.json
+  (periodically and at shutdown); the scraped worker sums them with its live data
+- Liveness: each worker holds a lock on <dir>/<pid>-<random>.lock while it runs, so a dead
+  worker is told apart even when its pid was reused
+- Counters of exited workers are kept so totals never go backwards while the service runs: a
+  starting worker folds their snapshots into <dir>/exited.json. When no worker of the previous
+  run is left, a starting worker clears the directory instead. Gauges only count live workers.
+
+Functions:
+- observe: Records one finished request
+- request_started / request_finished: Maintain the in-flight gauges
+- start: Registers the worker and folds or clears the files of exited workers
+- write_snapshot: Writes this worker's snapshot file
+- flush_periodically: Background task writing the snapshot every flush interval
+- render: Returns the aggregated metrics as Prometheus text
+
+Settings (METRICS section of config.ini):
+- enabled, dir, flush_interval
+"""
+
+import asyncio
+import bisect
+import json
+import os
+import tempfile
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from common.metrics import LATENCY_BUCKETS
+from configuration.config import METRICS_DIR, METRICS_FLUSH_INTERVAL
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+BUCKETS = LATENCY_BUCKETS
+
+# Names this worker's files; the random part keeps a reused pid from taking over a dead worker's files.
+INSTANCE = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+# Snapshot holding the summed counters of exited workers, and the lock file of the directory.
+EXITED = "exited"
+DIRECTORY_LOCK = ".lock"
+
+# Lock file held by this worker while it runs (see start())
+_instance_lock = None
+
+# (method, route, status_class) -> count
+_requests = defaultdict(int)
+# (method, route) -> [per-bucket counts..., +Inf count, sum]
+_latency = {}
+# method -> requests in progress
+_in_flight = defaultdict(int)
+
+
+def request_started(method: str):
+    _in_flight[method] += 1
+
+
+def request_finished(method: str):
+    _in_flight[method] -= 1
+
+
+def observe(method: str, route: str, status_code: int, seconds: float):
+    """
+    Records one finished request.
+
+    Args:
+        method (str): HTTP method.
+        route (str): Route template (e.g. /project/{project_id}/tasks), not the raw URL.
+        status_code (int): Response status.
+        seconds (float): Request duration.
+    """
+    _requests[(method, route, f"{status_code // 100}xx")] += 1
+    series = _latency.get((method, route))
+    if series is None:
+        series = _latency[(method, route)] = [0] * (len(BUCKETS) + 1) + [0.0]
+    series[bisect.bisect_left(BUCKETS, seconds)] += 1
+    series[-1] += seconds
+
+
+def _snapshot() -> dict:
+    return {
+        "instance": INSTANCE,
+        "pid": os.getpid(),
+        "requests": [[*key, count] for key, count in _requests.items()],
+        "latency": [[*key, series] for key, series in _latency.items()],
+        "in_flight": dict(_in_flight),
+    }
+
+
+def _path(name: str, suffix: str = ".json") -> str:
+    return os.path.join(METRICS_DIR, name + suffix)
+
+
+def _write(name: str, snapshot: dict):
+    fd, tmp_path = tempfile.mkstemp(dir=METRICS_DIR, suffix=".tmp")
+    with os.fdopen(fd, "w") as tmp:
+        json.dump(snapshot, tmp)
+    os.replace(tmp_path, _path(name))
+
+
+def _read(name: str):
+    try:
+        with open(_path(name)) as snapshot_file:
+            return json.load(snapshot_file)
+    except (OSError, ValueError):
+        return None
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+@contextmanager
+def _directory_lock(operation):
+    """
+    Holds the lock of METRICS_DIR: exclusive while files are folded, shared while they are read.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(METRICS_DIR, DIRECTORY_LOCK), "a") as lock_file:
+        fcntl.flock(lock_file, operation)
+        yield
+
+
+def _instances() -> list:
+    """
+    Returns the ids of the other workers that left a snapshot or a lock file in METRICS_DIR.
+    """
+    names = set()
+    for name in os.listdir(METRICS_DIR):
+        if name.endswith((".json", ".lock")):
+            names.add(name[:-5])
+    names.difference_update({INSTANCE, EXITED, ""})
+    return sorted(names)
+
+
+def _is_alive(instance: str) -> bool:
+    """
+    Tells whether a worker still runs: it holds the lock on its lock file until it exits,
+    and the kernel releases it even when the worker crashes.
+    """
+    if fcntl is None:
+        return True
+    try:
+        fd = os.open(_path(instance, ".lock"), os.O_RDWR)
+    except FileNotFoundError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    finally:
+        os.close(fd)
+    return False
+
+
+def _sum(snapshots) -> tuple:
+    """
+    Sums the request counters and latency series of snapshots.
+
+    Returns:
+        tuple: (requests, latency) dicts keyed like the live registries.
+    """
+    requests = defaultdict(int)
+    latency = {}
+    for snapshot in snapshots:
+        for method, route, status_class, count in snapshot["requests"]:
+            requests[(method, route, status_class)] += count
+        for method, route, series in snapshot["latency"]:
+            total = latency.setdefault((method, route), [0] * len(series))
+            for index, value in enumerate(series):
+                total[index] += value
+    return requests, latency
+
+
+def start():
+    """
+    Registers this worker in METRICS_DIR; call once at worker startup, before the first snapshot.
+
+    Takes this worker's lock file and folds the snapshots of exited workers into exited.json,
+    so their counters are kept without a file per dead worker. When no other worker is alive,
+    the previous run is over: its files are deleted and the counters start from zero, like the
+    counters of a restarted process.
+    Without fcntl (Windows) no liveness can be told: snapshots are only ever added.
+    """
+    global _instance_lock
+    os.makedirs(METRICS_DIR, exist_ok=True)
+    if fcntl is None:
+        return
+    with _directory_lock(fcntl.LOCK_EX):
+        instances = _instances()
+        dead = [instance for instance in instances if not _is_alive(instance)]
+        if len(dead) == len(instances):
+            for name in os.listdir(METRICS_DIR):
+                if name != DIRECTORY_LOCK:
+                    _remove(os.path.join(METRICS_DIR, name))
+        elif dead:
+            snapshots = [_read(instance) for instance in [EXITED, *dead]]
+            requests, latency = _sum(snapshot for snapshot in snapshots if snapshot is not None)
+            _write(EXITED, {
+                "instance": EXITED,
+                "requests": [[*key, count] for key, count in requests.items()],
+                "latency": [[*key, series] for key, series in latency.items()],
+                "in_flight": {},
+            })
+            for instance in dead:
+                _remove(_path(instance))
+                _remove(_path(instance, ".lock"))
+        # taken under the directory lock, so no starting worker sees the file unlocked
+        _instance_lock = open(_path(INSTANCE, ".lock"), "w")
+        fcntl.flock(_instance_lock, fcntl.LOCK_EX)
+
+
+def write_snapshot():
+    """
+    Writes this worker's snapshot to <METRICS_DIR>/<instance>.json (atomically, via a temporary file).
+    """
+    os.makedirs(METRICS_DIR, exist_ok=True)
+    _write(INSTANCE, _snapshot())
+
+
+async def flush_periodically():
+    """
+    Writes the snapshot every METRICS_FLUSH_INTERVAL seconds so other workers can aggregate it.
+    Runs as a background task for the lifetime of the worker.
+    """
+    while True:
+        await asyncio.sleep(METRICS_FLUSH_INTERVAL)
+        await asyncio.to_thread(write_snapshot)
+
+
+def _load_snapshots() -> list:
+    """
+    Reads the snapshots of all workers; this worker's own data is taken live.
+
+    Returns:
+        list: Snapshot dicts, with "alive" set for each (exited.json counts as not alive).
+    """
+    snapshots = [dict(_snapshot(), alive=True)]
+    if not os.path.isdir(METRICS_DIR):
+        return snapshots
+    with _directory_lock(fcntl.LOCK_SH if fcntl is not None else None):
+        for instance in [EXITED, *_instances()]:
+            snapshot = _read(instance)
+            if snapshot is None:
+                continue
+            snapshot["alive"] = instance != EXITED and _is_alive(instance)
+            snapshots.append(snapshot)
+    return snapshots
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def render() -> str:
+    """
+    Aggregates the snapshots of all workers into Prometheus text format.
+
+    Variables:
+        requests: Summed request counters.
+        latency: Summed histogram series.
+        in_flight: Summed gauges of live workers.
+    Returns:
+        str: Metrics in the Prometheus text exposition format (version 0.0.4).
+    """
+    snapshots = _load_snapshots()
+    requests, latency = _sum(snapshots)
+    in_flight = defaultdict(int)
+    for snapshot in snapshots:
+        if snapshot["alive"]:
+            for method, count in snapshot["in_flight"].items():
+                in_flight[method] += count
+
+    lines = [
+        "# HELP http_requests_total HTTP requests by method, route template and status class.",
+        "# TYPE http_requests_total counter",
+    ]
+    for (method, route, status_class), count in sorted(requests.items()):
+        lines.append(f"http_requests_total{_labels(method=method, route=route, status=status_class)} {count}")
+
+    lines += [
+        "# HELP http_request_duration_seconds HTTP request latency by method and route template.",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for (method, route), series in sorted(latency.items()):
+        cumulative = 0
+        for bound, count in zip([*BUCKETS, "+Inf"], series[:-1]):
+            cumulative += count
+            lines.append(f"http_request_duration_seconds_bucket{_labels(method=method, route=route, le=bound)} {cumulative}")
+        lines.append(f"http_request_duration_seconds_sum{_labels(method=method, route=route)} {series[-1]}")
+        lines.append(f"http_request_duration_seconds_count{_labels(method=method, route=route)} {cumulative}")
+
+    lines += [
+        "# HELP http_requests_in_flight HTTP requests currently being served, by method.",
+        "# TYPE http_requests_in_flight gauge",
+    ]
+    for method, count in sorted(in_flight.items()):
+        lines.append(f"http_requests_in_flight{_labels(method=method)} {count}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,124 @@
+"""
+Resource Versions
+-----------------
+Change counters for read-mostly resources, used to answer conditional GETs.
+
+Features:
+- One row per resource in resource_versions; write paths bump it in the same transaction as the change
+- The ETag of a resource is derived from its version, so If-None-Match is answered with 304
+  after a single primary key lookup, without running the read query or serializing the result
+- Works across workers: the counters live in the database
+- Cached reads are keyed by the ETag, so a cached body always belongs to the ETag sent with it
+
+Resources:
+- PROJECTS: Project list (/project/get-projects)
+- USERS: User list (/auth/get-users)
+- tools_resource(project_id): Tools of a project (/tool/{project_id}/tools)
+
+Functions:
+- bump: Increments a resource's version (call before committing the write)
+- etag: Returns the current ETag of a resource
+- etag_matches: Evaluates an If-None-Match header against an ETag
+- conditional_get: Runs a (usually cached) read only when the client's copy is outdated
+"""
+
+from typing import Optional
+from fastapi import Request, Response
+from sqlalchemy import update, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from database.database import run_db
+from common.fast_json import JSONBytesResponse
+from models.resource_version_model import ResourceVersion
+
+PROJECTS = "projects"
+USERS = "users"
+
+# Clients must revalidate on every use; unchanged data costs a 304 without a body.
+CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+
+def tools_resource(project_id: int) -> str:
+    return f"tools:{project_id}"
+
+
+def bump(db: Session, resource: str):
+    """
+    Increments the version of a resource inside the caller's transaction.
+    The row is created on first use.
+
+    Args:
+        db (Session): Session holding the write; the caller commits.
+        resource (str): Resource name.
+    """
+    increment = (
+        update(ResourceVersion)
+        .where(ResourceVersion.resource == resource)
+        .values(version=ResourceVersion.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if db.execute(increment).rowcount:
+        return
+    try:
+        with db.begin_nested():
+            db.execute(insert(ResourceVersion).values(resource=resource, version=1))
+    except IntegrityError:
+        # another transaction created the row first
+        db.execute(increment)
+
+
+def etag(db: Session, resource: str) -> str:
+    """
+    Returns the entity tag of a resource's current version.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        resource (str): Resource name.
+    Returns:
+        str: Quoted ETag, e.g. "projects-12".
+    """
+    version = db.query(ResourceVersion.version).filter(ResourceVersion.resource == resource).scalar()
+    return f'"{resource}-{version or 0}"'
+
+
+def etag_matches(if_none_match: Optional[str], current: str) -> bool:
+    """
+    Evaluates an If-None-Match header (weak comparison, as RFC 9110 requires for it).
+
+    Args:
+        if_none_match (str, optional): Header value.
+        current (str): Current ETag.
+    Returns:
+        bool: True if the client already has the current representation.
+    """
+    if if_none_match is None:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or current in tags
+
+
+async def conditional_get(db, request: Request, response: Response, resource: str, load):
+    """
+    Awaits load(etag) unless the request's If-None-Match names the resource's current version.
+    The version is read before the data, so a concurrent write can only make the ETag older than
+    the body (the next request then refetches), never newer.
+
+    Args:
+        db: Session or AsyncSession from get_db.
+        request (Request): Incoming request.
+        response (Response): Response whose headers receive ETag and Cache-Control.
+        resource (str): Resource the read depends on.
+        load: Callable taking the current ETag and returning an awaitable of the result;
+              cached service reads use the ETag as part of their cache key.
+    Returns:
+        The result of load (sent as-is when it is an encoded JSON body), or a 304 Response.
+    """
+    current = await run_db(db, etag, resource)
+    headers = {"ETag": current, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), current):
+        return Response(status_code=304, headers=headers)
+    result = await load(current)
+    if isinstance(result, bytes):
+        return JSONBytesResponse(result, headers=headers)
+    response.headers.update(headers)
+    return result
@@ -0,0 +1,76 @@
+"""
+Token Version Registry
+----------------------
+Keeps the current token version of each user for claims-only authentication.
+
+Features:
+- Looks up users.token_version at most once per TTL per user (short PK lookup on a miss)
+- Revocation evicts the cached version in every worker (through the invalidation bus),
+  so the next request re-reads it
+- Deleted users are remembered as revoked until the entry expires
+
+Functions:
+- current_version: Returns a user's token version, or None if the user no longer exists
+- revoke: Drops the cached version of a user after their tokens were revoked
+
+Usage:
+common.utils.get_current_user compares the "ver" claim of a token with current_version();
+auth_service calls revoke() after bumping User.token_version or deleting a user.
+"""
+
+from typing import Optional
+from common.cache import TTLCache
+from common import invalidation
+from configuration.config import TOKEN_VERSION_TTL, CACHE_MAX_ENTRIES
+from database.database import SessionLocal
+from models.user_model import User
+
+# Cached value for users that do not exist (TTLCache uses None for "missing").
+_DELETED = -1
+
+_versions = TTLCache(ttl=TOKEN_VERSION_TTL, max_size=CACHE_MAX_ENTRIES, name="token_versions")
+
+
+def current_version(user_id: int) -> Optional[int]:
+    """
+    Returns the current token version of a user.
+
+    Args:
+        user_id (int): ID of the user.
+
+    Variables:
+        version: Cached or freshly loaded token version.
+    Returns:
+        int or None: The token version, or None if the user does not exist.
+    """
+    version = _versions.get(user_id)
+    if version is None:
+        db = SessionLocal()
+        try:
+            version = db.query(User.token_version).filter(User.id == user_id).scalar()
+        finally:
+            db.close()
+        version = _DELETED if version is None else version
+        _versions.set(user_id, version)
+    return None if version == _DELETED else version
+
+
+def revoke(user_id: int):
+    """
+    Drops the cached token version of a user in every worker so that tokens carrying the
+    old version are rejected.
+
+    Args:
+        user_id (int): ID of the user whose tokens were revoked.
+    """
+    invalidation.publish(invalidation.TOKEN_VERSION, user_id)
+
+
+def _evict(user_id: Optional[int]):
+    if user_id is None:
+        _versions.clear()
+    else:
+        _versions.invalidate(user_id)
+
+
+invalidation.subscribe(invalidation.TOKEN_VERSION, _evict)
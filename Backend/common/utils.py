@@ -4,34 +4,36 @@ Utility Functions for Authentication and Security
 Provides helper functions for password hashing, JWT token creation, authentication, and permission checks.
 
 Includes:
-- hash_password: Hashes a plain password
-- verify_password: Verifies a password against a hash
+- hash_password: Hashes a plain password (in the common.hashing worker pool)
+- check_password: Verifies a password against a hash
+- verify_and_update_password: Verifies a password and returns a new hash when the bcrypt cost changed
+- hash_password_async, verify_and_update_password_async: Awaitable versions for async routes
 - create_access_token: Generates a JWT token for authentication
 - validate_password_strength: Checks password strength
 - get_current_user: Dependency to get the current authenticated user
+  (loads the user row, or builds a TokenPrincipal from the token claims when AUTH mode is "claims")
 - Additional helpers for security and permissions
 
 Dependencies:
-- Passlib for secure password hashing
+- Passlib for secure password hashing (run by common.hashing)
 - JOSE for JWT encoding
 - FastAPI for exception handling
 """
 
 from fastapi import Depends
-from database.database import get_db
+from database.database import get_db, run_db
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
+from common import hashing
 from jose import jwt, JWTError
 from datetime import datetime, timedelta
 from fastapi import HTTPException,status
-from configuration.config import JWT_SECRET, EXPIRY
+from configuration.config import JWT_SECRET, EXPIRY, AUTH_MODE
 from fastapi.security import OAuth2PasswordBearer
 from models.user_model import User
+from common import token_versions
+from common import request_context
 
 
-# Password hashing
-password_context=CryptContext(schemes=["bcrypt"],deprecated="auto")
-
 # Settings for token creation
 secret_key = JWT_SECRET
 algorithm="HS256"
@@ -47,7 +49,7 @@ def hash_password(password):
     Returns:
         str: The hashed password.
     """
-    return password_context.hash(password)
+    return hashing.hash_password(password)
 
 
 def check_password(password,hash_password):
@@ -61,7 +63,48 @@ def check_password(password,hash_password):
     Returns:
         bool: True if match, else False.
   """
-  return password_context.verify(password,hash_password)
+  return hashing.verify_password(password,hash_password)[0]
+
+
+def verify_and_update_password(password, hash_password):
+  """
+    Verify a plain password and report whether the stored hash should be replaced.
+
+    Args:
+        password (str): User input password.
+        hash_password (str): Stored hashed password.
+
+    Returns:
+        tuple: (True if match else False, new hash if the stored one uses another bcrypt cost else None).
+  """
+  return hashing.verify_password(password,hash_password)
+
+
+async def hash_password_async(password):
+    """
+    Awaitable version of hash_password.
+
+    Args:
+        password (str): The plain password to hash.
+
+    Returns:
+        str: The hashed password.
+    """
+    return await hashing.hash_password_async(password)
+
+
+async def verify_and_update_password_async(password, hash_password):
+  """
+    Awaitable version of verify_and_update_password.
+
+    Args:
+        password (str): User input password.
+        hash_password (str): Stored hashed password.
+
+    Returns:
+        tuple: (True if match else False, new hash if the stored one uses another bcrypt cost else None).
+  """
+  return await hashing.verify_password_async(password,hash_password)
 
 
 def create_token(data: dict, minutes: int=EXPIRY):
@@ -102,40 +145,112 @@ def validate_password(password: str):
     
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+class TokenPrincipal:
+  """
+  Authenticated user built from verified token claims, used instead of a User row in claims mode.
+
+  Attributes:
+    id (int): User ID ("user_id" claim).
+    username (str): Username ("username" claim).
+    email (str): Email address ("email" claim).
+    role (str): Role at the time the token was issued ("role" claim).
+  """
+  def __init__(self, id: int, username: str, email: str, role: str):
+    self.id = id
+    self.username = username
+    self.email = email
+    self.role = role
+
+
+def _credentials_exception() -> HTTPException:
+  """
+  Builds the 401 error returned for invalid, expired or revoked tokens.
+
+  Returns:
+    HTTPException: 401 Unauthorized with a Bearer challenge.
+  """
+  return HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+  )
+
+
+def _decode_token(token: str) -> dict:
+  """
+  Verifies a JWT and returns its claims.
+
+  Args:
+    token (str): JWT access token.
+
+  Raises:
+    HTTPException: Raises 401 Unauthorized if the token is invalid or has no user_id.
+
+  Returns:
+    dict: The verified claims.
+  """
+  try:
+    payload = jwt.decode(token,secret_key,algorithms=[algorithm])
+  except JWTError:
+    raise _credentials_exception()
+  if payload.get("user_id") is None:
+    raise _credentials_exception()
+  return payload
+
+
+def _load_user(db: Session, user_id: int):
+  return db.query(User).filter(User.id == user_id).first()
+
+
+async def get_user_from_database(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
   '''
   Extract and return the current authenticated user based on the JWt token.
 
   Args:
     token (str): JWT access token ectracted via OAuth2PasswordBearer dependency.
-    db (Session): SQLAlchemy DB session.
+    db: Session or AsyncSession from get_db.
 
   Raises:
-    HTTPException: Raises 401 Unauthorized if the token is invalid or the user in not found.
+    HTTPException: Raises 401 Unauthorized if the token is invalid, revoked or the user in not found.
 
   Returns:
     User: SQLAlchemy User object corresponding to the token's user_id.
   
   '''
-  
-  credentials_exception = HTTPException(
-    status_code=status.HTTP_401_UNAUTHORIZED,
-    detail="Could not validate credentials",
-    headers={"WWW-Authenticate": "Bearer"},
-)
-  try:
-    payload = jwt.decode(token,secret_key,algorithms=[algorithm])
-    user_id: int = payload.get("user_id")
-    if user_id is None:
-        raise credentials_exception
-  except JWTError:
-    raise credentials_exception
-
-  user = db.query(User).filter(User.id == user_id).first()
-  if user is None:
-      raise credentials_exception
+  payload = _decode_token(token)
+  user = await run_db(db, _load_user, payload["user_id"])
+  if user is None or payload.get("ver", 0) != user.token_version:
+      raise _credentials_exception()
+  request_context.set_user(user.id)
   return user
 
+
+def get_principal_from_claims(token: str = Depends(oauth2_scheme)) -> TokenPrincipal:
+  '''
+  Build the current principal straight from the verified token claims, without loading the user row.
+  Revocation still applies: the token's "ver" claim must match the user's current token version,
+  which is cached per user by common.token_versions.
+
+  Args:
+    token (str): JWT access token extracted via OAuth2PasswordBearer dependency.
+
+  Raises:
+    HTTPException: Raises 401 Unauthorized if the token is invalid or has been revoked.
+
+  Returns:
+    TokenPrincipal: Principal with the id, username, email and role claims of the token.
+  '''
+  payload = _decode_token(token)
+  user_id = payload["user_id"]
+  if payload.get("ver", 0) != token_versions.current_version(user_id):
+    raise _credentials_exception()
+  request_context.set_user(user_id)
+  return TokenPrincipal(user_id, payload.get("username"), payload.get("email"), payload.get("role"))
+
+
+# Dependency used by the routes; selected by the [AUTH] mode setting.
+get_current_user = get_principal_from_claims if AUTH_MODE == "claims" else get_user_from_database
+
 def check_comment_permission(comment, current_user):
     """
     Check if the current user is authorized to delete a comment.
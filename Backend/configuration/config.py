@@ -14,6 +14,21 @@ Constants:
 - EXPIRY: Token expiry time (in minutes)
 - DB_USER, DB_PASSWORD, DB_HOST, DB_PORT, DB_NAME: Database connection parameters
 - DATABASE_URL: Full SQLAlchemy database URL
+- AUTO_MIGRATE: Apply pending schema migrations at startup (DATABASE section)
+- ASYNC_MODE: Serve database work through an AsyncEngine (asyncpg) instead of the threadpool (DATABASE section)
+- DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING: Connection pool settings per engine and worker (DATABASE section)
+- DB_TIMING_HEADERS, DB_REPEAT_QUERY_THRESHOLD: Server-Timing / X-DB-Queries response headers, executions of one statement per request before an N+1 warning is logged (DATABASE section)
+- SUMMARY_CACHE_TTL: Seconds a cached user summary stays valid (CACHE section)
+- READ_CACHE_TTL, CACHE_MAX_ENTRIES: Lifetime of cached project/tool/user/task lists and entry limit of each in-process cache (CACHE section)
+- CACHE_INVALIDATION, CACHE_INVALIDATION_CHANNEL: Backend (auto, postgres, memory) and Postgres channel of the cross-worker invalidation bus (CACHE section)
+- LOG_FORMAT, LOG_COMPRESS: "text" or "json" log lines, gzip rotated log files (LOGGING section)
+- LOG_SAMPLE_ROUTES, LOG_SAMPLE_RATE: Route templates whose successful requests are only logged at the given rate (LOGGING section)
+- METRICS_ENABLED, METRICS_DIR, METRICS_FLUSH_INTERVAL: /metrics endpoint, per-worker snapshot directory and write interval (METRICS section)
+- STORAGE_BACKEND, STORAGE_PATH: Attachment blob store backend and location (STORAGE section)
+- MAX_UPLOAD_BYTES, UPLOAD_CHUNK_SIZE: Largest accepted attachment and read size of streamed uploads (STORAGE section)
+- BCRYPT_ROUNDS, HASH_WORKERS, HASH_QUEUE_SIZE, HASH_TIMEOUT: Password hashing pool settings (HASHING section)
+- AUTH_MODE: "database" loads the user row on every request, "claims" trusts the verified token claims (AUTH section)
+- TOKEN_VERSION_TTL: Seconds a user's token version is cached in claims mode (AUTH section)
 
 Functions:
 - load_admin_config: Loads admin credentials (username, email, password) from the [admin] section
@@ -38,6 +53,43 @@ DB_PORT = config["DATABASE"]["port"]
 DB_NAME = config["DATABASE"]["name"]
 
 DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+AUTO_MIGRATE = config.getboolean("DATABASE", "auto_migrate", fallback=True)
+ASYNC_MODE = config.getboolean("DATABASE", "async_mode", fallback=False)
+DB_POOL_SIZE = config.getint("DATABASE", "pool_size", fallback=10)
+DB_MAX_OVERFLOW = config.getint("DATABASE", "max_overflow", fallback=5)
+DB_POOL_TIMEOUT = config.getfloat("DATABASE", "pool_timeout", fallback=30)
+DB_POOL_RECYCLE = config.getint("DATABASE", "pool_recycle", fallback=1800)
+DB_POOL_PRE_PING = config.getboolean("DATABASE", "pool_pre_ping", fallback=False)
+DB_TIMING_HEADERS = config.getboolean("DATABASE", "timing_headers", fallback=True)
+DB_REPEAT_QUERY_THRESHOLD = config.getint("DATABASE", "repeat_query_threshold", fallback=10)
+
+AUTH_MODE = config.get("AUTH", "mode", fallback="database")
+TOKEN_VERSION_TTL = config.getint("AUTH", "token_version_ttl", fallback=30)
+
+BCRYPT_ROUNDS = config.getint("HASHING", "bcrypt_rounds", fallback=12)
+HASH_WORKERS = config.getint("HASHING", "workers", fallback=2)
+HASH_QUEUE_SIZE = config.getint("HASHING", "queue_size", fallback=32)
+HASH_TIMEOUT = config.getfloat("HASHING", "timeout", fallback=10)
+
+STORAGE_BACKEND = config.get("STORAGE", "backend", fallback="filesystem")
+STORAGE_PATH = config.get("STORAGE", "path", fallback="attachment_store")
+MAX_UPLOAD_BYTES = config.getint("STORAGE", "max_upload_bytes", fallback=50 * 1024 * 1024)
+UPLOAD_CHUNK_SIZE = config.getint("STORAGE", "upload_chunk_size", fallback=1024 * 1024)
+
+SUMMARY_CACHE_TTL = config.getint("CACHE", "summary_ttl", fallback=60)
+READ_CACHE_TTL = config.getint("CACHE", "read_ttl", fallback=30)
+CACHE_MAX_ENTRIES = config.getint("CACHE", "max_entries", fallback=1024)
+CACHE_INVALIDATION = config.get("CACHE", "invalidation", fallback="auto").lower()
+CACHE_INVALIDATION_CHANNEL = config.get("CACHE", "invalidation_channel", fallback="cache_invalidation")
+
+LOG_FORMAT = config.get("LOGGING", "format", fallback="text")
+LOG_COMPRESS = config.getboolean("LOGGING", "compress", fallback=True)
+LOG_SAMPLE_ROUTES = {route.strip() for route in config.get("LOGGING", "sample_routes", fallback="").split(",") if route.strip()}
+LOG_SAMPLE_RATE = config.getfloat("LOGGING", "sample_rate", fallback=1.0)
+
+METRICS_ENABLED = config.getboolean("METRICS", "enabled", fallback=True)
+METRICS_DIR = config.get("METRICS", "dir", fallback="metrics")
+METRICS_FLUSH_INTERVAL = config.getfloat("METRICS", "flush_interval", fallback=5)
   
 def load_admin_config():
     """
@@ -0,0 +1,17 @@
+"""
+Declarative Base Module
+-----------------------
+Holds the declarative base class of the ORM models.
+
+Components:
+- Base: Declarative base for ORM models
+
+Usage:
+Models import Base from here, so they can be loaded without creating the engines of
+database/database.py (e.g. by the serialization benchmark, which uses its own SQLite database).
+database/database.py re-exports it for the rest of the app.
+"""
+
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
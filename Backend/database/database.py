@@ -6,30 +6,79 @@ Sets up the SQLAlchemy database engine, session, and base class.
 Components:
 - engine: SQLAlchemy engine for database connection
 - SessionLocal: Factory for database sessions
-- Base: Declarative base for ORM models
+- async_engine, AsyncSessionLocal: Async engine and session factory (only when [DATABASE] async_mode is on)
+- pool_stats: Connection pool measurements per engine ("sync", "async"), see database/pool_stats.py
+  (both engines also count statements per request, see database/query_stats.py)
+- Base: Declarative base for ORM models (defined in database/base.py)
 - get_db: Dependency for providing a session to FastAPI routes
+  (an AsyncSession in async mode, a Session otherwise)
+- run_db: Runs a service function with the request's session without blocking the event loop
 
 Usage:
 Imported by models and API routes to interact with the database.
+Services are written against the synchronous Session API; routes call them through run_db,
+which uses AsyncSession.run_sync in async mode (the async driver does the I/O, no thread
+is held while waiting on Postgres) and the threadpool otherwise.
+The synchronous engine is always created: startup, migrations and CLI tools use it.
 """
 
 from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
-from configuration.config import DATABASE_URL
+from sqlalchemy.pool import QueuePool
+from fastapi.concurrency import run_in_threadpool
+from configuration.config import (
+  DATABASE_URL, ASYNC_MODE, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING
+)
+from database.base import Base
+from database.pool_stats import PoolStats, instrumented_pool
+from database import query_stats
 
+# Async driver used for each database backend in async mode.
+ASYNC_DRIVERS = {
+  "postgresql": "postgresql+asyncpg",
+  "sqlite": "sqlite+aiosqlite",
+}
+
+# Pool settings shared by the sync and async engines ([DATABASE] section).
+POOL_OPTIONS = dict(
+  pool_size=DB_POOL_SIZE,
+  max_overflow=DB_MAX_OVERFLOW,
+  pool_timeout=DB_POOL_TIMEOUT,
+  pool_recycle=DB_POOL_RECYCLE,
+  pool_pre_ping=DB_POOL_PRE_PING,
+)
+
+pool_stats = {"sync": PoolStats("sync", DB_MAX_OVERFLOW)}
 
 engine = create_engine(
   DATABASE_URL,
-  pool_size=10,
-  max_overflow=5,
-  pool_timeout=30,
-  pool_recycle=1800
+  poolclass=instrumented_pool(QueuePool, pool_stats["sync"]),
+  **POOL_OPTIONS
  )
+pool_stats["sync"].attach(engine)
+query_stats.attach(engine)
 
 SessionLocal = sessionmaker(autocommit=False,autoflush=False,bind=engine)
 
-Base = declarative_base()
+async_engine = None
+AsyncSessionLocal = None
+if ASYNC_MODE:
+  from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+  from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+  url = make_url(DATABASE_URL)
+  pool_stats["async"] = PoolStats("async", DB_MAX_OVERFLOW)
+  async_engine = create_async_engine(
+    url.set(drivername=ASYNC_DRIVERS[url.get_backend_name()]),
+    poolclass=instrumented_pool(AsyncAdaptedQueuePool, pool_stats["async"]),
+    **POOL_OPTIONS
+  )
+  pool_stats["async"].attach(async_engine.sync_engine)
+  query_stats.attach(async_engine.sync_engine)
+  # expire_on_commit=False: results are serialized after the session work has finished,
+  # where expired attributes could not be reloaded.
+  AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 def get_db():
     """
@@ -46,4 +95,32 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    """
+    Dependency function providing an AsyncSession (used as get_db in async mode).
+    
+    Variables:
+        db: A new AsyncSession instance from AsyncSessionLocal, closed after the request.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def run_db(db, fn, *args, **kwargs):
+    """
+    Runs a service function that uses the synchronous Session API.
+    The function receives the synchronous session as its first argument.
+    
+    Args:
+        db: Session or AsyncSession from get_db.
+        fn: Function called as fn(session, *args, **kwargs).
+    Returns:
+        The result of fn.
+    """
+    if AsyncSessionLocal is not None and isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+if ASYNC_MODE:
+    get_db = get_async_db
\ No newline at end of file
@@ -0,0 +1,212 @@
+"""
+Connection Pool Instrumentation
+-------------------------------
+Measures how the SQLAlchemy connection pools are used, so pool sizes can be chosen from data.
+
+Features:
+- Checkout wait time histogram (time spent in Pool.connect(), i.e. waiting for a free connection,
+  plus opening one when the pool grows)
+- Connect time histogram (time spent opening new DB connections), to tell pool waits from slow connects
+- Hold time histogram (checkout to checkin), i.e. how long requests keep a connection
+- Checkout timeouts (requests that gave up after pool_timeout)
+- Live checked-out, idle and overflow connection counts from the pool's public size()/checkedout()/
+  checkedin()/overflow() accessors
+- Connection age (time since the DB connection was opened), on checkout and for open connections
+- Only public SQLAlchemy API: the pool and dialect events, and the public Pool.connect() method
+
+Functions:
+- instrumented_pool: Builds a pool class that times every checkout
+- PoolStats.attach: Registers the pool event listeners on an engine
+
+Usage:
+database/database.py creates one PoolStats per engine, passes instrumented_pool(...) as poolclass
+and calls attach(engine). The admin API reports PoolStats.snapshot().
+"""
+
+import threading
+import time
+from sqlalchemy import event, exc
+from common.metrics import Histogram, LATENCY_BUCKETS
+
+# Connection ages in seconds, from 1 s to 2 h.
+AGE_BUCKETS = (1, 10, 60, 300, 900, 1800, 3600, 7200)
+
+
+class PoolStats:
+    """
+    Counters and histograms of one engine's connection pool.
+
+    Attributes:
+        name (str): Label of the engine ("sync" or "async").
+        max_overflow (int): Configured overflow limit, reported with the live counts.
+        wait (Histogram): Seconds spent waiting for a connection on checkout.
+        connect (Histogram): Seconds spent opening new DB connections.
+        held (Histogram): Seconds between checkout and checkin of a connection.
+        age_at_checkout (Histogram): Age in seconds of the connections handed out.
+        checkouts (int): Successful checkouts.
+        timeouts (int): Checkouts that failed with a pool timeout.
+        opened (int): DB connections opened.
+        closed (int): DB connections closed.
+    """
+
+    def __init__(self, name: str, max_overflow: int):
+        self.name = name
+        self.max_overflow = max_overflow
+        self.wait = Histogram(LATENCY_BUCKETS)
+        self.connect = Histogram(LATENCY_BUCKETS)
+        self.held = Histogram(LATENCY_BUCKETS)
+        self.age_at_checkout = Histogram(AGE_BUCKETS)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.opened = 0
+        self.closed = 0
+        self._connected_at = {}
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def attach(self, engine):
+        """
+        Registers the connect/checkout/checkin/close listeners on an engine's pool.
+
+        Args:
+            engine: Sync Engine (for an AsyncEngine pass its sync_engine).
+        """
+        self._pool = engine.pool
+        event.listen(engine, "do_connect", self._on_do_connect)
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "close", self._on_close)
+        event.listen(engine, "close_detached", self._on_close_detached)
+        event.listen(engine, "engine_disposed", self._on_disposed)
+
+    def _on_do_connect(self, dialect, connection_record, cargs, cparams):
+        # dialect event fired right before the DBAPI connect; the pool's "connect" follows it
+        connection_record.info["connect_started"] = time.perf_counter()
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        started = connection_record.info.pop("connect_started", None)
+        if started is not None:
+            self.connect.observe(time.perf_counter() - started)
+        connection_record.info["connected_at"] = time.monotonic()
+        with self._lock:
+            self.opened += 1
+            self._connected_at[id(dbapi_connection)] = connection_record.info["connected_at"]
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        now = time.monotonic()
+        connection_record.info["checked_out_at"] = now
+        connected_at = connection_record.info.get("connected_at")
+        if connected_at is not None:
+            self.age_at_checkout.observe(now - connected_at)
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            self.held.observe(time.monotonic() - checked_out_at)
+
+    def _on_close(self, dbapi_connection, connection_record):
+        self._forget(dbapi_connection)
+
+    def _on_close_detached(self, dbapi_connection):
+        self._forget(dbapi_connection)
+
+    def _on_disposed(self, engine):
+        # dispose() replaces the pool; keep reporting the live one
+        self._pool = engine.pool
+
+    def _forget(self, dbapi_connection):
+        with self._lock:
+            self.closed += 1
+            self._connected_at.pop(id(dbapi_connection), None)
+
+    def record_wait(self, seconds: float, timed_out: bool):
+        """
+        Records one checkout attempt (called by the instrumented pool).
+
+        Args:
+            seconds (float): Time spent in the pool's checkout.
+            timed_out (bool): Whether the checkout failed with a pool timeout.
+        """
+        self.wait.observe(seconds)
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+
+    def snapshot(self) -> dict:
+        """
+        Returns the live pool state and the collected measurements.
+
+        Variables:
+            ages: Ages in seconds of the currently open connections.
+        Returns:
+            dict: Pool sizes, counters, wait/age histograms and percentiles.
+        """
+        now = time.monotonic()
+        with self._lock:
+            ages = [now - connected_at for connected_at in self._connected_at.values()]
+            counters = {"checkouts": self.checkouts, "timeouts": self.timeouts, "opened": self.opened, "closed": self.closed}
+        pool = self._pool
+        return {
+            "engine": self.name,
+            "pool": {
+                "size": pool.size(),
+                "max_overflow": self.max_overflow,
+                "timeout": pool.timeout(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                # overflow() is negative while fewer than pool_size connections are open
+                "overflow_in_use": max(pool.overflow(), 0),
+            },
+            "counters": counters,
+            "wait_seconds": {
+                **self.wait.snapshot(),
+                "p50": self.wait.quantile(0.5),
+                "p95": self.wait.quantile(0.95),
+                "p99": self.wait.quantile(0.99),
+            },
+            "connect_seconds": {
+                **self.connect.snapshot(),
+                "p95": self.connect.quantile(0.95),
+            },
+            "held_seconds": {
+                **self.held.snapshot(),
+                "p50": self.held.quantile(0.5),
+                "p95": self.held.quantile(0.95),
+                "p99": self.held.quantile(0.99),
+            },
+            "connection_age_seconds": {
+                "open": len(ages),
+                "oldest": max(ages, default=0.0),
+                "mean": sum(ages) / len(ages) if ages else 0.0,
+                "at_checkout": self.age_at_checkout.snapshot(),
+            },
+        }
+
+
+def instrumented_pool(base, stats: PoolStats):
+    """
+    Builds a subclass of a QueuePool class whose checkouts are timed into stats.
+    It extends the public Pool.connect(), which every engine checkout goes through; the pool
+    events mark when a connection is handed out, but not when the request for it started.
+    The stats object is a class attribute, so it survives pool re-creation on dispose().
+
+    Args:
+        base: QueuePool or AsyncAdaptedQueuePool.
+        stats (PoolStats): Receives the wait times and timeouts.
+    Returns:
+        type: The instrumented pool class, to pass as create_engine(poolclass=...).
+    """
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = base.connect(self)
+        except exc.TimeoutError:
+            self.stats.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        self.stats.record_wait(time.perf_counter() - start, timed_out=False)
+        return connection
+
+    return type(f"Instrumented{base.__name__}", (base,), {"stats": stats, "connect": connect})
@@ -0,0 +1,108 @@
+"""
+Query Statistics
+----------------
+Counts and times the SQL statements executed for each request, and detects N+1 query patterns.
+
+Features:
+- Hooks the engine's before/after_cursor_execute events (works for the sync and the async engine)
+- Adds to the RequestContext of the running request (common.request_context);
+  statements outside requests (startup, CLI tools) are ignored
+- Groups statements by fingerprint (literals and IN lists collapsed), so the same query
+  issued for different rows is recognised as a repeat
+- Warns when one fingerprint runs more than [DATABASE] repeat_query_threshold times in a request
+
+Functions:
+- attach: Registers the listeners on an engine
+- fingerprint: Normalizes a statement for grouping
+- response_headers: Server-Timing / X-DB-Queries headers for a finished request
+- warn_repeated: Logs the statements of a request that repeated too often
+"""
+
+import re
+import time
+from sqlalchemy import event
+from common import request_context
+from common.logger import logger
+from configuration.config import DB_REPEAT_QUERY_THRESHOLD
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\$?\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|\$\d+|:\w+)(?:\s*,\s*(?:\?|%\(\w+\)s|\$\d+|:\w+))*\s*\)")
+_SPACE = re.compile(r"\s+")
+# Fingerprints are cut to this length; they only need to identify the statement in a log line.
+MAX_FINGERPRINT_LENGTH = 300
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalizes a SQL statement so executions that differ only in their values match.
+
+    Args:
+        statement (str): SQL as sent to the driver.
+    Returns:
+        str: Statement with literals replaced by ? and placeholder lists by (...).
+    """
+    statement = _STRING.sub("?", statement)
+    statement = _IN_LIST.sub("(...)", statement)
+    statement = _NUMBER.sub("?", statement)
+    return _SPACE.sub(" ", statement).strip()[:MAX_FINGERPRINT_LENGTH]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if request_context.current() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    current = request_context.current()
+    if current is None:
+        return
+    starts = conn.info.get("query_start")
+    if starts:
+        current.db_time += time.perf_counter() - starts.pop()
+    current.db_queries += 1
+    key = fingerprint(statement)
+    current.statements[key] = current.statements.get(key, 0) + 1
+
+
+def attach(engine):
+    """
+    Registers the query counting and timing listeners.
+
+    Args:
+        engine: Sync Engine (for an AsyncEngine pass its sync_engine).
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def response_headers(context) -> list:
+    """
+    Builds the response headers reporting the database work of a request.
+
+    Args:
+        context (RequestContext): Context of the request.
+    Returns:
+        list: ASGI header pairs (Server-Timing with the DB time in ms, X-DB-Queries).
+    """
+    return [
+        (b"server-timing", f'db;dur={context.db_time * 1000:.1f};desc="{context.db_queries} queries"'.encode("latin-1")),
+        (b"x-db-queries", str(context.db_queries).encode("latin-1")),
+    ]
+
+
+def warn_repeated(context, method: str, route: str):
+    """
+    Logs a warning for every statement that ran more than DB_REPEAT_QUERY_THRESHOLD times
+    in one request (typically a lazy load or a query inside a loop).
+
+    Args:
+        context (RequestContext): Context of the finished request.
+        method (str): HTTP method.
+        route (str): Route template.
+    """
+    if DB_REPEAT_QUERY_THRESHOLD <= 0:
+        return
+    for statement, count in context.statements.items():
+        if count > DB_REPEAT_QUERY_THRESHOLD:
+            logger.warning(f"Possible N+1: {method} {route} ran the same statement {count} times: {statement}")
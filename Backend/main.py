@@ -4,11 +4,13 @@ Main Application Entry Point
 Initializes and configures the FastAPI application.
 
 Features:
-- Imports and registers route modules for authentication, projects/tasks, comments, summary, and tools
+- Imports and registers route modules for authentication, projects/tasks, comments, summary, tools and admin
 - Sets up CORS middleware for frontend-backend communication
 - Integrates custom logging middleware
+- Records per-route request metrics and serves them on /metrics (when [METRICS] enabled is on)
 - Loads admin configuration and ensures an admin user exists
-- Creates database tables using SQLAlchemy
+- Starts the cache invalidation listener of the worker (see common/invalidation.py)
+- Creates database tables using SQLAlchemy and applies pending schema migrations
 - Registers routers with specific URL prefixes for modular API structure
 
 Usage:
@@ -17,18 +19,26 @@ Run this file to start the FastAPI backend server.
 
 
 
+import asyncio
 from fastapi import FastAPI
 from apis.auth import router as auth_router
 from apis.tasks import router as project_router
 from apis.comments import router as comment_router
 from apis.summary import router as summary_router
 from apis.tools import router as tool_router
+from apis.admin import router as admin_router
+from apis.metrics import router as metrics_router
 from database.database import Base, engine
 from fastapi.middleware.cors import CORSMiddleware
 from common.logging_middleware import LoggingMiddleware
+from common.metrics_middleware import MetricsMiddleware
+from common import request_metrics
 from database.database import SessionLocal
-from configuration.config import load_admin_config
+from configuration.config import load_admin_config, AUTO_MIGRATE, METRICS_ENABLED
+from migrations import runner as migrations
 from services.admin_creation_service import create_admin_if_not_exists
+from common import hashing
+from common import invalidation
 
 app=FastAPI()
 
@@ -42,26 +52,49 @@ app.add_middleware(
 
 app.add_middleware(LoggingMiddleware)
 
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # creating database tables
 Base.metadata.create_all(bind=engine)
 
+# applying schema migrations (indexes, new columns) that create_all cannot add to existing tables
+if AUTO_MIGRATE:
+    migrations.upgrade(engine)
+
 # Including routes for authentication
 app.include_router(auth_router,prefix="/auth")
 app.include_router(project_router,prefix="/project")
 app.include_router(comment_router,prefix="/comment")
 app.include_router(summary_router,prefix="/summary")
 app.include_router(tool_router,prefix="/tool")
+app.include_router(admin_router,prefix="/admin")
+if METRICS_ENABLED:
+    app.include_router(metrics_router)
 
 # Startup event to ensure admin user exists
 @app.on_event("startup")
 def on_startup():
     print("AAAAAA RUNNNNINGGGGG")
+    invalidation.start(engine)
     db = SessionLocal()
     admin_config = load_admin_config()
     create_admin_if_not_exists(db, admin_config)
 
-
-
-
-
-
+# Shutdown event to stop the password hashing worker processes and the cache invalidation listener
+@app.on_event("shutdown")
+def on_shutdown():
+    hashing.shutdown()
+    invalidation.stop()
+
+# Metrics events: each worker writes its metrics snapshot periodically and a last time at shutdown
+if METRICS_ENABLED:
+    @app.on_event("startup")
+    async def start_metrics_flusher():
+        request_metrics.start()
+        app.state.metrics_flusher = asyncio.create_task(request_metrics.flush_periodically())
+
+    @app.on_event("shutdown")
+    async def stop_metrics_flusher():
+        app.state.metrics_flusher.cancel()
+        request_metrics.write_snapshot()
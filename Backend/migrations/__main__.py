@@ -0,0 +1,56 @@
+"""
+Migration Command Line
+----------------------
+Entry point for managing the database schema.
+
+Usage (from the Backend folder):
+    python -m migrations status             # list migrations and whether they are applied
+    python -m migrations upgrade [--to N]   # apply pending migrations
+    python -m migrations downgrade N        # revert migrations newer than revision N
+    python -m migrations explain [--strict] # report hot queries that still use sequential scans
+"""
+
+import argparse
+import sys
+from database.database import engine
+from migrations import runner, explain
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m migrations", description="Manage the database schema.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="List migrations and whether they are applied")
+    upgrade_parser = commands.add_parser("upgrade", help="Apply pending migrations")
+    upgrade_parser.add_argument("--to", type=int, default=None, help="Highest revision to apply")
+    downgrade_parser = commands.add_parser("downgrade", help="Revert migrations newer than a revision")
+    downgrade_parser.add_argument("target", type=int, help="Revision to stay at (0 reverts everything)")
+    explain_parser = commands.add_parser("explain", help="Report hot queries that fall back to sequential scans")
+    explain_parser.add_argument("--strict", action="store_true", help="Exit with status 1 if any sequential scan is found")
+    args = parser.parse_args(argv)
+
+    if args.command == "status":
+        for revision, description, applied in runner.status(engine):
+            print(f"[{'x' if applied else ' '}] {revision:04d} {description}")
+    elif args.command == "upgrade":
+        applied = runner.upgrade(engine, args.to)
+        print(f"Applied: {applied}" if applied else "Database is up to date.")
+    elif args.command == "downgrade":
+        reverted = runner.downgrade(engine, args.target)
+        print(f"Reverted: {reverted}" if reverted else "Nothing to revert.")
+    elif args.command == "explain":
+        report = explain.explain_probes(engine)
+        found = False
+        for name, scans in report.items():
+            if scans:
+                found = True
+                tables = ", ".join(f"{table} (~{rows} rows)" for table, rows in scans)
+                print(f"SEQ SCAN  {name}: {tables}")
+            else:
+                print(f"indexed   {name}")
+        if found and args.strict:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Query Plan Report
+-----------------
+Runs EXPLAIN on the hot-path queries of the service layer and reports which
+ones still fall back to sequential scans.
+
+Features:
+- One probe per hot query, built with the same filters as the service functions
+- Walks the JSON plan tree and collects every Seq Scan node with its table and row estimate
+- Works on PostgreSQL only (EXPLAIN (FORMAT JSON))
+
+Note:
+On small tables the planner prefers a sequential scan even when an index
+exists, so run the report against a database with production-like volumes.
+
+Functions:
+- build_probes: Returns the named probe queries
+- seq_scans: Extracts sequential scan nodes from a JSON plan
+- explain_probes: Explains every probe and returns the findings
+"""
+
+import json
+from datetime import datetime, timedelta
+from sqlalchemy import func
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from models.task_model import Task
+from models.project_model import Project
+from models.tool_model import Tool
+from models.comment_model import Comment
+from models.attachment_model import Attachment
+
+# Representative ids used as filter values; only the plan shape matters.
+SAMPLE_ID = 1
+
+
+def build_probes(session: Session) -> dict:
+    """
+    Builds the probe queries mirroring the service-layer filters.
+
+    Args:
+        session (Session): Session used only to construct the queries.
+
+    Variables:
+        now: Current UTC datetime used by the date filters.
+        soon: Datetime two days from now.
+    Returns:
+        dict: Probe name mapped to an (unexecuted) SQLAlchemy query.
+    """
+    now = datetime.utcnow()
+    soon = now + timedelta(days=2)
+    return {
+        "summary_service.get_user_summary": session.query(func.count(Task.id)).filter(
+            Task.assigned_to == SAMPLE_ID, Task.status != "completed", Task.due_date >= now, Task.due_date <= soon),
+        "summary_service.get_tasks_by_status": session.query(Task).filter(
+            Task.assigned_to == SAMPLE_ID, Task.status == "completed"),
+        "summary_service.get_project_summary": session.query(Project.id, func.count(Task.id)).outerjoin(
+            Task, Task.project_id == Project.id).group_by(Project.id),
+        "task_service.get_tasks_by_project": session.query(Task).filter(Task.project_id == SAMPLE_ID),
+        "task_service.get_attachments_by_task": session.query(Attachment.id).filter(
+            Attachment.task_id == SAMPLE_ID).order_by(Attachment.created_at.desc()),
+        "tool_service.get_tools_by_project": session.query(Tool).filter(Tool.project_id == SAMPLE_ID),
+        "tool_service.get_tasks_by_tool": session.query(Task).filter(
+            Task.project_id == SAMPLE_ID, Task.tool_id == SAMPLE_ID),
+        "comment_service.get_comments_by_task": session.query(Comment).filter(
+            Comment.task_id == SAMPLE_ID).order_by(Comment.created_at, Comment.id),
+    }
+
+
+def seq_scans(plan: dict) -> list:
+    """
+    Collects the sequential scan nodes of a plan tree.
+
+    Args:
+        plan (dict): A node of the EXPLAIN (FORMAT JSON) output.
+    Returns:
+        list: Tuples of (table name, estimated rows) for each Seq Scan node.
+    """
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append((plan.get("Relation Name"), plan.get("Plan Rows")))
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+def explain_probes(engine: Engine) -> dict:
+    """
+    Explains every probe query.
+
+    Args:
+        engine (Engine): Engine connected to a PostgreSQL database.
+    Returns:
+        dict: Probe name mapped to the list of sequential scans in its plan (empty when indexed).
+    Raises:
+        RuntimeError: If the database is not PostgreSQL.
+    """
+    if engine.dialect.name != "postgresql":
+        raise RuntimeError("The query plan report requires PostgreSQL")
+
+    report = {}
+    with engine.connect() as connection, Session(bind=connection) as session:
+        for name, query in build_probes(session).items():
+            compiled = query.statement.compile(dialect=connection.dialect)
+            result = connection.exec_driver_sql("EXPLAIN (FORMAT JSON) " + str(compiled), compiled.params)
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            report[name] = seq_scans(plan[0]["Plan"])
+    return report
@@ -0,0 +1,163 @@
+"""
+Migration Runner
+----------------
+Applies versioned schema migrations to an existing database.
+
+Features:
+- Discovers migration modules in migrations/versions (one module per revision)
+- Records applied revisions in the schema_migrations table
+- Applies each migration in its own transaction
+- Serializes concurrent runners (e.g. several uvicorn workers starting at once) with a Postgres advisory lock
+
+Each migration module defines:
+- revision (int): Unique, increasing revision number
+- description (str): One-line summary shown by the status command
+- upgrade(connection): Applies the change
+- downgrade(connection): Reverts the change
+
+Migrations must be idempotent (CREATE ... IF NOT EXISTS, ADD COLUMN IF NOT EXISTS):
+on a fresh database Base.metadata.create_all has already created every object
+declared on the models before the runner starts.
+
+Functions:
+- discover_migrations: Returns all migration modules ordered by revision
+- applied_revisions: Returns the revisions already recorded in the database
+- upgrade: Applies all pending migrations (optionally up to a target revision)
+- downgrade: Reverts applied migrations down to a target revision
+- status: Lists every migration with its applied state
+"""
+
+import importlib
+import pkgutil
+from datetime import datetime
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, text, select, insert, delete
+from sqlalchemy.engine import Engine
+
+VERSIONS_PACKAGE = "migrations.versions"
+
+# Arbitrary constant key for pg_advisory_xact_lock, shared by all runners.
+ADVISORY_LOCK_KEY = 72104823
+
+metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    metadata,
+    Column("revision", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def discover_migrations() -> list:
+    """
+    Imports every module in migrations/versions and returns them ordered by revision.
+
+    Returns:
+        list: Migration modules sorted by their revision number.
+    Raises:
+        ValueError: If two modules declare the same revision.
+    """
+    package = importlib.import_module(VERSIONS_PACKAGE)
+    modules = [
+        importlib.import_module(f"{VERSIONS_PACKAGE}.{info.name}")
+        for info in pkgutil.iter_modules(package.__path__)
+    ]
+    modules.sort(key=lambda module: module.revision)
+    revisions = [module.revision for module in modules]
+    if len(revisions) != len(set(revisions)):
+        raise ValueError(f"Duplicate migration revisions: {revisions}")
+    return modules
+
+
+def _lock(connection):
+    """
+    Takes a transaction-scoped advisory lock so only one runner migrates at a time.
+
+    Args:
+        connection: Connection with an open transaction.
+    """
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": ADVISORY_LOCK_KEY})
+
+
+def applied_revisions(connection) -> set:
+    """
+    Returns the revisions already recorded in schema_migrations.
+
+    Args:
+        connection: Open SQLAlchemy connection.
+    Returns:
+        set: Applied revision numbers.
+    """
+    metadata.create_all(connection, tables=[schema_migrations])
+    return set(connection.execute(select(schema_migrations.c.revision)).scalars())
+
+
+def upgrade(engine: Engine, target: int = None) -> list:
+    """
+    Applies pending migrations in revision order.
+
+    Args:
+        engine (Engine): Engine connected to the database to migrate.
+        target (int, optional): Highest revision to apply. Defaults to the latest.
+
+    Variables:
+        done: Revisions applied by this call (applied revisions are re-read under the lock).
+    Returns:
+        list: Revisions applied by this call.
+    """
+    done = []
+    for module in discover_migrations():
+        if target is not None and module.revision > target:
+            break
+        with engine.begin() as connection:
+            _lock(connection)
+            if module.revision in applied_revisions(connection):
+                continue
+            module.upgrade(connection)
+            connection.execute(insert(schema_migrations).values(
+                revision=module.revision,
+                description=module.description,
+                applied_at=datetime.utcnow(),
+            ))
+        done.append(module.revision)
+    return done
+
+
+def downgrade(engine: Engine, target: int) -> list:
+    """
+    Reverts applied migrations with a revision greater than target, newest first.
+
+    Args:
+        engine (Engine): Engine connected to the database to migrate.
+        target (int): Revision to stay at (0 reverts everything).
+    Returns:
+        list: Revisions reverted by this call.
+    """
+    done = []
+    for module in reversed(discover_migrations()):
+        if module.revision <= target:
+            break
+        with engine.begin() as connection:
+            _lock(connection)
+            if module.revision not in applied_revisions(connection):
+                continue
+            module.downgrade(connection)
+            connection.execute(delete(schema_migrations).where(schema_migrations.c.revision == module.revision))
+        done.append(module.revision)
+    return done
+
+
+def status(engine: Engine) -> list:
+    """
+    Lists every known migration and whether it has been applied.
+
+    Args:
+        engine (Engine): Engine connected to the database.
+    Returns:
+        list: Tuples of (revision, description, applied).
+    """
+    with engine.begin() as connection:
+        applied = applied_revisions(connection)
+    return [(module.revision, module.description, module.revision in applied) for module in discover_migrations()]
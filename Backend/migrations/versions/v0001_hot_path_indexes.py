@@ -0,0 +1,39 @@
+"""
+Migration 0001 - Hot Path Indexes
+---------------------------------
+Adds the indexes used by the most frequent filters. Tables created by
+Base.metadata.create_all on a fresh database already have them (they are
+declared on the models), so every statement is idempotent.
+
+Indexes:
+- ix_tasks_assigned_to_status_due_date: summary_service user summary and tasks by status
+- ix_tasks_project_id_status: summary_service project summary and tasks by project
+- ix_tasks_project_id_tool_id: tool_service.get_tasks_by_tool
+- ix_comments_task_id: comments of a task
+- ix_attachments_task_id_created_at: task_service.get_attachments_by_task (newest first)
+- ix_tools_project_id: tools of a project
+"""
+
+from sqlalchemy import text
+
+revision = 1
+description = "Composite indexes for summary, tool, comment and attachment queries"
+
+INDEXES = [
+    ("ix_tasks_assigned_to_status_due_date", "tasks", "assigned_to, status, due_date"),
+    ("ix_tasks_project_id_status", "tasks", "project_id, status"),
+    ("ix_tasks_project_id_tool_id", "tasks", "project_id, tool_id"),
+    ("ix_comments_task_id", "comments", "task_id"),
+    ("ix_attachments_task_id_created_at", "attachments", "task_id, created_at"),
+    ("ix_tools_project_id", "tools", "project_id"),
+]
+
+
+def upgrade(connection):
+    for name, table, columns in INDEXES:
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+
+
+def downgrade(connection):
+    for name, _, _ in INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
@@ -0,0 +1,21 @@
+"""
+Migration 0002 - User Token Version
+-----------------------------------
+Adds users.token_version, the per-user counter embedded in access tokens.
+Bumping it (role change, deletion) revokes every token issued before.
+"""
+
+from sqlalchemy import inspect, text
+
+revision = 2
+description = "Per-user token version counter for token revocation"
+
+
+def upgrade(connection):
+    columns = {column["name"] for column in inspect(connection).get_columns("users")}
+    if "token_version" not in columns:
+        connection.execute(text("ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0"))
+
+
+def downgrade(connection):
+    connection.execute(text("ALTER TABLE users DROP COLUMN IF EXISTS token_version"))
@@ -0,0 +1,30 @@
+"""
+Migration 0003 - Attachment Blob Metadata
+-----------------------------------------
+Adds the columns that describe an attachment stored in the blob store
+(storage/blob_store.py) instead of attachments.file_data.
+
+Columns:
+- sha256: Content address of the blob
+- size_bytes: Size of the blob in bytes
+"""
+
+from sqlalchemy import inspect, text
+
+revision = 3
+description = "Attachment sha256/size_bytes columns for the blob store"
+
+
+def upgrade(connection):
+    columns = {column["name"] for column in inspect(connection).get_columns("attachments")}
+    if "sha256" not in columns:
+        connection.execute(text("ALTER TABLE attachments ADD COLUMN sha256 VARCHAR(64)"))
+    if "size_bytes" not in columns:
+        connection.execute(text("ALTER TABLE attachments ADD COLUMN size_bytes BIGINT"))
+    connection.execute(text("CREATE INDEX IF NOT EXISTS ix_attachments_sha256 ON attachments (sha256)"))
+
+
+def downgrade(connection):
+    connection.execute(text("DROP INDEX IF EXISTS ix_attachments_sha256"))
+    connection.execute(text("ALTER TABLE attachments DROP COLUMN IF EXISTS size_bytes"))
+    connection.execute(text("ALTER TABLE attachments DROP COLUMN IF EXISTS sha256"))
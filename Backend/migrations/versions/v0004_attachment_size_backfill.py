@@ -0,0 +1,26 @@
+"""
+Migration 0004 - Attachment Size Backfill
+-----------------------------------------
+Fills attachments.size_bytes for legacy rows whose payload is still stored in
+attachments.file_data, so attachment listings can show sizes without reading payloads.
+
+sha256 is left empty for these rows: it marks attachments that live in the blob store,
+and storage.migrate_blobs sets it when it moves the payload.
+"""
+
+from sqlalchemy import text
+
+revision = 4
+description = "Backfill attachments.size_bytes for legacy rows"
+
+
+def upgrade(connection):
+    connection.execute(text(
+        "UPDATE attachments SET size_bytes = length(file_data) "
+        "WHERE size_bytes IS NULL AND file_data IS NOT NULL"
+    ))
+
+
+def downgrade(connection):
+    # The sizes are derived data and stay valid; nothing to revert.
+    pass
@@ -0,0 +1,23 @@
+"""
+Migration 0005 - Resource Versions
+----------------------------------
+Adds the resource_versions table: one change counter per cached resource, bumped by the
+write paths and used to answer conditional GETs (ETag / If-None-Match) without running the read query.
+"""
+
+from sqlalchemy import text
+
+revision = 5
+description = "Per-resource version counters for ETags"
+
+
+def upgrade(connection):
+    connection.execute(text(
+        "CREATE TABLE IF NOT EXISTS resource_versions ("
+        "resource VARCHAR PRIMARY KEY, "
+        "version BIGINT NOT NULL DEFAULT 0)"
+    ))
+
+
+def downgrade(connection):
+    connection.execute(text("DROP TABLE IF EXISTS resource_versions"))
@@ -0,0 +1,25 @@
+"""
+Migration 0006 - Comment Order Index
+------------------------------------
+Replaces ix_comments_task_id with ix_comments_task_id_created_at on (task_id, created_at, id).
+comment_service.get_comments_by_task returns a task's comments in creation order; the new index
+serves both the filter and the order (and the (created_at, id) cursor of paginated requests), so
+no sort step is needed. Its task_id prefix covers every query the old index served.
+"""
+
+from sqlalchemy import text
+
+revision = 6
+description = "Comments of a task in creation order"
+
+
+def upgrade(connection):
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_comments_task_id_created_at ON comments (task_id, created_at, id)"
+    ))
+    connection.execute(text("DROP INDEX IF EXISTS ix_comments_task_id"))
+
+
+def downgrade(connection):
+    connection.execute(text("CREATE INDEX IF NOT EXISTS ix_comments_task_id ON comments (task_id)"))
+    connection.execute(text("DROP INDEX IF EXISTS ix_comments_task_id_created_at"))
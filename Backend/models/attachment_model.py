@@ -1,6 +1,6 @@
-from sqlalchemy import Column,Date, Integer, String,ForeignKey, DateTime, LargeBinary
-from sqlalchemy.orm import relationship
-from database.database import Base
+from sqlalchemy import Column,Date, Integer, BigInteger, String,ForeignKey, DateTime, LargeBinary, Index
+from sqlalchemy.orm import relationship, deferred
+from database.base import Base
 from datetime import datetime
 
 class Attachment(Base):
@@ -11,16 +11,25 @@ class Attachment(Base):
     id (int): Unique identifier for the attachment.
     task_id (int): ID of the task the file is attached to.
     filename (str): Name of the file.
-    file_data (bytes): Binary data of the file.
+    file_data (bytes): Binary data of the file (legacy rows only; new uploads live in the blob store).
+      Deferred: only loaded when accessed or undeferred by the download path.
+    sha256 (str): SHA-256 hex digest addressing the file in the blob store.
+    size_bytes (int): Size of the file in bytes.
     content_type (str): MIME type of the file.
     created_at (datetime): Timestamp of when the file was uploaded.
     task (relationship): Associated task object.
     """
   __tablename__ = "attachments"
+  __table_args__ = (
+    # attachments by task, newest first
+    Index("ix_attachments_task_id_created_at", "task_id", "created_at"),
+  )
   id = Column(Integer, primary_key=True, index=True)
   task_id = Column(Integer, ForeignKey("tasks.id"))
   filename = Column(String)
-  file_data = Column(LargeBinary)  
+  file_data = deferred(Column(LargeBinary, nullable=True))
+  sha256 = Column(String(64), nullable=True, index=True)
+  size_bytes = Column(BigInteger, nullable=True)
   content_type = Column(String)
   task = relationship("Task", back_populates="attachments")
   created_at = Column(DateTime,default=datetime.utcnow)
\ No newline at end of file
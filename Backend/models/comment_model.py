@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String,ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String,ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
-from database.database import Base
+from database.base import Base
 from datetime import datetime
 class Comment(Base):
   '''
@@ -16,6 +16,10 @@ Represents a comment made by a user on a task.
     task (relationship): Task object the comment is linked to.
   '''
   __tablename__ = "comments"
+  __table_args__ = (
+    # comments of a task in creation order (id breaks ties)
+    Index("ix_comments_task_id_created_at", "task_id", "created_at", "id"),
+  )
 
   id = Column(Integer, primary_key=True, index=True)
   content = Column(String, nullable=False)
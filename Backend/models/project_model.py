@@ -1,6 +1,6 @@
 from sqlalchemy import Column,Integer, String, Date
 from sqlalchemy.orm import relationship
-from database.database import Base
+from database.base import Base
 
 
 class Project(Base):
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, BigInteger, text
+from database.base import Base
+
+
+class ResourceVersion(Base):
+  '''
+  Change counter of a cached resource (e.g. "projects", "users", "tools:3").
+
+  Attributes:
+    resource (str): Name of the resource.
+    version (int): Incremented by every write to the resource; used to build its ETag.
+  '''
+  __tablename__ = "resource_versions"
+  resource = Column(String, primary_key=True)
+  version = Column(BigInteger, nullable=False, default=0, server_default=text("0"))
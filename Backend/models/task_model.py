@@ -19,9 +19,9 @@ Usage:
 Used by SQLAlchemy to map Python objects to database rows for tasks.
 """
 
-from sqlalchemy import Column,Date, Integer, String,ForeignKey,Boolean
+from sqlalchemy import Column,Date, Integer, String,ForeignKey,Boolean,Index
 from sqlalchemy.orm import relationship
-from database.database import Base
+from database.base import Base
 
 
 class Task(Base):
@@ -48,6 +48,14 @@ class Task(Base):
 
   '''
   __tablename__= "tasks"
+  __table_args__ = (
+    # user summary / tasks by status: assigned_to = ? AND status ... AND due_date ...
+    Index("ix_tasks_assigned_to_status_due_date", "assigned_to", "status", "due_date"),
+    # project summary and tasks by project
+    Index("ix_tasks_project_id_status", "project_id", "status"),
+    # tasks by tool
+    Index("ix_tasks_project_id_tool_id", "project_id", "tool_id"),
+  )
   id = Column(Integer, primary_key=True,index=True,autoincrement=True)
   title = Column(String,nullable=False)
   description = Column(String,nullable=False)
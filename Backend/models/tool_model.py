@@ -1,6 +1,6 @@
 from sqlalchemy import Column, Integer, String,ForeignKey
 from sqlalchemy.orm import relationship
-from database.database import Base
+from database.base import Base
 
 class Tool(Base):
   """
@@ -16,6 +16,6 @@ class Tool(Base):
   __tablename__ = 'tools'
   id = Column(Integer,primary_key=True,index=True)
   name = Column(String,nullable=False)
-  project_id = Column(Integer,ForeignKey('projects.id'))
+  project_id = Column(Integer,ForeignKey('projects.id'),index=True)
   project = relationship("Project", back_populates="tools")
   tasks = relationship("Task", back_populates="tool",cascade="all,delete")
\ No newline at end of file
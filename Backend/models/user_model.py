@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, text
 from sqlalchemy.orm import relationship
-from database.database import Base
+from database.base import Base
 from datetime import datetime
 
 class User(Base):
@@ -13,6 +13,7 @@ class User(Base):
     email (str): Email address of the user (unique).
     hashed_password (str): Password stored in a hashed format.
     role (str): Role of the user (e.g., admin, manager, member).
+    token_version (int): Counter embedded in access tokens; bumping it revokes older tokens.
     comments (relationship): List of comments made by the user.
   '''
   __tablename__ = "users"
@@ -21,4 +22,5 @@ class User(Base):
   email  = Column(String,unique=True,nullable=False,index=True,)
   hashed_password = Column(String,nullable=False)
   role = Column(String,default="member")
+  token_version = Column(Integer,nullable=False,default=0,server_default=text("0"))
   comments = relationship("Comment", back_populates="user", cascade="all,delete")
\ No newline at end of file
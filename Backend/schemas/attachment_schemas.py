@@ -9,6 +9,7 @@ Classes:
 
 from pydantic import BaseModel
 from datetime import datetime
+from typing import Optional
 
 
 class AttachmentOut(BaseModel):
@@ -20,11 +21,15 @@ class AttachmentOut(BaseModel):
         filename (str): Name of the attached file.
         task_id (int): ID of the related task.
         created_at (datetime): Timestamp when the attachment was added.
+        size_bytes (int, optional): Size of the file in bytes.
+        sha256 (str, optional): SHA-256 hex digest of the file (None until moved to the blob store).
     """
   id: int 
   filename: str
   task_id: int
   created_at: datetime
+  size_bytes: Optional[int] = None
+  sha256: Optional[str] = None
 
   class Config:
     orm_mode = True
@@ -7,10 +7,12 @@ Classes:
 - CommentBase: Base schema for comment data
 - CommentCreate: For creating a new comment
 - CommentOut: For sending comment details in API responses
+- CommentPage: For sending a cursor-paginated page of comments
 """
 
 from pydantic import BaseModel
 from datetime import datetime
+from typing import Optional, List
 from schemas.user_schemas import UserOut
 
 class CommentBase(BaseModel):
@@ -47,4 +49,15 @@ class CommentOut(CommentBase):
   user: UserOut
 
   class Config:
-    orm_mode = True
\ No newline at end of file
+    orm_mode = True
+
+class CommentPage(BaseModel):
+  """
+    Schema for a cursor-paginated page of comments.
+
+    Attributes:
+        items (List[CommentOut]): Comments on this page.
+        next_cursor (Optional[str]): Cursor for the next page, None on the last page.
+    """
+  items: List[CommentOut]
+  next_cursor: Optional[str]
@@ -6,10 +6,15 @@ Defines Pydantic schemas for project creation and output/response.
 Classes:
 - ProjectCreate: For creating a new project
 - ProjectOut: For sending project details in API responses
+- ProjectPage: For sending a cursor-paginated page of projects
+- ProjectDashboardOut: For sending a project with its tasks or task counts embedded
+- ProjectDashboardPage: For sending a cursor-paginated page of dashboard entries
 """
 
 from pydantic import BaseModel
 from datetime import date
+from typing import Optional, List, Dict
+from schemas.task_schemas import TaskOut
 
 class ProjectCreate(BaseModel):
   """
@@ -40,4 +45,39 @@ class ProjectOut(BaseModel):
   due_date: date
   
   class Config:
-    orm_mode = True
\ No newline at end of file
+    orm_mode = True
+
+class ProjectPage(BaseModel):
+  """
+    Schema for a cursor-paginated page of projects.
+
+    Attributes:
+        items (List[ProjectOut]): Projects on this page.
+        next_cursor (Optional[str]): Cursor for the next page, None on the last page.
+    """
+  items: List[ProjectOut]
+  next_cursor: Optional[str]
+
+class ProjectDashboardOut(BaseModel):
+  """
+    Schema for a dashboard entry: a project with its tasks or task counts embedded.
+
+    Attributes:
+        project (ProjectOut): The project.
+        tasks (Optional[List[TaskOut]]): Tasks of the project (when include=tasks).
+        task_counts (Optional[Dict[str, int]]): Number of tasks per status (when include=counts).
+    """
+  project: ProjectOut
+  tasks: Optional[List[TaskOut]] = None
+  task_counts: Optional[Dict[str, int]] = None
+
+class ProjectDashboardPage(BaseModel):
+  """
+    Schema for a cursor-paginated page of dashboard entries.
+
+    Attributes:
+        items (List[ProjectDashboardOut]): Dashboard entries on this page.
+        next_cursor (Optional[str]): Cursor for the next page, None on the last page.
+    """
+  items: List[ProjectDashboardOut]
+  next_cursor: Optional[str]
@@ -6,6 +6,9 @@ Defines Pydantic schemas for task creation, update, and output.
 Features:
 - TaskCreate: Schema for creating a new task
 - TaskOut: Schema for sending task details in responses
+- TaskPage: Schema for a cursor-paginated page of tasks
+- TaskBulkError, TaskBulkResult: Schemas for the outcome of a bulk task creation
+- TaskBulkUpdate, TaskBulkUpdateResult: Schemas for patching many tasks selected by ids or a filter
 - Field validation for all required attributes
 
 Usage:
@@ -14,7 +17,7 @@ Used by FastAPI endpoints for request validation and response serialization.
 
 from pydantic import BaseModel, EmailStr
 from datetime import datetime, date
-from typing import Optional
+from typing import Optional, List
 
 class TaskCreate(BaseModel):
   """
@@ -69,6 +72,48 @@ class TaskOut(BaseModel):
   class Config:
     orm_mode = True
 
+class TaskPage(BaseModel):
+  """
+    Schema for a cursor-paginated page of tasks.
+
+    Attributes:
+        items (List[TaskOut]): Tasks on this page.
+        next_cursor (Optional[str]): Cursor for the next page, None on the last page.
+    """
+  items: List[TaskOut]
+  next_cursor: Optional[str]
+
+class TaskBulkError(BaseModel):
+  """
+    Schema for an item of a bulk creation that was rejected.
+
+    Attributes:
+        index (int): Position of the item in the request list.
+        detail (str): Reason it was rejected.
+    """
+  index: int
+  detail: str
+
+class TaskBulkCreated(TaskOut):
+  """
+    Schema for a task created by a bulk creation.
+
+    Attributes:
+        index (int): Position of the item in the request list.
+    """
+  index: int
+
+class TaskBulkResult(BaseModel):
+  """
+    Schema for the outcome of a bulk task creation.
+
+    Attributes:
+        created (List[TaskBulkCreated]): Created tasks with their request positions, in request order.
+        errors (List[TaskBulkError]): Rejected items.
+    """
+  created: List[TaskBulkCreated]
+  errors: List[TaskBulkError]
+
 class TaskUpdate(BaseModel):
   """
     Schema for updating task fields (partial updates allowed).
@@ -86,3 +131,45 @@ class TaskUpdate(BaseModel):
   due_date: Optional[date] = None
   start_date: Optional[date] = None
   due_date_change_reason: Optional[str] = None
+
+class TaskBulkPatch(TaskUpdate):
+  """
+    Schema for the fields a bulk update can set: those of TaskUpdate, plus the assignee
+    (bulk updates are for managers, who may reassign tasks).
+
+    Attributes:
+        assigned_to (Optional[int]): New assignee's user ID.
+    """
+  assigned_to: Optional[int] = None
+
+class TaskBulkUpdate(BaseModel):
+  """
+    Schema for applying one patch to many tasks.
+    Tasks are selected by ids and/or the filter fields (all given criteria must match);
+    at least one criterion is required.
+
+    Attributes:
+        ids (Optional[List[int]]): Task IDs.
+        project_id (Optional[int]): Only tasks of this project.
+        tool_id (Optional[int]): Only tasks using this tool.
+        assigned_to (Optional[int]): Only tasks assigned to this user.
+        status (Optional[str]): Only tasks currently in this status (e.g. for a status transition).
+        patch (TaskBulkPatch): Fields to set, e.g. {"status": "completed"} or {"assigned_to": 4}.
+    """
+  ids: Optional[List[int]] = None
+  project_id: Optional[int] = None
+  tool_id: Optional[int] = None
+  assigned_to: Optional[int] = None
+  status: Optional[str] = None
+  patch: TaskBulkPatch
+
+class TaskBulkUpdateResult(BaseModel):
+  """
+    Schema for the outcome of a bulk update.
+
+    Attributes:
+        updated (int): Number of tasks changed.
+        ids (List[int]): IDs of the changed tasks.
+    """
+  updated: int
+  ids: List[int]
@@ -7,11 +7,12 @@ Classes:
 - UserCreate: For user registration
 - UserLogin: For user authentication
 - UserOut: For sending user details in API responses
+- UserPage: For sending a cursor-paginated page of users
 """
 
 from pydantic import BaseModel, EmailStr
 from datetime import datetime, date
-from typing import Optional
+from typing import Optional, List
 
 
 
@@ -59,4 +60,15 @@ class UserOut(BaseModel):
   role: str
 
   class Config:
-    orm_mode = True
\ No newline at end of file
+    orm_mode = True
+
+class UserPage(BaseModel):
+  """
+    Schema for a cursor-paginated page of users.
+
+    Attributes:
+        items (List[UserOut]): Users on this page.
+        next_cursor (Optional[str]): Cursor for the next page, None on the last page.
+    """
+  items: List[UserOut]
+  next_cursor: Optional[str]
@@ -7,11 +7,11 @@ Functions:
 - create_admin_if_not_exists: Creates or promotes a user to admin if not present
 """
 
-from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 from models import user_model as models
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from common.utils import hash_password
+from common import resource_versions
+from services.auth_service import invalidate_user_lists
 
 def create_admin_if_not_exists(db: Session, admin_data: dict):
     """
@@ -31,12 +31,14 @@ def create_admin_if_not_exists(db: Session, admin_data: dict):
     if existing_user:
         if existing_user.role != "admin":
             existing_user.role = "admin"
+            resource_versions.bump(db, resource_versions.USERS)
             db.commit()
+            invalidate_user_lists()
             print("[INFO] Existing user promoted to admin.")
         else:
             print("[INFO] Admin user already exists.")
     else:
-        hashed_password = pwd_context.hash(admin_data["password"])
+        hashed_password = hash_password(admin_data["password"])
         admin_user = models.User(
             username=admin_data["username"],
             email=admin_data["email"],
@@ -44,5 +46,7 @@ def create_admin_if_not_exists(db: Session, admin_data: dict):
             role="admin"
         )
         db.add(admin_user)
+        resource_versions.bump(db, resource_versions.USERS)
         db.commit()
+        invalidate_user_lists()
         print("[INFO] Admin user created.")
@@ -4,76 +4,122 @@ Authentication Service
 Service layer for user registration, login, and role management.
 
 Functions:
-- register_user: Registers a new user
-- login_user: Authenticates a user and returns a token
+- register_user: Registers a new user (async: password hashing is awaited between database steps)
+- login_user: Authenticates a user and returns a token (async, like register_user)
 - change_user_role: Changes a user's role
+- get_all_users: Lists users, optionally paginated
+- get_all_users_cached: Cached get_all_users returning the encoded JSON body
+- invalidate_user_lists: Drops the cached user lists after a write
 """
 
 from fastapi import HTTPException, status
 import common.utils as utils
+from common import token_versions
+from common import resource_versions
 from sqlalchemy.orm import Session
 from models.user_model import User
+from common.pagination import paginate
+from common.fast_json import columns_for, encode_rows
+from common.cache import TTLCache
+from common import invalidation
+from database.database import run_db
+from schemas.user_schemas import UserOut
+from configuration.config import READ_CACHE_TTL, CACHE_MAX_ENTRIES
+from typing import Optional
 
-def register_user(db: Session, user):
+# Columns of the user list, in UserOut's field order.
+USER_COLUMNS = columns_for(UserOut, User)
+
+# Encoded user lists, keyed by (etag, cursor, limit); see task_service._project_list_cache.
+_user_list_cache = TTLCache(ttl=READ_CACHE_TTL, max_size=CACHE_MAX_ENTRIES, name="user_lists")
+
+def invalidate_user_lists():
+    invalidation.publish(invalidation.USER_LISTS)
+
+invalidation.subscribe(invalidation.USER_LISTS, lambda key: _user_list_cache.clear())
+
+def _find_user_by_email(db: Session, email: str) -> Optional[User]:
+    return db.query(User).filter(User.email == email).first()
+
+def _add_user(db: Session, username: str, email: str, hashed: str) -> User:
+    new_user = User(username=username, email=email, hashed_password=hashed)
+    db.add(new_user)
+    resource_versions.bump(db, resource_versions.USERS)
+    db.commit()
+    invalidate_user_lists()
+    db.refresh(new_user)
+    return new_user
+
+def _set_password_hash(db: Session, db_user: User, hashed: str):
+    db_user.hashed_password = hashed
+    db.commit()
+
+async def register_user(db: Session, user):
     """
     Registers a new user in the database after validating the password and checking for email uniqueness.
     
     Args:
-        db (Session): SQLAlchemy database session for DB operations.
+        db: Session or AsyncSession from get_db.
         user: UserCreate schema containing username, email, and password.
     
     Variables:
         existing_user: The user object found by email, if any.
         hashed: The hashed version of the user's password.
-        new_user: The new User object to be added.
     Returns:
         The created User object.
     Raises:
         HTTPException: If the email already exists.
     """
     utils.validate_password(user.password)
-    existing_user = db.query(User).filter(User.email == user.email).first()
+    existing_user = await run_db(db, _find_user_by_email, user.email)
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already exists")
     
-    hashed = utils.hash_password(user.password)
-    new_user = User(username=user.username, email=user.email, hashed_password=hashed)
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-    return new_user
+    hashed = await utils.hash_password_async(user.password)
+    return await run_db(db, _add_user, user.username, user.email, hashed)
 
-def login_user(db: Session, user):
+async def login_user(db: Session, user):
     """
     Authenticates a user and returns a JWT token if credentials are valid.
+    Rehashes the password when it was stored with a different bcrypt cost.
     
     Args:
-        db (Session): SQLAlchemy database session for DB operations.
+        db: Session or AsyncSession from get_db.
         user: UserLogin schema containing email and password.
     
     Variables:
         db_user: The user object found by email, if any.
-        token: The generated JWT token for the user.
+        valid: Whether the password matches.
+        new_hash: Replacement hash when the bcrypt cost changed, else None.
+        claims: Token claims, read before the rehash commit may expire db_user.
     Returns:
         A dictionary with the access token and token type.
     Raises:
         HTTPException: If credentials are invalid.
     """
-    db_user = db.query(User).filter(User.email == user.email).first()
-    if not db_user or not utils.check_password(user.password, db_user.hashed_password):
+    db_user = await run_db(db, _find_user_by_email, user.email)
+    if not db_user:
         raise HTTPException(status_code=400, detail="Wrong email or Password")
-    
-    token = utils.create_token({
+    valid, new_hash = await utils.verify_and_update_password_async(user.password, db_user.hashed_password)
+    if not valid:
+        raise HTTPException(status_code=400, detail="Wrong email or Password")
+    claims = {
         "user_id": db_user.id,
         "username": db_user.username,
         "email": db_user.email,
-        "role": db_user.role
-    })
+        "role": db_user.role,
+        "ver": db_user.token_version
+    }
+    if new_hash:
+        await run_db(db, _set_password_hash, db_user, new_hash)
+    
+    token = utils.create_token(claims)
     return {"access_token": token, "token_type": "bearer"}
 
 def change_user_role(db: Session, user_id: int, role: str):
     """
-    Changes the role of a user in the database.
+    Changes the role of a user in the database and revokes the user's existing tokens,
+    since they carry the old role.
     
     Args:
         db (Session): SQLAlchemy database session for DB operations.
@@ -93,20 +139,46 @@ def change_user_role(db: Session, user_id: int, role: str):
     if role not in ["admin", "manager", "member"]:
         raise HTTPException(status_code=400, detail="Invalid role")
     user.role = role
+    user.token_version = (user.token_version or 0) + 1
+    resource_versions.bump(db, resource_versions.USERS)
     db.commit()
+    invalidate_user_lists()
     db.refresh(user)
+    token_versions.revoke(user.id)
     return user
 
-def get_all_users(db: Session):
+def get_all_users(db: Session, cursor: Optional[str] = None, limit: Optional[int] = None):
     """
-    Retrieves all users from the database.
+    Retrieves all users from the database, optionally one page at a time.
     
     Args:
         db (Session): SQLAlchemy database session for DB operations.
+        cursor (str, optional): Cursor returned with the previous page.
+        limit (int, optional): Page size. Pagination is used when cursor or limit is given.
     Returns:
-        List of User objects.
+        List of row tuples (UserOut columns), or a page dict with "items" and "next_cursor".
     """
-    return db.query(User).all()
+    query = db.query(*USER_COLUMNS)
+    if cursor is not None or limit is not None:
+        return paginate(query, User.id, cursor, limit)
+    return query.all()
+
+async def get_all_users_cached(db, version: str, cursor: Optional[str] = None, limit: Optional[int] = None):
+    """
+    Cached get_all_users; the rows are encoded to the UserOut JSON shape before they are cached.
+
+    Args:
+        db: Session or AsyncSession from get_db.
+        version (str): Current ETag of the user list (see resource_versions.conditional_get).
+        cursor (str, optional): Cursor returned with the previous page.
+        limit (int, optional): Page size.
+    Returns:
+        bytes: JSON list of users, or a JSON page with "items" and "next_cursor".
+    """
+    def load(session):
+        return encode_rows(get_all_users(session, cursor, limit), UserOut.model_fields)
+
+    return await _user_list_cache.get_or_load((version, cursor, limit), lambda: run_db(db, load))
 
 def delete_user(db: Session, user_id: int, current_user: User):
     """
@@ -130,5 +202,8 @@ def delete_user(db: Session, user_id: int, current_user: User):
             detail="Admin access required"
         )
     db.delete(user)
+    resource_versions.bump(db, resource_versions.USERS)
     db.commit()
+    invalidate_user_lists()
+    token_versions.revoke(user_id)
     return {"message": f"User '{user.username}' deleted successfully"}
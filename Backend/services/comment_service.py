@@ -5,18 +5,38 @@ Service layer for creating, retrieving, updating, and deleting comments on tasks
 
 Functions:
 - create_comment: Adds a new comment to a task
-- get_comments_by_task: Retrieves all comments for a task
+- get_comments_by_task: Retrieves all comments for a task in creation order, with their authors, as row tuples
+- get_comments_by_task_json: Same, encoded to the CommentOut JSON shape
 - delete_comment: Deletes a comment by its ID
 - update_comment: Updates a comment's content
 """
 
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
-from schemas.comment_schemas import CommentCreate
+from sqlalchemy.orm import Session, joinedload
+from schemas.comment_schemas import CommentCreate, CommentOut
+from schemas.user_schemas import UserOut
 from models.comment_model import Comment
 from models.task_model import Task
 from models.user_model import User
 from common.utils import check_comment_permission
+from common.pagination import paginate
+from common.fast_json import encode_rows
+from typing import Optional
+
+# CommentOut's own fields, followed by the UserOut columns of the author (labelled, since
+# User.id would clash with Comment.id).
+COMMENT_FIELDS = [name for name in CommentOut.model_fields if name != "user"]
+COMMENT_COLUMNS = [getattr(Comment, name) for name in COMMENT_FIELDS] + [
+    getattr(User, name).label(f"author_{name}") for name in UserOut.model_fields
+]
+# Creation order; the id breaks ties between comments created in the same instant.
+COMMENT_ORDER = (Comment.created_at, Comment.id)
+
+
+def _with_author(db: Session, comment_id: int) -> Comment:
+    # CommentOut embeds the author; load it here, since in async mode the response
+    # is serialized after the session work has finished and cannot lazy-load.
+    return db.query(Comment).options(joinedload(Comment.user)).filter(Comment.id == comment_id).first()
 
 
 def create_comment(task_id: int, comment_in: CommentCreate, db: Session, current_user: User) -> Comment:
@@ -48,21 +68,51 @@ def create_comment(task_id: int, comment_in: CommentCreate, db: Session, current
     )
     db.add(comment)
     db.commit()
-    db.refresh(comment)
-    return comment
+    return _with_author(db, comment.id)
 
 
-def get_comments_by_task(task_id: int, db: Session) -> list[Comment]:
+def get_comments_by_task(task_id: int, db: Session, cursor: Optional[str] = None, limit: Optional[int] = None):
     """
-    Retrieves all comments for a specific task.
+    Retrieves the comments for a specific task, oldest first, optionally one page at a time.
+    The authors' UserOut columns come from a join in the same statement, so the number of
+    queries does not grow with the number of comments; ix_comments_task_id_created_at serves
+    the filter and the order.
     
     Args:
         task_id (int): ID of the task.
         db (Session): SQLAlchemy database session for DB operations.
+        cursor (str, optional): Cursor returned with the previous page.
+        limit (int, optional): Page size. Pagination is used when cursor or limit is given.
     Returns:
-        List of Comment objects for the task.
+        List of row tuples (COMMENT_COLUMNS), or a page dict with "items" and "next_cursor".
     """
-    return db.query(Comment).filter(Comment.task_id == task_id).all()
+    query = db.query(*COMMENT_COLUMNS).join(User, User.id == Comment.user_id).filter(Comment.task_id == task_id)
+    if cursor is not None or limit is not None:
+        return paginate(query, COMMENT_ORDER, cursor, limit)
+    return query.order_by(*COMMENT_ORDER).all()
+
+
+def _comment_shape(row) -> dict:
+    split = len(COMMENT_FIELDS)
+    comment = dict(zip(COMMENT_FIELDS, row[:split]))
+    comment["user"] = dict(zip(UserOut.model_fields, row[split:]))
+    return comment
+
+
+def get_comments_by_task_json(task_id: int, db: Session, cursor: Optional[str] = None, limit: Optional[int] = None) -> bytes:
+    """
+    Returns the comments of a task encoded to the CommentOut JSON shape, without building
+    ORM objects or validating each row.
+
+    Args:
+        task_id (int): ID of the task.
+        db (Session): SQLAlchemy database session for DB operations.
+        cursor (str, optional): Cursor returned with the previous page.
+        limit (int, optional): Page size.
+    Returns:
+        bytes: JSON list of comments, or a JSON page with "items" and "next_cursor".
+    """
+    return encode_rows(get_comments_by_task(task_id, db, cursor, limit), None, _comment_shape)
 
 
 def delete_comment(comment_id: int, db: Session, current_user: User) -> None:
@@ -113,5 +163,4 @@ def update_comment(comment_id: int, updated: CommentCreate, db: Session, current
 
     comment.content = updated.content
     db.commit()
-    db.refresh(comment)
-    return comment
+    return _with_author(db, comment.id)
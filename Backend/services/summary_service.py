@@ -4,79 +4,202 @@ Summary Service
 Provides business logic for generating user and project summaries, and filtering tasks by status.
 
 Functions:
-- get_user_summary: Returns summary stats for a user
+- get_user_summary: Returns summary stats for a user (cached per user)
+- get_all_user_summaries: Returns summary stats for every user in one query
+- invalidate_user_summary: Drops a user's cached summary after their tasks change
 - get_project_summary: Returns summary stats for all projects
 - get_tasks_by_status: Returns tasks filtered by status and user
 """
 
 # services/summary_service.py
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
 from models import task_model as models
+from models.project_model import Project
+from models.user_model import User
 from fastapi import HTTPException
+from sqlalchemy import func, case, and_
 from sqlalchemy.orm import Session
 from fastapi import Query
+from typing import Optional
+from common.pagination import paginate
+from common.cache import TTLCache
+from common import invalidation
+from configuration.config import SUMMARY_CACHE_TTL, CACHE_MAX_ENTRIES
+
+# Per-user summaries, keyed by user id. Entries also expire so that the
+# overdue/soon-due counters follow the clock between task writes.
+_user_summary_cache = TTLCache(ttl=SUMMARY_CACHE_TTL, max_size=CACHE_MAX_ENTRIES, name="user_summary")
+
+
+def _summary_columns():
+    """
+    Builds the conditional counts shared by the single-user and bulk summaries.
+
+    Variables:
+        now: Current UTC datetime.
+        soon: Datetime two days from now.
+        open_task: Condition matching tasks that are not completed.
+    Returns:
+        Tuple of labelled aggregate columns (assigned, completed, overdue, soon_due).
+    """
+    now = datetime.utcnow()
+    soon = now + timedelta(days=2)
+    open_task = models.Task.status != "completed"
+    return (
+        func.count(models.Task.id).label("assigned"),
+        func.count(case((models.Task.status == "completed", 1))).label("completed"),
+        func.count(case((and_(models.Task.due_date < now, open_task), 1))).label("overdue"),
+        func.count(case((and_(models.Task.due_date >= now, models.Task.due_date <= soon, open_task), 1))).label("soon_due"),
+    )
+
+
+def invalidate_user_summary(user_id: Optional[int]):
+    """
+    Drops the cached summary of a user in every worker. Called by the task write paths.
+
+    Args:
+        user_id (int, optional): ID of the user whose tasks changed. None is ignored.
+    """
+    if user_id is not None:
+        invalidation.publish(invalidation.USER_SUMMARY, user_id)
+
+def _evict_user_summary(user_id: Optional[int]):
+    if user_id is None:
+        _user_summary_cache.clear()
+    else:
+        _user_summary_cache.invalidate(user_id)
+
+invalidation.subscribe(invalidation.USER_SUMMARY, _evict_user_summary)
 
 def get_user_summary(db: Session, user):
     """
     Returns summary statistics for a user, including assigned, completed, overdue, and soon-due tasks.
+    All four counters come from one query and the result is cached until one of the user's tasks changes.
     
     Args:
         db (Session): SQLAlchemy database session for DB operations.
         user: The user object for whom to generate the summary.
     
     Variables:
-        now: Current UTC datetime.
-        soon: Datetime two days from now.
-        assigned: Count of tasks assigned to the user.
-        completed: Count of completed tasks.
-        overdue: Count of overdue tasks.
-        soon_due: Count of tasks due soon.
+        row: Aggregated counters for the user's tasks.
     Returns:
         Dictionary with summary statistics for the user.
     """
-    now = datetime.utcnow()
-    soon = now + timedelta(days=2)
+    def load():
+        row = db.query(*_summary_columns()).filter(models.Task.assigned_to == user.id).one()
+        return {
+            "username": user.id,
+            "assigned_tasks": row.assigned,
+            "completed_tasks": row.completed,
+            "overdue_tasks": row.overdue,
+            "soon_due_tasks": row.soon_due
+        }
+
+    # a task write committed while the counts were read invalidates the summary meanwhile,
+    # and the counts read before it are then not stored
+    return _user_summary_cache.get_or_load_sync(user.id, load)
+
+def get_all_user_summaries(db: Session, cursor: Optional[str] = None, limit: Optional[int] = None):
+    """
+    Returns summary statistics for every user in a single grouped query.
+    
+    Args:
+        db (Session): SQLAlchemy database session for DB operations.
+        cursor (str, optional): Cursor returned with the previous page.
+        limit (int, optional): Page size. Pagination is used when cursor or limit is given.
+    
+    Variables:
+        query: Users left-joined with their assigned tasks, grouped per user.
+    Returns:
+        List of dictionaries with summary statistics per user, or a page dict with "items" and "next_cursor".
+    """
+    query = (
+        db.query(User.id.label("id"), User.username.label("username"), *_summary_columns())
+        .outerjoin(models.Task, models.Task.assigned_to == User.id)
+        .group_by(User.id, User.username)
+    )
 
-    assigned = db.query(models.Task).filter(models.Task.assigned_to == user.id).count()
-    completed = db.query(models.Task).filter(models.Task.assigned_to == user.id, models.Task.status == "completed").count()
-    overdue = db.query(models.Task).filter(models.Task.assigned_to == user.id, models.Task.due_date < now, models.Task.status != "completed").count()
-    soon_due = db.query(models.Task).filter(models.Task.assigned_to == user.id, models.Task.due_date >= now, models.Task.due_date <= soon, models.Task.status != "completed").count()
+    def to_summary(row):
+        return {
+            "user_id": row.id,
+            "username": row.username,
+            "assigned_tasks": row.assigned,
+            "completed_tasks": row.completed,
+            "overdue_tasks": row.overdue,
+            "soon_due_tasks": row.soon_due
+        }
 
-    return {
-        "username": user.id,
-        "assigned_tasks": assigned,
-        "completed_tasks": completed,
-        "overdue_tasks": overdue,
-        "soon_due_tasks": soon_due
-    }
+    if cursor is not None or limit is not None:
+        page = paginate(query, User.id, cursor, limit)
+        page["items"] = [to_summary(row) for row in page["items"]]
+        return page
+    return [to_summary(row) for row in query.order_by(User.id).all()]
 
-def get_project_summary(db: Session):
+def get_project_summary(
+    db: Session,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    open_only: bool = False,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+):
     """
     Returns summary statistics for all projects, including total, completed, and pending tasks per project.
+    All counts come from a single grouped query, so the number of round trips does not grow with the number of projects.
     
     Args:
         db (Session): SQLAlchemy database session for DB operations.
+        start (date, optional): Only include projects still running on or after this date.
+        end (date, optional): Only include projects starting on or before this date.
+        open_only (bool): Only include projects that still have pending tasks.
+        cursor (str, optional): Cursor returned with the previous page.
+        limit (int, optional): Page size. Pagination is used when cursor or limit is given.
     
     Variables:
-        projects: List of all Project objects.
-        result: List of summary dictionaries for each project.
-        tasks: Query for tasks in each project.
+        completed: Conditional count of completed tasks per project.
+        pending: Conditional count of tasks that are not completed per project.
+        query: Grouped aggregate query over projects left-joined with their tasks.
+        rows: Aggregated rows (one per project).
     Returns:
-        List of dictionaries with project summary statistics.
+        List of dictionaries with project summary statistics, or a page dict with "items" and "next_cursor".
     """
-    projects = db.query(models.Project).all()
-    result = []
-    for project in projects:
-        tasks = db.query(models.Task).filter(models.Task.project_id == project.id)
-        result.append({
-            "project_name": project.title,
-            "total_tasks": tasks.count(),
-            "completed_tasks": tasks.filter(models.Task.status == "completed").count(),
-            "pending_tasks": tasks.filter(models.Task.status != "completed").count()
-        })
-    return result
-
-def get_tasks_by_status(db: Session, user, status: str, user_id: int = Query(None)):
+    completed = func.count(case((models.Task.status == "completed", 1)))
+    pending = func.count(case((models.Task.status != "completed", 1)))
+
+    query = (
+        db.query(
+            Project.id.label("id"),
+            Project.title.label("title"),
+            func.count(models.Task.id).label("total"),
+            completed.label("completed"),
+            pending.label("pending"),
+        )
+        .outerjoin(models.Task, models.Task.project_id == Project.id)
+        .group_by(Project.id, Project.title)
+    )
+    if start is not None:
+        query = query.filter(Project.due_date >= start)
+    if end is not None:
+        query = query.filter(Project.start_date <= end)
+    if open_only:
+        query = query.having(pending > 0)
+
+    def to_summary(row):
+        return {
+            "project_id": row.id,
+            "project_name": row.title,
+            "total_tasks": row.total,
+            "completed_tasks": row.completed,
+            "pending_tasks": row.pending
+        }
+
+    if cursor is not None or limit is not None:
+        page = paginate(query, Project.id, cursor, limit)
+        page["items"] = [to_summary(row) for row in page["items"]]
+        return page
+    return [to_summary(row) for row in query.order_by(Project.id).all()]
+
+def get_tasks_by_status(db: Session, user, status: str, user_id: int = Query(None), cursor: Optional[str] = None, limit: Optional[int] = None):
     """
     Returns tasks filtered by status and optionally by user.
     
@@ -85,6 +208,8 @@ def get_tasks_by_status(db: Session, user, status: str, user_id: int = Query(Non
         user: The user requesting the data.
         status (str): Status to filter tasks by.
         user_id (int, optional): User ID to filter tasks for a specific user.
+        cursor (str, optional): Cursor returned with the previous page.
+        limit (int, optional): Page size. Pagination is used when cursor or limit is given.
     
     Variables:
         now: Current UTC datetime.
@@ -92,7 +217,7 @@ def get_tasks_by_status(db: Session, user, status: str, user_id: int = Query(Non
         target_user_id: The user ID to filter tasks for.
         query: SQLAlchemy query for tasks.
     Returns:
-        List of Task objects matching the criteria.
+        List of Task objects matching the criteria, or a page dict with "items" and "next_cursor".
     Raises:
         HTTPException: If not authorized.
     """
@@ -118,4 +243,6 @@ def get_tasks_by_status(db: Session, user, status: str, user_id: int = Query(Non
     else:
         raise HTTPException(status_code=400, detail="Invalid status filter")
 
+    if cursor is not None or limit is not None:
+        return paginate(query, models.Task.id, cursor, limit)
     return query.all()
@@ -11,22 +11,92 @@ Features:
 
 Functions:
 - create_task: Validates and creates a new task
+- create_tasks_bulk: Validates and creates many tasks with one project lookup and one INSERT
 - update_task: Updates an existing task
+- update_tasks_bulk: Applies one patch to many tasks with a single UPDATE statement
 - delete_task: Removes a task from the database
+- get_project_dashboard: Lists projects with their tasks or task counts embedded
+- get_all_projects_cached / get_tasks_by_project_cached: Cached reads returning encoded JSON bodies
+- invalidate_project_lists / invalidate_task_lists: Drop cached reads after a write
 - Additional helpers for task operations
 """
 
 from fastapi import HTTPException
-from datetime import date
+from fastapi.concurrency import run_in_threadpool
+from datetime import date, datetime, timezone
+from sqlalchemy import func, insert, update, case
 from sqlalchemy.orm import Session
 from models.task_model import Task
 from models.project_model import Project
 from models.attachment_model import Attachment
-from schemas.task_schemas import TaskCreate, TaskUpdate
-from schemas.project_schemas import ProjectCreate
-from fastapi.responses import StreamingResponse
-from io import BytesIO
-from typing import Tuple, Optional
+from models.user_model import User
+from models.tool_model import Tool
+from schemas.task_schemas import TaskCreate, TaskUpdate, TaskBulkUpdate
+from schemas.task_schemas import TaskOut
+from schemas.project_schemas import ProjectCreate, ProjectOut
+from fastapi.responses import StreamingResponse, FileResponse, Response
+from email.utils import formatdate, parsedate_to_datetime
+from mimetypes import guess_type
+from typing import Tuple, Optional, List
+from common.pagination import paginate
+from common.fast_json import columns_for, encode_rows
+from common.cache import TTLCache
+from common import invalidation
+from services.summary_service import invalidate_user_summary
+from storage.blob_store import get_blob_store
+from common import resource_versions
+from database.database import run_db
+from configuration.config import MAX_UPLOAD_BYTES, UPLOAD_CHUNK_SIZE, READ_CACHE_TTL, CACHE_MAX_ENTRIES
+
+# Largest number of tasks accepted by one bulk creation request.
+MAX_BULK_TASKS = 1000
+
+# Columns read by the list endpoints, in the order of the response schemas' fields.
+TASK_COLUMNS = columns_for(TaskOut, Task)
+PROJECT_COLUMNS = columns_for(ProjectOut, Project)
+
+# Encoded project lists, keyed by (etag, cursor, limit); the ETag ties an entry to one
+# version of the list, so entries never outlive a write committed by another worker.
+_project_list_cache = TTLCache(ttl=READ_CACHE_TTL, max_size=CACHE_MAX_ENTRIES, name="project_lists")
+# Encoded task lists, keyed by (project_id, cursor, limit).
+_task_list_cache = TTLCache(ttl=READ_CACHE_TTL, max_size=CACHE_MAX_ENTRIES, name="task_lists")
+
+def invalidate_project_lists():
+    invalidation.publish(invalidation.PROJECT_LISTS)
+
+def invalidate_task_lists(project_id: Optional[int] = None):
+    """
+    Drops the cached task lists of a project (of every project when project_id is None)
+    in every worker. Write paths call it after committing.
+    """
+    invalidation.publish(invalidation.TASK_LISTS, project_id)
+
+def _evict_task_lists(project_id: Optional[int]):
+    if project_id is None:
+        _task_list_cache.clear()
+    else:
+        _task_list_cache.invalidate_group(project_id)
+
+invalidation.subscribe(invalidation.PROJECT_LISTS, lambda key: _project_list_cache.clear())
+invalidation.subscribe(invalidation.TASK_LISTS, _evict_task_lists)
+
+def _task_date_error(task: TaskCreate, project) -> Optional[str]:
+    """
+    Checks a new task's dates against its project.
+
+    Args:
+        task (TaskCreate): Task to check.
+        project: Project (or row) with start_date and due_date.
+    Returns:
+        str: Error message, or None if the dates are valid.
+    """
+    if task.start_date < project.start_date or task.start_date > project.due_date:
+        return "Task start date must be within the project's start and due dates."
+    if task.due_date < project.start_date or task.due_date > project.due_date:
+        return "Task due date must be within the project's start and due dates."
+    if task.due_date < task.start_date:
+        return "Task due date cannot be before start date."
+    return None
 
 def create_task(db: Session, task: TaskCreate) -> Tuple[Optional[Task], Optional[str]]:
     """
@@ -46,38 +116,114 @@ def create_task(db: Session, task: TaskCreate) -> Tuple[Optional[Task], Optional
     project = db.query(Project).filter(Project.id == task.project_id).first()
     if not project:
         return None, "Project not found"
-    if task.start_date < project.start_date or task.start_date > project.due_date:
-        raise HTTPException(
-            status_code=400, 
-            detail="Task start date must be within the project's start and due dates."
-        )
-    if task.due_date < project.start_date or task.due_date > project.due_date:
-        raise HTTPException(
-            status_code=400, 
-            detail="Task due date must be within the project's start and due dates."
-        )
-    if task.due_date < task.start_date:
-        raise HTTPException(
-            status_code=400, 
-            detail="Task due date cannot be before start date."
-        )
+    date_error = _task_date_error(task, project)
+    if date_error:
+        raise HTTPException(status_code=400, detail=date_error)
     task = Task(**task.dict())
     db.add(task)
     db.commit()
     db.refresh(task)
+    invalidate_user_summary(task.assigned_to)
+    invalidate_task_lists(task.project_id)
     return task, None
 
-def get_tasks_by_project(db: Session, project_id: int):
+def create_tasks_bulk(db: Session, tasks: List[TaskCreate], atomic: bool = False) -> Tuple[List[dict], List[dict]]:
+    """
+    Validates and creates many tasks at once.
+    The referenced projects, users and tools are loaded with one query each, the accepted tasks
+    are inserted with one multi-row INSERT ... RETURNING, and everything is committed in one transaction.
+
+    Args:
+        db (Session): SQLAlchemy database session for DB operations.
+        tasks (List[TaskCreate]): Tasks to create.
+        atomic (bool): Create nothing if any item is rejected.
+
+    Variables:
+        projects: Project id -> (id, start_date, due_date) row of every referenced project.
+        users: Ids of the referenced users that exist.
+        tools: Tool id -> project id of every referenced tool.
+        accepted: Column values of the valid items.
+        indexes: Request position of each accepted item.
+        errors: {"index", "detail"} of every rejected item.
+    Returns:
+        Tuple of (created tasks as TaskOut dicts with their "index" in the request, in request order, errors).
+    """
+    project_ids = {task.project_id for task in tasks}
+    projects = {
+        row.id: row
+        for row in db.query(Project.id, Project.start_date, Project.due_date).filter(Project.id.in_(project_ids))
+    }
+    user_ids = {task.assigned_to for task in tasks}
+    users = {user_id for user_id, in db.query(User.id).filter(User.id.in_(user_ids))}
+    tool_ids = {task.tool_id for task in tasks}
+    tools = dict(db.query(Tool.id, Tool.project_id).filter(Tool.id.in_(tool_ids)).all())
+    accepted = []
+    indexes = []
+    errors = []
+    for index, task in enumerate(tasks):
+        project = projects.get(task.project_id)
+        if project is None:
+            error = "Project not found"
+        elif task.assigned_to not in users:
+            error = "User not found"
+        elif task.tool_id not in tools:
+            error = "Tool not found"
+        elif tools[task.tool_id] != task.project_id:
+            error = "Tool does not belong to the project"
+        else:
+            error = _task_date_error(task, project)
+        if error:
+            errors.append({"index": index, "detail": error})
+        else:
+            accepted.append(task.dict())
+            indexes.append(index)
+    if not accepted or (atomic and errors):
+        return [], errors
+
+    # sort_by_parameter_order pairs every returned row with its parameter set (SQLite
+    # falls back to one INSERT per row for it; Postgres keeps the batched INSERT)
+    rows = db.execute(insert(Task).returning(*TASK_COLUMNS, sort_by_parameter_order=True), accepted).all()
+    created = [dict(zip(TaskOut.model_fields, row), index=index) for index, row in zip(indexes, rows)]
+    db.commit()
+    for user_id in {task["assigned_to"] for task in created}:
+        invalidate_user_summary(user_id)
+    for project_id in {task["project_id"] for task in created}:
+        invalidate_task_lists(project_id)
+    return created, errors
+
+def get_tasks_by_project(db: Session, project_id: int, cursor: Optional[str] = None, limit: Optional[int] = None):
     """
-    Retrieves all tasks for a specific project.
+    Retrieves the tasks for a specific project, optionally one page at a time.
     
     Args:
         db (Session): SQLAlchemy database session for DB operations.
         project_id (int): ID of the project.
+        cursor (str, optional): Cursor returned with the previous page.
+        limit (int, optional): Page size. Pagination is used when cursor or limit is given.
     Returns:
-        List of Task objects for the project.
+        List of row tuples (TaskOut columns), or a page dict with "items" and "next_cursor".
     """
-    return db.query(Task).filter(Task.project_id == project_id).all()
+    query = db.query(*TASK_COLUMNS).filter(Task.project_id == project_id)
+    if cursor is not None or limit is not None:
+        return paginate(query, Task.id, cursor, limit)
+    return query.all()
+
+async def get_tasks_by_project_cached(db, project_id: int, cursor: Optional[str] = None, limit: Optional[int] = None):
+    """
+    Cached get_tasks_by_project; the rows are encoded to the TaskOut JSON shape before they are cached.
+
+    Args:
+        db: Session or AsyncSession from get_db.
+        project_id (int): ID of the project.
+        cursor (str, optional): Cursor returned with the previous page.
+        limit (int, optional): Page size.
+    Returns:
+        bytes: JSON list of tasks, or a JSON page with "items" and "next_cursor".
+    """
+    def load(session):
+        return encode_rows(get_tasks_by_project(session, project_id, cursor, limit), TaskOut.model_fields)
+
+    return await _task_list_cache.get_or_load((project_id, cursor, limit), lambda: run_db(db, load))
 
 def update_task(db: Session, task_id: int, task_in: TaskUpdate):
     """
@@ -90,6 +236,8 @@ def update_task(db: Session, task_id: int, task_in: TaskUpdate):
     
     Variables:
         task: The Task object found by task_id.
+        old_assigned_to, old_project_id: Assignee and project before the update; their cached
+                                         summary and task list are invalidated too.
     Returns:
         Tuple of (updated Task object or None, error message or None).
     Raises:
@@ -103,12 +251,81 @@ def update_task(db: Session, task_id: int, task_in: TaskUpdate):
     if old_due_date != new_due_date:
         task.due_date_edited = True
         task.due_date_change_reason = task_in.due_date_change_reason
+    # a reassigned or moved task also leaves the previous assignee's summary and project's list
+    old_assigned_to = task.assigned_to
+    old_project_id = task.project_id
     for key, value in task_in.dict(exclude_unset=True).items():
         setattr(task, key, value)
     db.commit()
     db.refresh(task)
+    for user_id in {old_assigned_to, task.assigned_to}:
+        invalidate_user_summary(user_id)
+    for project_id in {old_project_id, task.project_id}:
+        invalidate_task_lists(project_id)
     return task, None
 
+def update_tasks_bulk(db: Session, request: TaskBulkUpdate) -> Tuple[Optional[List[int]], Optional[str]]:
+    """
+    Applies a patch to every task matching the ids and/or filter of the request, with one
+    UPDATE ... WHERE ... RETURNING statement. The due date bookkeeping of update_task is done
+    per row in SQL: where the new due date differs from the stored one, due_date_edited is set
+    and due_date_change_reason takes the reason from the patch.
+
+    Args:
+        db (Session): SQLAlchemy database session for DB operations.
+        request (TaskBulkUpdate): Selection criteria and patch.
+
+    Variables:
+        conditions: WHERE clauses built from the ids and filter fields.
+        values: SET clauses.
+        old_rows: (assigned_to, project_id) of the selected tasks before the update.
+        rows: (id, assigned_to, project_id) of the updated tasks.
+    Returns:
+        Tuple of (sorted IDs of the updated tasks or None, error message or None).
+    """
+    conditions = []
+    if request.ids is not None:
+        conditions.append(Task.id.in_(request.ids))
+    for field in ("project_id", "tool_id", "assigned_to", "status"):
+        value = getattr(request, field)
+        if value is not None:
+            conditions.append(getattr(Task, field) == value)
+    if not conditions:
+        return None, "Give task ids or at least one filter"
+    patch = request.patch.dict(exclude_unset=True)
+    if not patch:
+        return None, "Nothing to update"
+
+    values = {key: value for key, value in patch.items() if key != "due_date_change_reason"}
+    reason = patch.get("due_date_change_reason", Task.due_date_change_reason)
+    if "due_date" in patch:
+        due_date_changed = Task.due_date != patch["due_date"]
+        # SET expressions see the row before the update, so this compares against the old due date
+        values["due_date_edited"] = case((due_date_changed, True), else_=Task.due_date_edited)
+        values["due_date_change_reason"] = case((due_date_changed, patch.get("due_date_change_reason")), else_=reason)
+    elif "due_date_change_reason" in patch:
+        values["due_date_change_reason"] = reason
+
+    if patch.get("assigned_to") is not None and db.query(User.id).filter(User.id == patch["assigned_to"]).first() is None:
+        return None, "User not found"
+
+    # RETURNING gives the values after the update; the previous assignees and projects are read
+    # (and the rows locked) first, so their summaries and task lists are invalidated too
+    old_rows = db.query(Task.assigned_to, Task.project_id).filter(*conditions).with_for_update().all()
+    rows = db.execute(
+        update(Task)
+        .where(*conditions)
+        .values(**values)
+        .returning(Task.id, Task.assigned_to, Task.project_id)
+        .execution_options(synchronize_session=False)
+    ).all()
+    db.commit()
+    for user_id in {row.assigned_to for row in old_rows} | {row.assigned_to for row in rows}:
+        invalidate_user_summary(user_id)
+    for project_id in {row.project_id for row in old_rows} | {row.project_id for row in rows}:
+        invalidate_task_lists(project_id)
+    return sorted(row.id for row in rows), None
+
 def delete_task(db: Session, task_id: int):
     """
     Removes a task from the database.
@@ -122,40 +339,71 @@ def delete_task(db: Session, task_id: int):
     task = db.query(Task).filter(Task.id == task_id).first()
     if not task:
         return None, "Task not found"
+    assignee = task.assigned_to
+    project_id = task.project_id
     db.delete(task)
     db.commit()
+    invalidate_user_summary(assignee)
+    invalidate_task_lists(project_id)
     return task, None
 
 async def upload_attachment(db: Session, task_id: int, file) -> Tuple[Optional[dict], Optional[str]]:
     """
     Uploads an attachment (EML or PDF file) to a task.
+    The file is streamed to the blob store in UPLOAD_CHUNK_SIZE chunks and hashed on the way,
+    so at most one chunk is held in memory; the attachments row keeps only its metadata.
     
     Args:
-        db (Session): SQLAlchemy database session for DB operations.
+        db: Session or AsyncSession from get_db.
         task_id (int): ID of the task to attach the file to.
         file: The file object uploaded by the user.
     
+    Variables:
+        writer: Blob writer receiving the chunks.
+        chunk: Bytes read from the upload in one step.
     Returns:
         Tuple of (attachment info dictionary or None, error message or None).
+    Raises:
+        HTTPException: 413 if the file is larger than MAX_UPLOAD_BYTES.
     """
     filename = file.filename.lower()
     if not (filename.endswith(".eml") or filename.endswith(".pdf")):
         return None, "Only .eml or .pdf files are allowed"
-    content = await file.read()
+    too_large = HTTPException(status_code=413, detail=f"Attachments are limited to {MAX_UPLOAD_BYTES} bytes")
+    if (getattr(file, "size", None) or 0) > MAX_UPLOAD_BYTES:
+        raise too_large
+    writer = await run_in_threadpool(get_blob_store().open_writer)
+    try:
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            if writer.size + len(chunk) > MAX_UPLOAD_BYTES:
+                raise too_large
+            await run_in_threadpool(writer.write, chunk)
+        sha256, size_bytes = await run_in_threadpool(writer.commit)
+    except BaseException:
+        await run_in_threadpool(writer.abort)
+        raise
     attachment = Attachment(
         filename=file.filename,
         content_type=file.content_type,
-        file_data=content,
+        sha256=sha256,
+        size_bytes=size_bytes,
         task_id=task_id,
     )
+    return await run_db(db, _save_attachment, attachment), None
+
+def _save_attachment(db: Session, attachment: Attachment) -> dict:
     db.add(attachment)
     db.commit()
     db.refresh(attachment)
-    return {"filename": attachment.filename, "id": attachment.id}, None
+    return {"filename": attachment.filename, "id": attachment.id}
 
 def get_attachments_by_task(task_id: int, db: Session,):
     """
     Retrieves all attachments for a specific task, ordered by creation date.
+    Only metadata is selected; the deferred file_data column is never loaded here.
     
     Args:
         task_id (int): ID of the task.
@@ -165,26 +413,104 @@ def get_attachments_by_task(task_id: int, db: Session,):
     """
     return db.query(Attachment).filter(Attachment.task_id == task_id).order_by(Attachment.created_at.desc()).all()
 
-def download_attachment(attachment_id: int, db: Session):
+def _iter_chunks(fileobj, chunk_size: int = 64 * 1024):
+    """
+    Yields a binary file object in fixed-size chunks and closes it at the end.
+    
+    Args:
+        fileobj: Binary file object to read.
+        chunk_size (int): Bytes per chunk.
+    """
+    with fileobj:
+        while True:
+            chunk = fileobj.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+def _attachment_headers(attachment: Attachment, etag: str) -> dict:
+    """
+    Builds the caching headers of an attachment download.
+    Attachment contents never change, so the ETag is the content hash and Last-Modified is the upload time.
+    
+    Args:
+        attachment (Attachment): The attachment being downloaded.
+        etag (str): Quoted entity tag of the content.
+    Returns:
+        dict: Response headers.
+    """
+    last_modified = (attachment.created_at or datetime.utcnow()).replace(tzinfo=timezone.utc)
+    return {
+        "ETag": etag,
+        "Last-Modified": formatdate(last_modified.timestamp(), usegmt=True),
+        "Cache-Control": "private, max-age=0, must-revalidate",
+    }
+
+def _not_modified(request_headers, headers: dict) -> bool:
+    """
+    Evaluates If-None-Match / If-Modified-Since (If-None-Match wins when both are sent).
+    
+    Args:
+        request_headers: Headers of the download request.
+        headers (dict): Headers built by _attachment_headers.
+    Returns:
+        bool: True if the client's copy is current and a 304 can be sent.
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        return resource_versions.etag_matches(if_none_match, headers["ETag"])
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        return parsedate_to_datetime(headers["Last-Modified"]) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+def download_attachment(attachment_id: int, db: Session, request_headers=None):
     """
     Downloads an attachment by its ID.
+    A legacy row (payload still in attachments.file_data) is moved to the blob store on its first
+    download, so later downloads and revalidations never load the payload from the table.
+    Blob store files are served by FileResponse, which answers Range requests with 206
+    (honouring If-Range) and hands the file to the server with http.response.pathsend
+    when the server supports it; otherwise the file is sent in chunks.
     
     Args:
         attachment_id (int): ID of the attachment to download.
         db (Session): SQLAlchemy database session for DB operations.
+        request_headers (optional): Request headers, for conditional requests.
+    
+    Variables:
+        store: The blob store holding the file.
+        sha256: Content hash of the file, also its ETag.
+        path: Local file of the blob, None when the store keeps no local files.
+        headers: ETag, Last-Modified and Cache-Control of the download.
     Returns:
-        StreamingResponse for the attachment file.
+        FileResponse, StreamingResponse or a 304 Response.
     Raises:
         HTTPException: If the attachment is not found.
     """
     attachment = db.query(Attachment).filter(Attachment.id == attachment_id).first()
     if not attachment:
         raise HTTPException(status_code=404, detail="Attachment not found")
-    return StreamingResponse(
-        BytesIO(attachment.file_data),
-        media_type="message/rfc822",
-        headers={"Content-Disposition": f"attachment; filename={attachment.filename}"},
-    )
+    store = get_blob_store()
+    if not attachment.sha256:
+        # legacy row not yet moved by storage.migrate_blobs: move it the way the migration does
+        attachment.sha256, attachment.size_bytes = store.put(attachment.file_data or b"")
+        attachment.file_data = None
+        db.commit()
+    sha256 = attachment.sha256
+    media_type = attachment.content_type or guess_type(attachment.filename)[0] or "application/octet-stream"
+    headers = _attachment_headers(attachment, f'"{sha256}"')
+    if request_headers is not None and _not_modified(request_headers, headers):
+        return Response(status_code=304, headers=headers)
+
+    path = store.local_path(sha256)
+    if path is not None:
+        return FileResponse(path, media_type=media_type, headers=headers, filename=attachment.filename)
+    headers["Content-Disposition"] = f'attachment; filename="{attachment.filename}"'
+    return StreamingResponse(_iter_chunks(store.open(sha256)), media_type=media_type, headers=headers)
 
 def create_project(db: Session, project_in: ProjectCreate):
     """
@@ -208,20 +534,117 @@ def create_project(db: Session, project_in: ProjectCreate):
     if project.due_date < project.start_date:
         raise HTTPException(status_code=400, detail="Project due date cannot be before start date.")
     db.add(project)
+    resource_versions.bump(db, resource_versions.PROJECTS)
     db.commit()
+    invalidate_project_lists()
     db.refresh(project)
     return project
 
-def get_all_projects(db: Session):
+def get_all_projects(db: Session, cursor: Optional[str] = None, limit: Optional[int] = None):
+    """
+    Retrieves all projects from the database, optionally one page at a time.
+    
+    Args:
+        db (Session): SQLAlchemy database session for DB operations.
+        cursor (str, optional): Cursor returned with the previous page.
+        limit (int, optional): Page size. Pagination is used when cursor or limit is given.
+    Returns:
+        List of row tuples (ProjectOut columns), or a page dict with "items" and "next_cursor".
+    """
+    query = db.query(*PROJECT_COLUMNS)
+    if cursor is not None or limit is not None:
+        return paginate(query, Project.id, cursor, limit)
+    return query.all()
+
+async def get_all_projects_cached(db, version: str, cursor: Optional[str] = None, limit: Optional[int] = None):
+    """
+    Cached get_all_projects; the rows are encoded to the ProjectOut JSON shape before they are cached.
+
+    Args:
+        db: Session or AsyncSession from get_db.
+        version (str): Current ETag of the project list (see resource_versions.conditional_get).
+        cursor (str, optional): Cursor returned with the previous page.
+        limit (int, optional): Page size.
+    Returns:
+        bytes: JSON list of projects, or a JSON page with "items" and "next_cursor".
+    """
+    def load(session):
+        return encode_rows(get_all_projects(session, cursor, limit), ProjectOut.model_fields)
+
+    return await _project_list_cache.get_or_load((version, cursor, limit), lambda: run_db(db, load))
+
+def get_project_dashboard(
+    db: Session,
+    include: str = "tasks",
+    assigned_to: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+):
     """
-    Retrieves all projects from the database.
+    Lists projects with their tasks (or per-status task counts) embedded, in a fixed number of queries:
+    one for the projects and one batched query for the tasks or counts of all of them.
     
     Args:
         db (Session): SQLAlchemy database session for DB operations.
+        include (str): "tasks" to embed the task list, "counts" to embed per-status counts.
+        assigned_to (int, optional): Only projects (and tasks) assigned to this user.
+        cursor (str, optional): Cursor returned with the previous page.
+        limit (int, optional): Page size. Pagination is used when cursor or limit is given.
+    
+    Variables:
+        query: Query for the projects.
+        projects: Projects on this page.
+        tasks: Query for the tasks of those projects.
+        entries: Dashboard entries keyed by project id.
     Returns:
-        List of all Project objects.
+        List of dashboard entries, or a page dict with "items" and "next_cursor".
+    Raises:
+        HTTPException: If include is not "tasks" or "counts".
     """
-    return db.query(Project).all()
+    if include not in ("tasks", "counts"):
+        raise HTTPException(status_code=400, detail="include must be 'tasks' or 'counts'")
+
+    query = db.query(Project)
+    if assigned_to is not None:
+        query = query.filter(Project.id.in_(
+            db.query(Task.project_id).filter(Task.assigned_to == assigned_to)
+        ))
+    page = None
+    if cursor is not None or limit is not None:
+        page = paginate(query, Project.id, cursor, limit)
+        projects = page["items"]
+    else:
+        projects = query.order_by(Project.id).all()
+
+    entries = {project.id: {"project": project} for project in projects}
+    if entries:
+        if include == "tasks":
+            tasks = db.query(Task).filter(Task.project_id.in_(list(entries)))
+            if assigned_to is not None:
+                tasks = tasks.filter(Task.assigned_to == assigned_to)
+            for entry in entries.values():
+                entry["tasks"] = []
+            for task in tasks.order_by(Task.id):
+                entries[task.project_id]["tasks"].append(task)
+        else:
+            counts = db.query(Task.project_id, Task.status, func.count(Task.id)).filter(
+                Task.project_id.in_(list(entries))
+            )
+            if assigned_to is not None:
+                counts = counts.filter(Task.assigned_to == assigned_to)
+            for entry in entries.values():
+                entry["task_counts"] = {}
+            for project_id, status, count in counts.group_by(Task.project_id, Task.status):
+                # status falls back to the column default for rows written without one
+                status = status or "pending"
+                task_counts = entries[project_id]["task_counts"]
+                task_counts[status] = task_counts.get(status, 0) + count
+
+    items = list(entries.values())
+    if page is not None:
+        page["items"] = items
+        return page
+    return items
 
 def delete_project(db: Session, project_id: int):
     """
@@ -230,13 +653,28 @@ def delete_project(db: Session, project_id: int):
     Args:
         db (Session): SQLAlchemy database session for DB operations.
         project_id (int): ID of the project to delete.
+    Variables:
+        assignees: Distinct users assigned to the project's tasks, whose summaries are invalidated.
     Returns:
         Tuple of (deleted Project object or None, error message or None).
     """
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
         return None, "Project not found"
+    # the project's tasks are deleted with it, so their assignees' summaries change
+    assignees = [
+        user_id for user_id, in
+        db.query(Task.assigned_to).filter(Task.project_id == project_id).distinct()
+    ]
     db.delete(project)
+    # the project's tools are deleted with it
+    resource_versions.bump(db, resource_versions.PROJECTS)
+    resource_versions.bump(db, resource_versions.tools_resource(project_id))
     db.commit()
+    # the tool list entries are keyed by the bumped version and simply age out
+    invalidate_project_lists()
+    invalidate_task_lists(project_id)
+    for user_id in assignees:
+        invalidate_user_summary(user_id)
     return project, None
 
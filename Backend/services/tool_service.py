@@ -7,6 +7,8 @@ Handles validation, permission checks, and database operations.
 Functions:
 - create_tool_for_project: Adds a new tool to a project
 - get_tools_by_project: Retrieves all tools for a project
+- get_tools_by_project_cached: Cached read of a project's tools, returned as an encoded JSON body
+- invalidate_tool_lists: Drops a project's cached tool lists after a write
 - delete_tool_by_id: Deletes a tool by its ID
 """
 
@@ -16,8 +18,36 @@ from models.tool_model import Tool
 from models.project_model import Project 
 from models.task_model import Task 
 from models.user_model import User
-from schemas.tool_schemas import ToolCreate
-from typing import List
+from schemas.tool_schemas import ToolCreate, ToolOut
+from typing import List, Optional
+from common import resource_versions
+from common.cache import TTLCache
+from common.fast_json import columns_for, encode_rows
+from common import invalidation
+from database.database import run_db
+from services import task_service
+from services.summary_service import invalidate_user_summary
+from configuration.config import READ_CACHE_TTL, CACHE_MAX_ENTRIES
+
+# Columns of the tool list, in ToolOut's field order.
+TOOL_COLUMNS = columns_for(ToolOut, Tool)
+
+# Encoded tool lists, keyed by (project_id, etag); see task_service._project_list_cache.
+_tool_list_cache = TTLCache(ttl=READ_CACHE_TTL, max_size=CACHE_MAX_ENTRIES, name="tool_lists")
+
+
+def invalidate_tool_lists(project_id: int):
+    invalidation.publish(invalidation.TOOL_LISTS, project_id)
+
+
+def _evict_tool_lists(project_id: Optional[int]):
+    if project_id is None:
+        _tool_list_cache.clear()
+    else:
+        _tool_list_cache.invalidate_group(project_id)
+
+
+invalidation.subscribe(invalidation.TOOL_LISTS, _evict_tool_lists)
 
 
 def create_tool_for_project(db: Session, project_id: int, tool_in: ToolCreate, current_user: User) -> Tool:
@@ -46,12 +76,14 @@ def create_tool_for_project(db: Session, project_id: int, tool_in: ToolCreate, c
 
     new_tool = Tool(name=tool_in.name, project_id=project_id)
     db.add(new_tool)
+    resource_versions.bump(db, resource_versions.tools_resource(project_id))
     db.commit()
+    invalidate_tool_lists(project_id)
     db.refresh(new_tool)
     return new_tool
 
 
-def get_tools_by_project(db: Session, project_id: int) -> List[Tool]:
+def get_tools_by_project(db: Session, project_id: int):
     """
     Retrieves all tools for a specific project.
     
@@ -59,9 +91,26 @@ def get_tools_by_project(db: Session, project_id: int) -> List[Tool]:
         db (Session): SQLAlchemy database session for DB operations.
         project_id (int): ID of the project.
     Returns:
-        List of Tool objects for the project.
+        List of row tuples (ToolOut columns) for the project.
     """
-    return db.query(Tool).filter(Tool.project_id == project_id).all()
+    return db.query(*TOOL_COLUMNS).filter(Tool.project_id == project_id).all()
+
+
+async def get_tools_by_project_cached(db, project_id: int, version: str) -> bytes:
+    """
+    Cached get_tools_by_project; the rows are encoded to the ToolOut JSON shape before they are cached.
+
+    Args:
+        db: Session or AsyncSession from get_db.
+        project_id (int): ID of the project.
+        version (str): Current ETag of the project's tools (see resource_versions.conditional_get).
+    Returns:
+        bytes: JSON list of tools.
+    """
+    def load(session):
+        return encode_rows(get_tools_by_project(session, project_id), ToolOut.model_fields)
+
+    return await _tool_list_cache.get_or_load((project_id, version), lambda: run_db(db, load))
 
 
 def delete_tool_by_id(db: Session, tool_id: int, current_user: User) -> None:
@@ -76,6 +125,7 @@ def delete_tool_by_id(db: Session, tool_id: int, current_user: User) -> None:
     Variables:
         tool: The Tool object found by tool_id.
         project: The Project object associated with the tool.
+        assignees: Distinct users assigned to the tool's tasks, whose summaries are invalidated.
     Returns:
         None
     Raises:
@@ -92,8 +142,18 @@ def delete_tool_by_id(db: Session, tool_id: int, current_user: User) -> None:
     if current_user.role not in ["admin", "manager"]:
         raise HTTPException(status_code=403, detail="You cannot delete this")
 
+    # the tool's tasks are deleted with it, so their assignees' summaries change
+    assignees = [
+        user_id for user_id, in
+        db.query(Task.assigned_to).filter(Task.tool_id == tool_id).distinct()
+    ]
     db.delete(tool)
+    resource_versions.bump(db, resource_versions.tools_resource(tool.project_id))
     db.commit()
+    invalidate_tool_lists(tool.project_id)
+    task_service.invalidate_task_lists(tool.project_id)
+    for user_id in assignees:
+        invalidate_user_summary(user_id)
 
 
 def get_tasks_by_tool(db: Session, project_id: int, tool_id: int) -> List[Task]:
@@ -0,0 +1,229 @@
+"""
+Attachment Blob Store
+---------------------
+Stores attachment payloads outside the database, addressed by their SHA-256 hash.
+
+Features:
+- Content addressing: identical uploads are stored once
+- Atomic writes (temporary file + rename), so readers never see partial blobs
+- Incremental writers that hash while writing, for uploads streamed in chunks
+- Pluggable backends selected by the [STORAGE] backend setting (local filesystem by default)
+
+Classes:
+- BlobStore: Interface every backend implements
+- BlobWriter: Incremental writer returned by BlobStore.open_writer()
+- FilesystemBlobStore: Keeps blobs under a local directory as <root>/<ab>/<cd>/<sha256>
+- FilesystemBlobWriter: Writes a blob chunk by chunk into a temporary file
+
+Functions:
+- get_blob_store: Returns the configured store (created once per process)
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+from configuration.config import STORAGE_BACKEND, STORAGE_PATH
+
+
+class BlobStore(ABC):
+    """
+    Interface for attachment storage backends.
+
+    Methods:
+        put(data): Stores bytes and returns (sha256, size).
+        open_writer(): Returns a BlobWriter to store a blob chunk by chunk.
+        exists(sha256): Tells whether a blob is stored.
+        open(sha256): Opens a stored blob for binary reading.
+        delete(sha256): Removes a stored blob.
+        local_path(sha256): Local file of a blob, or None when the backend keeps no local files.
+    """
+
+    @abstractmethod
+    def put(self, data: bytes) -> Tuple[str, int]:
+        ...
+
+    @abstractmethod
+    def open_writer(self) -> "BlobWriter":
+        ...
+
+    @abstractmethod
+    def exists(self, sha256: str) -> bool:
+        ...
+
+    @abstractmethod
+    def open(self, sha256: str):
+        ...
+
+    @abstractmethod
+    def delete(self, sha256: str):
+        ...
+
+    def local_path(self, sha256: str) -> Optional[str]:
+        """
+        Returns the path of a blob on the local filesystem, so it can be served as a file.
+
+        Args:
+            sha256 (str): Hex digest of the blob.
+        Returns:
+            str or None: The file path, or None if the backend has no local file (the default).
+        """
+        return None
+
+
+class BlobWriter(ABC):
+    """
+    Incremental blob writer. The SHA-256 digest is computed while writing, so the
+    payload never has to be held in memory.
+
+    Attributes:
+        size (int): Number of bytes written so far.
+
+    Methods:
+        write(chunk): Appends a chunk.
+        commit(): Stores the blob under its digest and returns (sha256, size).
+        abort(): Discards everything written.
+    """
+
+    def __init__(self):
+        self.size = 0
+        self._digest = hashlib.sha256()
+
+    def write(self, chunk: bytes):
+        self._digest.update(chunk)
+        self.size += len(chunk)
+
+    @abstractmethod
+    def commit(self) -> Tuple[str, int]:
+        ...
+
+    @abstractmethod
+    def abort(self):
+        ...
+
+
+class FilesystemBlobWriter(BlobWriter):
+    """
+    Writes a blob into a temporary file of a FilesystemBlobStore and moves it to its
+    content address on commit.
+    """
+
+    def __init__(self, store: "FilesystemBlobStore"):
+        super().__init__()
+        self._store = store
+        fd, self._tmp_path = tempfile.mkstemp(dir=os.path.join(store.root, "tmp"))
+        self._file = os.fdopen(fd, "wb")
+
+    def write(self, chunk: bytes):
+        super().write(chunk)
+        self._file.write(chunk)
+
+    def commit(self) -> Tuple[str, int]:
+        sha256 = self._digest.hexdigest()
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._store._commit(self._tmp_path, sha256)
+        except BaseException:
+            self.abort()
+            raise
+        return sha256, self.size
+
+    def abort(self):
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+class FilesystemBlobStore(BlobStore):
+    """
+    Blob store on the local filesystem.
+
+    Attributes:
+        root (str): Directory holding the blobs; created if missing.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(os.path.join(root, "tmp"), exist_ok=True)
+
+    def path(self, sha256: str) -> str:
+        """
+        Returns the file path of a blob (two directory levels keep directories small).
+
+        Args:
+            sha256 (str): Hex digest of the blob.
+        Returns:
+            str: Path of the blob file under root.
+        """
+        return os.path.join(self.root, sha256[:2], sha256[2:4], sha256)
+
+    def _commit(self, tmp_path: str, sha256: str):
+        """
+        Moves a fully written temporary file to its content address, or drops it if the blob already exists.
+
+        Args:
+            tmp_path (str): Temporary file holding the blob.
+            sha256 (str): Hex digest of its content.
+        """
+        target = self.path(sha256)
+        if os.path.exists(target):
+            os.remove(tmp_path)
+            return
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(tmp_path, target)
+
+    def put(self, data: bytes) -> Tuple[str, int]:
+        sha256 = hashlib.sha256(data).hexdigest()
+        if self.exists(sha256):
+            return sha256, len(data)
+        writer = self.open_writer()
+        writer.write(data)
+        return writer.commit()
+
+    def open_writer(self) -> FilesystemBlobWriter:
+        return FilesystemBlobWriter(self)
+
+    def exists(self, sha256: str) -> bool:
+        return os.path.exists(self.path(sha256))
+
+    def open(self, sha256: str):
+        return open(self.path(sha256), "rb")
+
+    def delete(self, sha256: str):
+        try:
+            os.remove(self.path(sha256))
+        except FileNotFoundError:
+            pass
+
+    def local_path(self, sha256: str) -> Optional[str]:
+        return self.path(sha256)
+
+
+BACKENDS = {
+    "filesystem": lambda: FilesystemBlobStore(STORAGE_PATH),
+}
+
+_store: Optional[BlobStore] = None
+_store_lock = threading.Lock()
+
+
+def get_blob_store() -> BlobStore:
+    """
+    Returns the blob store selected by the [STORAGE] backend setting.
+
+    Returns:
+        BlobStore: The process-wide store instance.
+    Raises:
+        ValueError: If the configured backend is unknown.
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            if STORAGE_BACKEND not in BACKENDS:
+                raise ValueError(f"Unknown storage backend: {STORAGE_BACKEND}")
+            _store = BACKENDS[STORAGE_BACKEND]()
+        return _store
@@ -0,0 +1,83 @@
+"""
+Attachment Blob Migration
+-------------------------
+Moves attachment payloads from attachments.file_data into the blob store, in batches.
+
+Features:
+- Keyset iteration over attachment ids, one transaction per batch
+- Memory is bounded by the batch size (only one batch of payloads is loaded at a time)
+- Safe to stop and re-run: rows already moved have file_data = NULL and are skipped
+
+Usage (from the Backend folder, after `python -m migrations upgrade`):
+    python -m storage.migrate_blobs [--batch-size 50] [--dry-run]
+
+Afterwards run VACUUM FULL attachments (during a maintenance window) to give the space back to the OS.
+"""
+
+import argparse
+import sys
+from sqlalchemy.orm import undefer
+from database.database import SessionLocal
+from models.attachment_model import Attachment
+from storage.blob_store import get_blob_store
+
+
+def migrate_blobs(batch_size: int = 50, dry_run: bool = False) -> int:
+    """
+    Moves every legacy attachment payload to the blob store.
+
+    Args:
+        batch_size (int): Number of attachments loaded and committed per batch.
+        dry_run (bool): Only count the rows that would be moved.
+
+    Variables:
+        last_id: Highest attachment id processed so far.
+        batch: Attachments of the current batch.
+        moved: Number of attachments moved.
+    Returns:
+        int: Number of attachments moved (or that would be moved with dry_run).
+    """
+    store = get_blob_store()
+    db = SessionLocal()
+    moved = 0
+    last_id = 0
+    try:
+        if dry_run:
+            return db.query(Attachment).filter(Attachment.file_data.isnot(None)).count()
+        while True:
+            batch = (
+                db.query(Attachment)
+                .options(undefer(Attachment.file_data))
+                .filter(Attachment.file_data.isnot(None), Attachment.id > last_id)
+                .order_by(Attachment.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                break
+            for attachment in batch:
+                attachment.sha256, attachment.size_bytes = store.put(attachment.file_data)
+                attachment.file_data = None
+            last_id = batch[-1].id
+            db.commit()
+            db.expunge_all()
+            moved += len(batch)
+            print(f"Moved {moved} attachments (up to id {last_id})")
+    finally:
+        db.close()
+    return moved
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m storage.migrate_blobs", description="Move attachment payloads to the blob store.")
+    parser.add_argument("--batch-size", type=int, default=50, help="Attachments per batch/transaction")
+    parser.add_argument("--dry-run", action="store_true", help="Only count the attachments to move")
+    args = parser.parse_args(argv)
+
+    count = migrate_blobs(args.batch_size, args.dry_run)
+    print(f"{count} attachments {'to move' if args.dry_run else 'moved'}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""
+Test Configuration
+------------------
+Points the app at a temporary SQLite database before any module builds the engine, and
+provides a session on a freshly created schema.
+
+Fixtures:
+- db: Session on empty tables (created per test)
+"""
+
+import os
+import tempfile
+import pytest
+import configuration.config as config
+
+config.DATABASE_URL = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'tests.db')}"
+config.ASYNC_MODE = False
+
+
+@pytest.fixture
+def db():
+    from database.database import Base, engine, SessionLocal
+    # every model must be imported for create_all
+    from models import user_model, project_model, task_model, tool_model, comment_model, attachment_model, resource_version_model
+    from common import invalidation
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    # drop what earlier tests cached for the same ids
+    invalidation._apply_all()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
@@ -0,0 +1,205 @@
+"""
+Tests for common.cache.TTLCache
+-------------------------------
+Covers load coalescing, invalidation during a load (async and sync), cancellation of the
+loading caller, LRU eviction and expiry.
+
+Run from the Backend directory: python -m pytest -q
+"""
+
+import asyncio
+import pytest
+from common import cache as cache_module
+from common.cache import TTLCache
+
+
+def test_concurrent_misses_share_one_load():
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def load():
+            calls.append(1)
+            await release.wait()
+            return "value"
+
+        callers = [asyncio.create_task(cache.get_or_load("key", load)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*callers)
+
+    assert asyncio.run(scenario()) == ["value"] * 5
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats["loads"] == 1
+    assert stats["coalesced"] == 4
+    assert cache.get("key") == "value"
+
+
+def test_invalidation_during_load_does_not_store_stale_value():
+    cache = TTLCache(ttl=60)
+    loaded = []
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def stale_load():
+            loaded.append("stale")
+            await release.wait()
+            return "stale"
+
+        async def fresh_load():
+            loaded.append("fresh")
+            return "fresh"
+
+        first = asyncio.create_task(cache.get_or_load("key", stale_load))
+        await asyncio.sleep(0)
+        cache.invalidate("key")
+        # a caller arriving after the invalidation must not join the stale load
+        second = await cache.get_or_load("key", fresh_load)
+        release.set()
+        return await first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == "stale"
+    assert second == "fresh"
+    assert loaded == ["stale", "fresh"]
+    assert cache.get("key") == "fresh"
+
+
+def test_invalidation_during_load_leaves_cache_empty():
+    cache = TTLCache(ttl=60)
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            return "stale"
+
+        caller = asyncio.create_task(cache.get_or_load("key", load))
+        await asyncio.sleep(0)
+        cache.clear()
+        release.set()
+        return await caller
+
+    assert asyncio.run(scenario()) == "stale"
+    assert cache.get("key") is None
+
+
+def test_cancelled_loader_hands_the_load_to_a_waiting_caller():
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def load():
+            calls.append(1)
+            await release.wait()
+            return "value"
+
+        loader = asyncio.create_task(cache.get_or_load("key", load))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_load("key", load))
+        await asyncio.sleep(0)
+        loader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await loader
+        return await waiter
+
+    assert asyncio.run(scenario()) == "value"
+    # the waiter did not inherit the cancellation; it ran its own load
+    assert len(calls) == 2
+    assert cache.get("key") == "value"
+
+
+def test_load_error_reaches_every_caller_and_is_not_cached():
+    cache = TTLCache(ttl=60)
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            raise RuntimeError("database down")
+
+        callers = [asyncio.create_task(cache.get_or_load("key", load)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*callers, return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.stats()["load_errors"] == 1
+    assert cache.get("key") is None
+
+
+def test_lru_eviction_at_max_size():
+    cache = TTLCache(ttl=60, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10)
+    cache.set("key", "value")
+    now[0] += 9
+    assert cache.get("key") == "value"
+    now[0] += 2
+    assert cache.get("key") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_invalidate_group_removes_only_that_group():
+    cache = TTLCache(ttl=60)
+    cache.set(("project", 1), "a")
+    cache.set(("project", 2), "b")
+    cache.set(("user", 1), "c")
+    cache.invalidate_group("project")
+    assert cache.get(("project", 1)) is None
+    assert cache.get(("project", 2)) is None
+    assert cache.get(("user", 1)) == "c"
+
+
+def test_sync_load_is_cached_and_reused():
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    def load():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_load_sync("key", load) == "value"
+    assert cache.get_or_load_sync("key", load) == "value"
+    assert len(calls) == 1
+    assert cache.stats()["loads"] == 1
+
+
+def test_sync_load_does_not_store_a_value_read_before_an_invalidation():
+    cache = TTLCache(ttl=60)
+
+    def stale_load():
+        # a write commits and invalidates while the value is being read
+        cache.invalidate("key")
+        return "stale"
+
+    assert cache.get_or_load_sync("key", stale_load) == "stale"
+    assert cache.get("key") is None
+    assert cache.get_or_load_sync("key", lambda: "fresh") == "fresh"
+    assert cache.get("key") == "fresh"
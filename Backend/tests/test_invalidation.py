@@ -0,0 +1,129 @@
+"""
+Tests for common.invalidation
+-----------------------------
+Covers publishing through the memory backend into subscribed TTLCaches, events received
+from other workers, and the bounded, non-blocking send queue of the Postgres backend.
+
+Run from the Backend directory: python -m pytest -q
+"""
+
+import json
+import os
+from types import SimpleNamespace
+import pytest
+from sqlalchemy import create_engine
+from common import invalidation
+from common.cache import TTLCache
+
+
+@pytest.fixture
+def caches(monkeypatch):
+    """
+    Subscribes fresh caches to the memory backend, the way the services subscribe theirs.
+    """
+    monkeypatch.setattr(invalidation, "_handlers", {})
+    monkeypatch.setattr(invalidation, "CACHE_INVALIDATION", "memory")
+    project_lists = TTLCache(ttl=60)
+    task_lists = TTLCache(ttl=60)
+    summaries = TTLCache(ttl=60)
+
+    def evict_task_lists(project_id):
+        if project_id is None:
+            task_lists.clear()
+        else:
+            task_lists.invalidate_group(project_id)
+
+    def evict_summary(user_id):
+        if user_id is None:
+            summaries.clear()
+        else:
+            summaries.invalidate(user_id)
+
+    invalidation.subscribe(invalidation.PROJECT_LISTS, lambda key: project_lists.clear())
+    invalidation.subscribe(invalidation.TASK_LISTS, evict_task_lists)
+    invalidation.subscribe(invalidation.USER_SUMMARY, evict_summary)
+    engine = create_engine("sqlite://")
+    invalidation.start(engine)
+    yield project_lists, task_lists, summaries
+    invalidation.stop()
+    engine.dispose()
+
+
+def _fill(project_lists, task_lists, summaries):
+    project_lists.set(("v1", None, None), "projects")
+    task_lists.set((1, "v1", None, None), "tasks of 1")
+    task_lists.set((2, "v1", None, None), "tasks of 2")
+    summaries.set(7, "summary of 7")
+    summaries.set(8, "summary of 8")
+
+
+def test_memory_backend_has_no_bus(caches):
+    assert invalidation._bus is None
+
+
+def test_publish_evicts_only_the_changed_keys(caches):
+    project_lists, task_lists, summaries = caches
+    _fill(project_lists, task_lists, summaries)
+
+    invalidation.publish(invalidation.TASK_LISTS, 1)
+    invalidation.publish(invalidation.USER_SUMMARY, 7)
+
+    assert task_lists.get((1, "v1", None, None)) is None
+    assert task_lists.get((2, "v1", None, None)) == "tasks of 2"
+    assert summaries.get(7) is None
+    assert summaries.get(8) == "summary of 8"
+    assert project_lists.get(("v1", None, None)) == "projects"
+
+
+def test_publish_without_key_clears_the_entity(caches):
+    project_lists, task_lists, summaries = caches
+    _fill(project_lists, task_lists, summaries)
+
+    invalidation.publish(invalidation.TASK_LISTS)
+
+    assert task_lists.stats()["size"] == 0
+    assert summaries.stats()["size"] == 2
+    assert project_lists.stats()["size"] == 1
+
+
+def test_events_of_other_workers_are_applied_and_own_events_skipped(caches):
+    project_lists, task_lists, summaries = caches
+    _fill(project_lists, task_lists, summaries)
+
+    invalidation._receive(json.dumps({"o": invalidation.ORIGIN, "e": invalidation.USER_SUMMARY, "k": 8}))
+    assert summaries.get(8) == "summary of 8"
+
+    invalidation._receive(json.dumps({"o": "other-host:1:abc", "e": invalidation.USER_SUMMARY, "k": 8}))
+    assert summaries.get(8) is None
+    assert summaries.get(7) == "summary of 7"
+
+    invalidation._receive(json.dumps({"o": "other-host:1:abc", "e": invalidation.ALL, "k": None}))
+    assert project_lists.stats()["size"] == 0
+    assert task_lists.stats()["size"] == 0
+    assert summaries.stats()["size"] == 0
+
+
+def test_postgres_bus_send_is_bounded_and_never_blocks():
+    # the listener thread is not started, so nothing drains the queue or the wake-up pipe
+    bus = invalidation.PostgresBus(engine=None, channel="test")
+    try:
+        for key in range(invalidation.MAX_QUEUED_EVENTS * 100):
+            bus.send(json.dumps({"o": invalidation.ORIGIN, "e": invalidation.TASK_LISTS, "k": key}))
+        assert len(bus._outgoing) <= invalidation.MAX_QUEUED_EVENTS
+        # the dropped backlog is replaced by one event flushing every cache
+        assert json.loads(bus._outgoing[0])["e"] == invalidation.ALL
+        assert json.loads(bus._outgoing[-1])["k"] == invalidation.MAX_QUEUED_EVENTS * 100 - 1
+    finally:
+        os.close(bus._wakeup_read)
+        os.close(bus._wakeup_write)
+
+
+def test_postgres_with_unsupported_driver_falls_back_to_memory(monkeypatch, caplog):
+    monkeypatch.setattr(invalidation, "CACHE_INVALIDATION", "auto")
+    engine = SimpleNamespace(dialect=SimpleNamespace(name="postgresql", driver="pg8000"))
+    invalidation.start(engine)
+    try:
+        assert invalidation._bus is None
+        assert "pg8000" in caplog.text
+    finally:
+        invalidation.stop()
@@ -0,0 +1,64 @@
+"""
+Tests for services.task_service
+-------------------------------
+Covers the cache invalidation of the task write paths: the cached summaries of previous
+and new assignees after a bulk reassignment.
+
+Run from the Backend directory: python -m pytest -q
+"""
+
+from datetime import date
+from types import SimpleNamespace
+from models.user_model import User
+from models.project_model import Project
+from models.tool_model import Tool
+from models.task_model import Task
+from schemas.task_schemas import TaskBulkUpdate
+from services import task_service, summary_service
+
+
+def _seed(db, tasks: int):
+    users = [User(username=name, email=f"{name}@example.com", hashed_password="-", role="member") for name in ("ann", "bob")]
+    project = Project(title="p", description="d", start_date=date(2030, 1, 1), due_date=date(2030, 12, 31))
+    db.add_all([*users, project])
+    db.flush()
+    tool = Tool(name="base", project_id=project.id)
+    db.add(tool)
+    db.flush()
+    db.add_all([
+        Task(
+            title=f"t{index}", description="d", start_date=date(2030, 1, 2), due_date=date(2030, 2, 1),
+            assigned_to=users[0].id, project_id=project.id, tool_id=tool.id,
+        )
+        for index in range(tasks)
+    ])
+    db.commit()
+    return users
+
+
+def _assigned(db, user) -> int:
+    return summary_service.get_user_summary(db, SimpleNamespace(id=user.id))["assigned_tasks"]
+
+
+def test_bulk_reassign_invalidates_previous_and_new_assignee(db):
+    ann, bob = _seed(db, tasks=3)
+    # cache both summaries before the update
+    assert _assigned(db, ann) == 3
+    assert _assigned(db, bob) == 0
+
+    ids, error = task_service.update_tasks_bulk(db, TaskBulkUpdate(assigned_to=ann.id, patch={"assigned_to": bob.id}))
+
+    assert error is None
+    assert len(ids) == 3
+    assert _assigned(db, ann) == 0
+    assert _assigned(db, bob) == 3
+
+
+def test_bulk_reassign_to_unknown_user_is_rejected(db):
+    ann, _ = _seed(db, tasks=1)
+
+    ids, error = task_service.update_tasks_bulk(db, TaskBulkUpdate(assigned_to=ann.id, patch={"assigned_to": 999}))
+
+    assert ids is None
+    assert error == "User not found"
+    assert db.query(Task).filter(Task.assigned_to == ann.id).count() == 1
@@ -64,23 +64,12 @@ const Dashboard = () => {
       }
 
       // For normal users: only include projects with at least one task assigned to them
-      const userProjects = [];
-
-      for (const project of response.data) {
-        const taskRes = await axios.get(`${BASE_URL}/project/${project.id}/tasks`, {
-          headers: { Authorization: `Bearer ${token}` },
-        });
-
-        const userTasks = taskRes.data.filter(
-          (task) => task.assigned_to === user.user_id
-        );
-
-        if (userTasks.length > 0) {
-          userProjects.push(project);
-        }
-      }
+      const dashboardRes = await axios.get(`${BASE_URL}/project/dashboard`, {
+        params: { include: 'counts', assigned_to: user.user_id },
+        headers: { Authorization: `Bearer ${token}` },
+      });
 
-      setProjects(userProjects);
+      setProjects(dashboardRes.data.map((entry) => entry.project));
     } catch (error) {
       alert('Error fetching projects');
     }
@@ -7,7 +7,7 @@
  * - summary: Holds total projects, total tasks, in-progress tasks, and completed tasks
  *
  * Effects:
- * - Fetches all projects and their tasks on mount to compute summary statistics
+ * - Fetches all projects with their per-status task counts on mount to compute summary statistics
  *
  * Functions:
  * - fetchData: Loads project and task data, computes summary, and updates state
@@ -33,29 +33,27 @@ const ManagerDashboard = () => {
   // To fetch projects and tasks data 
   useEffect(() => {
     /**
-     * Fetches all projects and their tasks from the backend, computes summary statistics, and updates state.
+     * Fetches all projects with their task counts from the backend, computes summary statistics, and updates state.
      */
     const fetchData = async () => {
       try {
 
-        // Fetching all projects from data
-        const projectRes = await axios.get(`${BASE_URL}/project/get-projects`);
-        const projects = projectRes.data;
+        // Fetching all projects with their per-status task counts in one request
+        const dashboardRes = await axios.get(`${BASE_URL}/project/dashboard`, {
+          params: { include: 'counts' },
+        });
+        const projects = dashboardRes.data;
         let totalTasks = 0;
         let inProgressTasks = 0;
         let completedTasks = 0;
 
-        // Looping through all projects to fetch tasks 
-        for (const project of projects) {
-          const taskRes = await axios.get(`${BASE_URL}/project/${project.id}/tasks`);
-          const tasks = taskRes.data;
-          totalTasks += tasks.length;
-
-          for (const task of tasks) {
-            if (task.status === 'completed') {
-              completedTasks++;
+        for (const { task_counts: counts } of projects) {
+          for (const [status, count] of Object.entries(counts)) {
+            totalTasks += count;
+            if (status === 'completed') {
+              completedTasks += count;
             } else {
-              inProgressTasks++;
+              inProgressTasks += count;
             }
           }
         }